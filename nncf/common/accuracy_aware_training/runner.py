@@ -21,9 +21,14 @@ from typing import TypeVar
 from abc import ABC
 from abc import abstractmethod
 import pathlib
+
+import numpy as np
+from scipy.stats import t as student_t
+
 from nncf.api.compression import CompressionAlgorithmController
 from nncf.common.utils.backend import infer_backend_from_compression_controller
 from nncf.common.utils.backend import BackendType
+from nncf.common.utils.logger import logger as nncf_logger
 
 ModelType = TypeVar('ModelType')
 OptimizerType = TypeVar('OptimizerType')
@@ -120,7 +125,8 @@ class TrainingRunner(ABC):
                                      dump_checkpoint_fn: Callable[
                                          [ModelType, CompressionAlgorithmController, 'TrainingRunner', str], None],
                                      tensorboard_writer: TensorboardWriterType = None,
-                                     log_dir: Union[str, pathlib.Path] = None):
+                                     log_dir: Union[str, pathlib.Path] = None,
+                                     proxy_validate_fn: Callable[[ModelType, Optional[float]], List[float]] = None):
         """
         Register the user-supplied functions to be used to control the training process.
 
@@ -133,6 +139,11 @@ class TrainingRunner(ABC):
         :param dump_checkpoint_fn: a method to dump a checkpoint.
         :param tensorboard_writer: The tensorboard object to be used for logging.
         :param log_dir: The path to be used for logging and checkpoint saving.
+        :param proxy_validate_fn: a method to evaluate the model on a representative (e.g. stratified)
+        subset of the validation dataset, which returns the metric values computed on the disjoint
+        parts of the subset (e.g. samples or batches). The mean of these values is used instead of
+        the result of `validate_fn` when its confidence interval is enough to decide on the accuracy budget
+        sign and on whether the model is the best one.
         """
 
     @abstractmethod
@@ -240,6 +251,7 @@ class BaseAccuracyAwareTrainingRunner(TrainingRunner):
         self.maximal_absolute_accuracy_drop = accuracy_aware_params.get('maximal_absolute_accuracy_degradation')
         self.maximal_total_epochs = accuracy_aware_params.get('maximal_total_epochs', 10000)
         self.validate_every_n_epochs = accuracy_aware_params.get('validate_every_n_epochs', 1)
+        self.proxy_validation_confidence = accuracy_aware_params.get('proxy_validation_confidence', 0.95)
 
         self.verbose = verbose
         self.dump_checkpoints = dump_checkpoints
@@ -261,13 +273,48 @@ class BaseAccuracyAwareTrainingRunner(TrainingRunner):
                                      configure_optimizers_fn: Callable[[], Tuple[OptimizerType, LRSchedulerType]],
                                      dump_checkpoint_fn: Callable[
                                          [ModelType, CompressionAlgorithmController, TrainingRunner, str], None],
-                                     tensorboard_writer=None, log_dir=None):
+                                     tensorboard_writer=None, log_dir=None,
+                                     proxy_validate_fn: Callable[[ModelType, Optional[float]], List[float]] = None):
         self._train_epoch_fn = train_epoch_fn
         self._validate_fn = validate_fn
         self._configure_optimizers_fn = configure_optimizers_fn
         self._dump_checkpoint_fn = dump_checkpoint_fn
         self._tensorboard_writer = tensorboard_writer
         self._log_dir = log_dir
+        self._proxy_validate_fn = proxy_validate_fn
+
+    def _run_validation(self, model: ModelType) -> float:
+        """
+        Evaluates the model on the validation subset first, if the proxy validation function
+        is registered, and runs the full validation only if the subset is not enough to decide
+        on the accuracy budget sign and on whether the model is the best one.
+
+        :param model: The model to evaluate.
+        :return: The metric value.
+        """
+        if self._proxy_validate_fn is not None:
+            metric_value = self._estimate_metric_on_validation_subset(model)
+            if metric_value is not None:
+                return metric_value
+        return self._validate_fn(model, epoch=self.cumulative_epoch_count)
+
+    def _estimate_metric_on_validation_subset(self, model: ModelType) -> Optional[float]:
+        metric_values = np.asarray(self._proxy_validate_fn(model, epoch=self.cumulative_epoch_count),
+                                   dtype=np.float64).ravel()
+        minimal_tolerable_accuracy = getattr(self, 'minimal_tolerable_accuracy', None)
+        if metric_values.size < 2 or minimal_tolerable_accuracy is None:
+            return None
+        mean = metric_values.mean()
+        half_width = student_t.ppf(0.5 + self.proxy_validation_confidence / 2, metric_values.size - 1) * \
+            metric_values.std(ddof=1) / np.sqrt(metric_values.size)
+        for threshold in (minimal_tolerable_accuracy, self.best_val_metric_value):
+            if mean - half_width <= threshold <= mean + half_width:
+                nncf_logger.info('The metric value {:.4f} +- {:.4f} on the validation subset is ambiguous, '
+                                 'running the full validation'.format(mean, half_width))
+                return None
+        nncf_logger.info('Using the metric value {:.4f} +- {:.4f} estimated on the validation subset'.format(
+            mean, half_width))
+        return float(mean)
 
     def calculate_minimal_tolerable_accuracy(self, uncompressed_model_accuracy: float):
         if self.maximal_absolute_accuracy_drop is not None:
@@ -293,6 +340,8 @@ class BaseAdaptiveCompressionLevelTrainingRunner(BaseAccuracyAwareTrainingRunner
         self.minimal_compression_rate_step = accuracy_aware_params.get('minimal_compression_rate_step', 0.025)
         self.patience_epochs = accuracy_aware_params.get('patience_epochs')
         self.initial_training_phase_epochs = accuracy_aware_params.get('initial_training_phase_epochs')
+        self.parallel_compression_rate_candidates = accuracy_aware_params.get(
+            'parallel_compression_rate_candidates', 0)
 
         self.minimal_compression_rate = minimal_compression_rate
         self.maximal_compression_rate = maximal_compression_rate
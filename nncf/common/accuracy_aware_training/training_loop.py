@@ -10,10 +10,15 @@
  See the License for the specific language governing permissions and
  limitations under the License.
 """
+import multiprocessing
+import queue
+import traceback
 from abc import ABC
 from abc import abstractmethod
 from copy import copy
 from functools import partial
+from typing import Dict
+from typing import List
 from typing import TypeVar
 
 import numpy as np
@@ -21,6 +26,8 @@ from scipy.interpolate import interp1d
 
 from nncf.api.compression import CompressionAlgorithmController
 from nncf.common.composite_compression import CompositeCompressionAlgorithmController
+from nncf.common.utils.backend import BackendType
+from nncf.common.utils.backend import infer_backend_from_compression_controller
 from nncf.common.utils.logger import logger as nncf_logger
 from nncf.common.utils.registry import Registry
 from nncf.config.config import NNCFConfig
@@ -34,6 +41,36 @@ ModelType = TypeVar('ModelType')
 ADAPTIVE_COMPRESSION_CONTROLLERS = Registry('adaptive_compression_controllers')
 
 
+def _explore_compression_rate(model, accuracy_aware_controller, runner, compression_rate: float,
+                              num_threads: int, results_queue: multiprocessing.Queue):
+    """
+    Fine-tunes the model snapshot inherited from the parent process for `patience_epochs` epochs
+    with the given compression rate and puts the best validation metric value reached during the
+    fine-tuning (or the traceback of the failure) into the results queue.
+
+    :param compression_rate: The candidate compression rate.
+    :param num_threads: The number of threads to be used by the backend in this process.
+    :param results_queue: The queue to put the `(compression_rate, best_metric_value, error)` tuple into.
+    """
+    try:
+        if infer_backend_from_compression_controller(accuracy_aware_controller) is BackendType.TORCH:
+            import torch
+            torch.set_num_threads(num_threads)
+        # Only the parent process logs to tensorboard and dumps checkpoints
+        runner.verbose = False
+        runner.dump_checkpoints = False
+        runner.reset_training()
+        accuracy_aware_controller.disable_scheduler()
+        accuracy_aware_controller.scheduler.target_level = compression_rate
+        accuracy_aware_controller.compression_rate = compression_rate
+        for _ in range(runner.patience_epochs):
+            runner.train_epoch(model, accuracy_aware_controller)
+            runner.validate(model)
+        results_queue.put((compression_rate, float(runner.best_val_metric_value), None))
+    except Exception:  # pylint:disable=broad-except
+        results_queue.put((compression_rate, None, traceback.format_exc()))
+
+
 class TrainingLoop(ABC):
     """
     The training loop object is instantiated by the user, the training process
@@ -42,7 +79,7 @@ class TrainingLoop(ABC):
 
     @abstractmethod
     def run(self, model: ModelType, train_epoch_fn, validate_fn, configure_optimizers_fn=None,
-            dump_checkpoint_fn=None, tensorboard_writer=None, log_dir=None):
+            dump_checkpoint_fn=None, tensorboard_writer=None, log_dir=None, proxy_validate_fn=None):
         """
         Implements the custom logic to run a training loop for model fine-tuning
         by using the provided `train_epoch_fn`, `validate_fn` and `configure_optimizers_fn` methods.
@@ -57,6 +94,10 @@ class TrainingLoop(ABC):
         :param dump_checkpoint_fn: a method to dump a checkpoint
         :param configure_optimizers_fn: a method to instantiate an optimizer and a learning
         rate scheduler (to be called inside the `configure_optimizers` of the TrainingRunner)
+        :param proxy_validate_fn: an optional method to evaluate the model on a subset of the validation
+        dataset, which returns the metric values on the disjoint parts of the subset. The full validation
+        with `validate_fn` is only run if these values are not enough to make a decision
+        (to be called inside the `validate` of the TrainingRunner)
         :return: The fine-tuned model
         """
 
@@ -89,9 +130,10 @@ class EarlyExitCompressionTrainingLoop(TrainingLoop):
         self.compression_controller = compression_controller
 
     def run(self, model, train_epoch_fn, validate_fn, configure_optimizers_fn=None,
-            dump_checkpoint_fn=None, tensorboard_writer=None, log_dir=None):
+            dump_checkpoint_fn=None, tensorboard_writer=None, log_dir=None, proxy_validate_fn=None):
         self.runner.initialize_training_loop_fns(train_epoch_fn, validate_fn, configure_optimizers_fn,
-                                                 dump_checkpoint_fn, tensorboard_writer, log_dir)
+                                                 dump_checkpoint_fn, tensorboard_writer, log_dir,
+                                                 proxy_validate_fn)
         self.runner.retrieve_uncompressed_model_accuracy(model)
         uncompressed_model_accuracy = self.runner.uncompressed_model_accuracy
         self.runner.calculate_minimal_tolerable_accuracy(uncompressed_model_accuracy)
@@ -191,9 +233,10 @@ class AdaptiveCompressionTrainingLoop(TrainingLoop):
                            'accuracy-aware training was specified')
 
     def run(self, model, train_epoch_fn, validate_fn, configure_optimizers_fn=None,
-            dump_checkpoint_fn=None, tensorboard_writer=None, log_dir=None):
+            dump_checkpoint_fn=None, tensorboard_writer=None, log_dir=None, proxy_validate_fn=None):
         self.runner.initialize_training_loop_fns(train_epoch_fn, validate_fn, configure_optimizers_fn,
-                                                 dump_checkpoint_fn, tensorboard_writer, log_dir)
+                                                 dump_checkpoint_fn, tensorboard_writer, log_dir,
+                                                 proxy_validate_fn)
         self.runner.retrieve_uncompressed_model_accuracy(model)
         uncompressed_model_accuracy = self.runner.uncompressed_model_accuracy
         self.runner.calculate_minimal_tolerable_accuracy(uncompressed_model_accuracy)
@@ -203,6 +246,10 @@ class AdaptiveCompressionTrainingLoop(TrainingLoop):
                                            self.runner.cumulative_epoch_count)
         self.runner.update_training_history(compression_rate=self.adaptive_controller.compression_rate,
                                             best_metric_value=self.runner.best_val_metric_value)
+        explored_training_history = {}
+        if self.runner.parallel_compression_rate_candidates > 0:
+            explored_training_history = self._explore_compression_rates_in_parallel(model, self.adaptive_controller,
+                                                                                     self.runner)
 
         while self.runner.compression_rate_step >= self.runner.minimal_compression_rate_step and \
                 self.runner.cumulative_epoch_count < self.runner.maximal_total_epochs:
@@ -211,7 +258,8 @@ class AdaptiveCompressionTrainingLoop(TrainingLoop):
                 self.runner.update_training_history(compression_rate=copy(self.runner.compression_rate_target),
                                                     best_metric_value=copy(self.runner.best_val_metric_value))
 
-            was_compression_rate_changed = self._update_target_compression_rate(self.adaptive_controller, self.runner)
+            was_compression_rate_changed = self._update_target_compression_rate(self.adaptive_controller, self.runner,
+                                                                                explored_training_history)
             nncf_logger.info('Current target compression rate value: '
                              '{comp_rate:.3f}'.format(comp_rate=self.runner.compression_rate_target))
             nncf_logger.info('Current accuracy budget value: '
@@ -263,13 +311,96 @@ class AdaptiveCompressionTrainingLoop(TrainingLoop):
                                       runner.accuracy_bugdet, runner.cumulative_epoch_count)
         nncf_logger.info('Accuracy budget value after training is {}'.format(runner.accuracy_bugdet))
 
-    def _update_target_compression_rate(self, accuracy_aware_controller, runner):
+    @staticmethod
+    def _get_compression_rate_candidates(accuracy_aware_controller, runner) -> List[float]:
+        current_compression_rate = accuracy_aware_controller.compression_rate
+        best_accuracy_budget_sign = np.sign(runner.best_val_metric_value - runner.minimal_tolerable_accuracy)
+        if best_accuracy_budget_sign == 0:
+            best_accuracy_budget_sign = 1
+        candidates = []
+        for idx in range(1, int(runner.parallel_compression_rate_candidates) + 1):
+            compression_rate = current_compression_rate + best_accuracy_budget_sign * idx * runner.compression_rate_step
+            compression_rate = float(np.clip(compression_rate, runner.minimal_compression_rate,
+                                             runner.maximal_compression_rate))
+            if compression_rate != current_compression_rate and compression_rate not in candidates:
+                candidates.append(compression_rate)
+        return candidates
+
+    def _explore_compression_rates_in_parallel(self, model, accuracy_aware_controller, runner) -> Dict[float, float]:
+        """
+        Fine-tunes the model for `patience_epochs` epochs with several candidate compression rates
+        concurrently, each one in a separate worker process that starts from the state of the model
+        reached after the initial training phase. The first target compression rate is then interpolated
+        from the best accuracy budgets of the candidates instead of being found step by step.
+
+        The workers are forked and inherit the device of the model, so the exploration is intended
+        for models trained on CPU. The CPU cores are split evenly between the workers. The models
+        fine-tuned by the workers are discarded, hence the explored compression rates are not added
+        to the training history of the runner.
+
+        :return: The best accuracy budget for each explored compression rate.
+        """
+        candidates = self._get_compression_rate_candidates(accuracy_aware_controller, runner)
+        if not candidates:
+            return {}
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            raise RuntimeError('Parallel exploration of the compression rates requires the "fork" '
+                               'multiprocessing start method, which is not available on this platform')
+        nncf_logger.info('Exploring compression rates {} in parallel'.format(
+            ', '.join('{:.3f}'.format(rate) for rate in candidates)))
+
+        context = multiprocessing.get_context('fork')
+        results_queue = context.Queue()
+        # The workers are not daemonic, so that the training loops may spawn the data loading workers
+        num_threads = max(1, multiprocessing.cpu_count() // len(candidates))
+        workers = [context.Process(target=_explore_compression_rate,
+                                   args=(model, accuracy_aware_controller, runner, compression_rate,
+                                         num_threads, results_queue),
+                                   daemon=False)
+                   for compression_rate in candidates]
+        best_metric_values = {}
+        try:
+            for worker in workers:
+                worker.start()
+            while len(best_metric_values) < len(candidates):
+                try:
+                    compression_rate, best_metric_value, error = results_queue.get(timeout=1)
+                except queue.Empty:
+                    if any(worker.exitcode not in (None, 0) for worker in workers):
+                        raise RuntimeError('A worker exploring the compression rates terminated unexpectedly')
+                    continue
+                if error is not None:
+                    raise RuntimeError('Failed to explore the compression rate {:.3f}:\n{}'.format(
+                        compression_rate, error))
+                best_metric_values[compression_rate] = best_metric_value
+        finally:
+            for worker in workers:
+                if worker.is_alive() and len(best_metric_values) < len(candidates):
+                    worker.terminate()
+                worker.join()
+
+        explored_training_history = {}
+        for compression_rate in candidates:
+            best_metric_value = best_metric_values[compression_rate]
+            nncf_logger.info('Best metric value for the compression rate {:.3f}: {:.4f}'.format(
+                compression_rate, best_metric_value))
+            explored_training_history[compression_rate] = best_metric_value - runner.minimal_tolerable_accuracy
+        return explored_training_history
+
+    def _update_target_compression_rate(self, accuracy_aware_controller, runner, explored_training_history=None):
         current_compression_rate = accuracy_aware_controller.compression_rate
         best_accuracy_budget = runner.best_val_metric_value - runner.minimal_tolerable_accuracy
         if runner.compression_rate_target is None:
-            runner.compression_rate_target = current_compression_rate + \
-                                             self._determine_compression_rate_step_value(runner,
-                                                                                         current_compression_rate)
+            if explored_training_history:
+                compression_rate_step_value = self._determine_compression_rate_step_value(
+                    runner, current_compression_rate, 'interpolate',
+                    explored_training_history=explored_training_history)
+                runner.compression_rate_step = max(runner.compression_rate_step,
+                                                   runner.minimal_compression_rate_step)
+            else:
+                compression_rate_step_value = self._determine_compression_rate_step_value(runner,
+                                                                                          current_compression_rate)
+            runner.compression_rate_target = current_compression_rate + compression_rate_step_value
             runner.was_compression_increased_on_prev_step = np.sign(best_accuracy_budget)
             accuracy_aware_controller.disable_scheduler()
             # TODO(kshpv) fix this incorrect work of disable_scheduler()
@@ -305,11 +436,14 @@ class AdaptiveCompressionTrainingLoop(TrainingLoop):
                                              num_curve_pts=1000,
                                              full_compression_factor=20,
                                              minimal_compression_rate=0.0,
-                                             maximal_compression_rate=1.0):
-        training_history = runner.compressed_training_history
+                                             maximal_compression_rate=1.0,
+                                             explored_training_history=None):
+        training_history = dict(explored_training_history or {})
+        training_history.update(runner.compressed_training_history)
         nncf_logger.info('Compressed training history: {}'.format(training_history))
-        training_history[minimal_compression_rate] = runner.maximal_accuracy_drop
-        training_history[maximal_compression_rate] = -full_compression_factor * runner.maximal_accuracy_drop
+        maximal_accuracy_drop = runner.uncompressed_model_accuracy - runner.minimal_tolerable_accuracy
+        training_history[minimal_compression_rate] = maximal_accuracy_drop
+        training_history[maximal_compression_rate] = -full_compression_factor * maximal_accuracy_drop
         compression_rates, evaluated_acc_budgets = list(training_history.keys()), list(training_history.values())
         interp_kind = 'linear' if len(compression_rates) < 4 else 'cubic'
         acc_budget_vs_comp_rate_curve = interp1d(compression_rates, evaluated_acc_budgets,
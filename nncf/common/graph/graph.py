@@ -13,7 +13,7 @@
 import os
 from collections import defaultdict
 from copy import deepcopy
-from typing import Any, Callable, Dict, KeysView, List, Tuple, Type, ValuesView
+from typing import Any, Callable, Dict, KeysView, List, Set, Tuple, Type, ValuesView
 from typing import Generator
 
 import networkx as nx
@@ -178,6 +178,25 @@ class NNCFGraph:
         self._node_ids_vs_layer_names = {}  # type: Dict[int, LayerName]
         self._layer_name_vs_shared_nodes = defaultdict(list)  # type: Dict[LayerName, List[NNCFNode]]
 
+        # The NNCFNode objects wrap the node attribute dicts of the underlying nx graph, so these may be
+        # created once per node. The name index is updated as nodes are added, the adjacency caches are filled
+        # on demand and are reset on graph modification.
+        self._node_key_vs_nncf_node = {}  # type: Dict[str, NNCFNode]
+        self._node_name_vs_nncf_nodes = defaultdict(list)  # type: Dict[NNCFNodeName, List[NNCFNode]]
+        self._next_node_id = 0
+        self._next_nodes_cache = {}  # type: Dict[str, List[NNCFNode]]
+        self._previous_nodes_cache = {}  # type: Dict[str, List[NNCFNode]]
+        self._input_edges_cache = {}  # type: Dict[str, List[NNCFGraphEdge]]
+        self._output_edges_cache = {}  # type: Dict[str, List[NNCFGraphEdge]]
+        self._first_nodes_by_types_cache = {}  # type: Dict[Tuple, List[NNCFNode]]
+
+    def _reset_adjacency_caches(self):
+        self._next_nodes_cache = {}
+        self._previous_nodes_cache = {}
+        self._input_edges_cache = {}
+        self._output_edges_cache = {}
+        self._first_nodes_by_types_cache = {}
+
     def get_node_by_id(self, node_id: int) -> NNCFNode:
         """
         :param node_id: Id of the node.
@@ -190,7 +209,11 @@ class NNCFGraph:
         :param key: key (node_name) of the node.
         :return: NNCFNode in a graph with such key.
         """
-        return self._nx_node_to_nncf_node(self._nx_graph.nodes[key])
+        nncf_node = self._node_key_vs_nncf_node.get(key)
+        if nncf_node is None:
+            nncf_node = self._nx_node_to_nncf_node(self._nx_graph.nodes[key])
+            self._node_key_vs_nncf_node[key] = nncf_node
+        return nncf_node
 
     def get_input_nodes(self) -> List[NNCFNode]:
         """
@@ -245,12 +268,7 @@ class NNCFGraph:
         """
         Returns list of all graph nodes.
         """
-        all_nodes = []
-        for node_key in self.get_all_node_keys():
-            nx_node = self._nx_graph.nodes[node_key]
-            nncf_node = self._nx_node_to_nncf_node(nx_node)
-            all_nodes.append(nncf_node)
-        return all_nodes
+        return [self.get_node_by_key(node_key) for node_key in self._node_id_to_key_dict.values()]
 
     @staticmethod
     def _nx_node_to_nncf_node(nx_node: dict) -> NNCFNode:
@@ -274,8 +292,12 @@ class NNCFGraph:
         :param node: Producer node.
         :return: List of consumer nodes of provided node.
         """
-        nx_node_keys = self._nx_graph.succ[self._node_id_to_key_dict[node.node_id]]
-        return [self._nx_node_to_nncf_node(self._nx_graph.nodes[key]) for key in nx_node_keys]
+        node_key = self._node_id_to_key_dict[node.node_id]
+        next_nodes = self._next_nodes_cache.get(node_key)
+        if next_nodes is None:
+            next_nodes = [self.get_node_by_key(key) for key in self._nx_graph.succ[node_key]]
+            self._next_nodes_cache[node_key] = next_nodes
+        return list(next_nodes)
 
     def get_previous_nodes(self, node: NNCFNode) -> List[NNCFNode]:
         """
@@ -284,9 +306,12 @@ class NNCFGraph:
         :param node: Consumer node.
         :return: List of producers nodes of provided node.
         """
-
-        nx_node_keys = self._nx_graph.pred[self._node_id_to_key_dict[node.node_id]]
-        return [self._nx_node_to_nncf_node(self._nx_graph.nodes[key]) for key in nx_node_keys]
+        node_key = self._node_id_to_key_dict[node.node_id]
+        previous_nodes = self._previous_nodes_cache.get(node_key)
+        if previous_nodes is None:
+            previous_nodes = [self.get_node_by_key(key) for key in self._nx_graph.pred[node_key]]
+            self._previous_nodes_cache[node_key] = previous_nodes
+        return list(previous_nodes)
 
     def get_input_edges(self, node: NNCFNode) -> List[NNCFGraphEdge]:
         """
@@ -295,9 +320,14 @@ class NNCFGraph:
         :param node: Consumer node.
         :return: List of input edges for the node sorted by input port ID.
         """
-        input_nodes = self.get_previous_nodes(node)
-        edges = [self.get_edge(from_node, node) for from_node in input_nodes]
-        return sorted(edges, key=lambda x: x.input_port_id)
+        node_key = self._node_id_to_key_dict[node.node_id]
+        input_edges = self._input_edges_cache.get(node_key)
+        if input_edges is None:
+            to_node = self.get_node_by_key(node_key)
+            edges = [self.get_edge(from_node, to_node) for from_node in self.get_previous_nodes(to_node)]
+            input_edges = sorted(edges, key=lambda x: x.input_port_id)
+            self._input_edges_cache[node_key] = input_edges
+        return list(input_edges)
 
     def get_output_edges(self, node: NNCFNode) -> List[NNCFGraphEdge]:
         """
@@ -306,10 +336,14 @@ class NNCFGraph:
         :param node: Producer node.
         :return:  List of output edges for the node sorted by output port ID.
         """
-
-        output_nodes = self.get_next_nodes(node)
-        edges = [self.get_edge(node, to_node) for to_node in output_nodes]
-        return sorted(edges, key=lambda x: x.output_port_id)
+        node_key = self._node_id_to_key_dict[node.node_id]
+        output_edges = self._output_edges_cache.get(node_key)
+        if output_edges is None:
+            from_node = self.get_node_by_key(node_key)
+            edges = [self.get_edge(from_node, to_node) for to_node in self.get_next_nodes(from_node)]
+            output_edges = sorted(edges, key=lambda x: x.output_port_id)
+            self._output_edges_cache[node_key] = output_edges
+        return list(output_edges)
 
     def traverse_graph(self,
                        curr_node: NNCFNode,
@@ -323,19 +357,74 @@ class NNCFGraph:
         :param traverse_forward: Flag specifying direction of traversal.
         :return:
         """
-        output = []
-        return self._traverse_graph_recursive_helper(curr_node, traverse_function, output, traverse_forward)
-
-    def _traverse_graph_recursive_helper(self, curr_node: NNCFNode,
-                                         traverse_function: Callable[[NNCFNode, List[Any]], Tuple[bool, List[Any]]],
-                                         output: List[Any], traverse_forward: bool):
-        is_finished, output = traverse_function(curr_node, output)
         get_nodes_fn = self.get_next_nodes if traverse_forward else self.get_previous_nodes
-        if not is_finished:
-            for node in get_nodes_fn(curr_node):
-                self._traverse_graph_recursive_helper(node, traverse_function, output, traverse_forward)
+        is_finished, output = traverse_function(curr_node, [])
+        if is_finished:
+            return output
+        # Iterative DFS, the nodes are visited in the same order as by a recursive pre-order traversal.
+        # Each node to visit is stored along with the output of the node it has been reached from.
+        nodes_to_visit = [(node, output) for node in reversed(get_nodes_fn(curr_node))]
+        while nodes_to_visit:
+            node, node_output = nodes_to_visit.pop()
+            is_finished, node_output = traverse_function(node, node_output)
+            if not is_finished:
+                nodes_to_visit.extend((next_node, node_output) for next_node in reversed(get_nodes_fn(node)))
         return output
 
+    def find_first_nodes(self, start_nodes: List[NNCFNode],
+                         condition_fn: Callable[[NNCFNode], bool],
+                         traverse_forward: bool = True) -> List[NNCFNode]:
+        """
+        Looks for the first nodes that satisfy the condition when traversing the graph up or down starting from
+        `start_nodes`, i.e. the nodes that satisfy the condition and are reachable from `start_nodes` such that
+        on the path to them there are no other nodes satisfying the condition. The start nodes are checked too.
+        Each node is visited at most once.
+
+        :param start_nodes: Nodes from which traversal is started.
+        :param condition_fn: Condition defining the nodes to look for.
+        :param traverse_forward: Flag specifying direction of traversal.
+        :return: List of found nodes in the DFS order.
+        """
+        get_nodes_fn = self.get_next_nodes if traverse_forward else self.get_previous_nodes
+        visited = set()  # type: Set[int]
+        found_nodes = []
+        nodes_to_visit = list(reversed(start_nodes))
+        while nodes_to_visit:
+            node = nodes_to_visit.pop()
+            if node.node_id in visited:
+                continue
+            visited.add(node.node_id)
+            if condition_fn(node):
+                found_nodes.append(node)
+            else:
+                nodes_to_visit.extend(reversed(get_nodes_fn(node)))
+        return found_nodes
+
+    def find_first_nodes_by_types(self, start_nodes: List[NNCFNode],
+                                  types: List[str],
+                                  traverse_forward: bool = True,
+                                  match_types: bool = True) -> List[NNCFNode]:
+        """
+        Looks for the first nodes with type in `types` (or not in `types`, if `match_types` is False)
+        when traversing the graph up or down starting from `start_nodes`. See `find_first_nodes` for details.
+        The results are memoized until the graph is modified.
+
+        :param start_nodes: Nodes from which traversal is started.
+        :param types: List of types.
+        :param traverse_forward: Flag specifying direction of traversal.
+        :param match_types: Whether to look for nodes with type in `types` or with type not in `types`.
+        :return: List of found nodes in the DFS order.
+        """
+        key = (tuple(node.node_id for node in start_nodes), frozenset(types), traverse_forward, match_types)
+        found_nodes = self._first_nodes_by_types_cache.get(key)
+        if found_nodes is None:
+            types = set(types)
+            found_nodes = self.find_first_nodes(start_nodes,
+                                                lambda node: (node.node_type in types) == match_types,
+                                                traverse_forward)
+            self._first_nodes_by_types_cache[key] = found_nodes
+        return list(found_nodes)
+
     def add_nncf_node(self, node_name: str,
                       node_type: str,
                       node_metatype: Type[OperatorMetatype],
@@ -375,11 +464,7 @@ class NNCFGraph:
         if node_id_override is not None:
             node_id = node_id_override
         else:
-            node_ids = self.get_all_node_ids()
-            if node_ids:
-                node_id = max(self.get_all_node_ids()) + 1
-            else:
-                node_id = 0
+            node_id = self._next_node_id
 
         if node_id in self._node_id_to_key_dict:
             raise ValueError(f'NNCF node with id {node_id} is already in the NNCFGraph')
@@ -387,6 +472,7 @@ class NNCFGraph:
         node_key = f'{node_id} {node_name}'
 
         self._node_id_to_key_dict[node_id] = node_key
+        self._next_node_id = max(self._next_node_id, node_id + 1)
         attrs = {
             NNCFGraph.ID_NODE_ATTR: node_id,
             NNCFGraph.NODE_NAME_ATTR: node_name,
@@ -405,6 +491,8 @@ class NNCFGraph:
             ignored_algorithms = []
         attrs[NNCFGraph.IGNORED_ALGOS_ATTR] = ignored_algorithms
         self._nx_graph.add_node(node_key, **attrs)
+        self._node_name_vs_nncf_nodes[node_name].append(self.get_node_by_key(node_key))
+        self._reset_adjacency_caches()
 
         node = NNCFNode(node_id, node_name, data=attrs)
 
@@ -461,12 +549,13 @@ class NNCFGraph:
             NNCFGraph.DTYPE_EDGE_ATTR: dtype
         }
         self._nx_graph.add_edge(from_node_key, to_node_key, **attrs)
+        self._reset_adjacency_caches()
 
     def topological_sort(self) -> List[NNCFNode]:
         """
         Returns nodes in topologically sorted order, additionally sorted in ascending node ID order.
         """
-        return [self._nx_node_to_nncf_node(self._nx_graph.nodes[node_name])
+        return [self.get_node_by_key(node_name)
                 for node_name in
                 nx.lexicographical_topological_sort(self._nx_graph,
                                                     key=lambda x: self._nx_graph.nodes[x][NNCFGraph.ID_NODE_ATTR])]
@@ -553,7 +642,7 @@ class NNCFGraph:
         return out_graph
 
     def get_node_by_name(self, name: NNCFNodeName) -> NNCFNode:
-        matches = [node for node in self.get_all_nodes() if node.node_name == name]
+        matches = self._node_name_vs_nncf_nodes.get(name, [])
         if not matches:
             raise RuntimeError('Could not find a node {} in NNCFGraph!'.format(name))
         if len(matches) > 1:
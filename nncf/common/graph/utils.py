@@ -11,11 +11,9 @@
  limitations under the License.
 """
 
-from functools import partial
 from typing import List
 
 from nncf.common.graph import NNCFGraph, NNCFNode
-from nncf.common.pruning.utils import traverse_function
 
 from nncf.common.utils.logger import logger
 
@@ -59,12 +57,4 @@ def get_first_nodes_of_type(graph: NNCFGraph, op_types: List[str]) -> List[NNCFN
     """
     graph_roots = graph.get_input_nodes()  # NNCFNodes here
 
-    visited = {node_id: False for node_id in graph.get_all_node_ids()}
-    partial_traverse_function = partial(traverse_function,
-                                        type_check_fn=lambda x: x in op_types,
-                                        visited=visited)
-
-    first_nodes_of_type = []
-    for root in graph_roots:
-        first_nodes_of_type.extend(graph.traverse_graph(root, partial_traverse_function))
-    return first_nodes_of_type
+    return graph.find_first_nodes_by_types(graph_roots, op_types)
@@ -205,3 +205,52 @@ class PrunedModelTheoreticalBorderline(Statistics):
             f'Theoretical borderline of the filter pruning algorithm\nfor current model:\n{algorithm_string}'
         )
         return pretty_string
+
+
+class PrunedModelExportStatistics(Statistics):
+    """
+    Contains statistics of the model which pruned filters were physically removed on export.
+    """
+
+    def __init__(self,
+                 full_flops: int,
+                 shrunk_flops: int,
+                 full_params: int,
+                 shrunk_params: int,
+                 full_latency: float,
+                 shrunk_latency: float):
+        """
+        Initializes statistics of the physically shrunk model.
+
+        :param full_flops: The total amount of FLOPS in the model before shrinking.
+        :param shrunk_flops: The total amount of FLOPS in the shrunk model.
+        :param full_params: The total amount of weights in the model before shrinking.
+        :param shrunk_params: The total amount of weights in the shrunk model.
+        :param full_latency: Latency of the forward pass on the dummy input before shrinking, in milliseconds.
+        :param shrunk_latency: Latency of the forward pass on the dummy input for the shrunk model,
+            in milliseconds.
+        """
+        self._giga = 1e9
+        self._mega = 1e6
+        self.full_flops = full_flops
+        self.shrunk_flops = shrunk_flops
+        self.full_params = full_params
+        self.shrunk_params = shrunk_params
+        self.full_latency = full_latency
+        self.shrunk_latency = shrunk_latency
+
+    def to_str(self) -> str:
+        model_string = create_table(
+            header=['Statistic\'s name', 'Value'],
+            rows=[
+                ['GFLOPS shrunk model / full model', f'{self.shrunk_flops / self._giga:.3f} /'
+                                                     f' {self.full_flops / self._giga:.3f}'],
+                ['MParams shrunk model / full model', f'{self.shrunk_params / self._mega:.3f} /'
+                                                      f' {self.full_params / self._mega:.3f}'],
+                ['Latency, ms shrunk model / full model', f'{self.shrunk_latency:.3f} /'
+                                                          f' {self.full_latency:.3f}'],
+            ]
+        )
+
+        pretty_string = f'Statistics of the model shrunk on export:\n{model_string}'
+        return pretty_string
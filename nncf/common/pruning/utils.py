@@ -11,7 +11,6 @@
  limitations under the License.
 """
 
-from functools import partial
 from typing import Dict, List, Optional, Tuple, Type, Union, Callable
 from enum import Enum
 
@@ -47,17 +46,10 @@ def get_sources_of_node(nncf_node: NNCFNode, graph: NNCFGraph, sources_types: Li
     :param graph: NNCF graph to work with.
     :return: List of all sources nodes.
     """
-    visited = {node_id: False for node_id in graph.get_all_node_ids()}
-    partial_traverse_function = partial(traverse_function, type_check_fn=lambda x: x in sources_types,
-                                        visited=visited)
     nncf_nodes = [nncf_node]
     if nncf_node.node_type in sources_types:
         nncf_nodes = graph.get_previous_nodes(nncf_node)
-
-    source_nodes = []
-    for node in nncf_nodes:
-        source_nodes.extend(graph.traverse_graph(node, partial_traverse_function, False))
-    return source_nodes
+    return graph.find_first_nodes_by_types(nncf_nodes, sources_types, traverse_forward=False)
 
 
 def find_next_nodes_not_of_types(graph: NNCFGraph, nncf_node: NNCFNode, types: List[str]) -> List[NNCFNode]:
@@ -73,17 +65,10 @@ def find_next_nodes_not_of_types(graph: NNCFGraph, nncf_node: NNCFNode, types: L
     :param types: List of types.
     :return: List of next nodes for nncf_node of type not from types list.
     """
-    visited = {node_id: False for node_id in graph.get_all_node_ids()}
-    partial_traverse_function = partial(traverse_function, type_check_fn=lambda x: x not in types,
-                                        visited=visited)
     nncf_nodes = [nncf_node]
     if nncf_node.node_type not in types:
         nncf_nodes = graph.get_next_nodes(nncf_node)
-
-    next_nodes = []
-    for node in nncf_nodes:
-        next_nodes.extend(graph.traverse_graph(node, partial_traverse_function))
-    return next_nodes
+    return graph.find_first_nodes_by_types(nncf_nodes, types, match_types=False)
 
 
 def get_next_nodes_of_types(graph: NNCFGraph, nncf_node: NNCFNode, types: List[str]) -> List[NNCFNode]:
@@ -96,18 +81,10 @@ def get_next_nodes_of_types(graph: NNCFGraph, nncf_node: NNCFNode, types: List[s
     :param types: List of types to find.
     :return: List of next nodes of nncf_node with type from types list.
     """
-    sources_types = types
-    visited = {node_id: False for node_id in graph.get_all_node_ids()}
-    partial_traverse_function = partial(traverse_function, type_check_fn=lambda x: x in sources_types,
-                                        visited=visited)
     nncf_nodes = [nncf_node]
-    if nncf_node.node_type in sources_types:
+    if nncf_node.node_type in types:
         nncf_nodes = graph.get_next_nodes(nncf_node)
-
-    next_nodes = []
-    for node in nncf_nodes:
-        next_nodes.extend(graph.traverse_graph(node, partial_traverse_function))
-    return next_nodes
+    return graph.find_first_nodes_by_types(nncf_nodes, types)
 
 
 def get_rounded_pruned_element_number(total: int, sparsity_rate: float, multiple_of: int = 8) -> int:
@@ -125,19 +102,6 @@ def get_rounded_pruned_element_number(total: int, sparsity_rate: float, multiple
     return max(total - remaining_elems, 0)
 
 
-def traverse_function(node: NNCFNode, output: List[NNCFNode], type_check_fn, visited) \
-        -> Tuple[bool, List[NNCFNode]]:
-    if visited[node.node_id]:
-        return True, output
-    visited[node.node_id] = True
-
-    if not type_check_fn(node.node_type):
-        return False, output
-
-    output.append(node)
-    return True, output
-
-
 def get_last_nodes_of_type(graph: NNCFGraph, op_types: List[str]) -> List[NNCFNode]:
     """
     Looking for last node in graph with type in `op_types`.
@@ -150,15 +114,7 @@ def get_last_nodes_of_type(graph: NNCFGraph, op_types: List[str]) -> List[NNCFNo
     """
     graph_outputs = graph.get_output_nodes()  # NNCFNodes here
 
-    visited = {node_id: False for node_id in graph.get_all_node_ids()}
-    partial_traverse_function = partial(traverse_function,
-                                        type_check_fn=lambda x: x in op_types,
-                                        visited=visited)
-    last_nodes_of_type = []
-    for output in graph_outputs:
-        last_nodes_of_type.extend(graph.traverse_graph(output, partial_traverse_function, False))
-
-    return last_nodes_of_type
+    return graph.find_first_nodes_by_types(graph_outputs, op_types, traverse_forward=False)
 
 
 def get_previous_convs(graph: NNCFGraph, nncf_node: NNCFNode,
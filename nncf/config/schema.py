@@ -54,6 +54,10 @@ _NUMBER = {
     "type": "number"
 }
 
+_INTEGER = {
+    "type": "integer"
+}
+
 _STRING = {
     "type": "string"
 }
@@ -207,6 +211,11 @@ BASIC_RANGE_INIT_CONFIG_PROPERTIES = {
                                                   description="For 'percentile' type - specify the percentile of "
                                                               "input value histograms to be set as the initial "
                                                               "value for maximum quantizer input"),
+                "num_bins": with_attributes(_INTEGER,
+                                             description="For 'histogram_percentile' and 'histogram_threesigma' "
+                                                         "types - specify the number of bins in the per-channel "
+                                                         "histograms of input values, which bounds the memory "
+                                                         "consumed by the statistics collection. 2048 by default"),
             }
         }
     },
@@ -295,6 +304,13 @@ QUANTIZATION_INITIALIZER_SCHEMA = {
                                                              "algorithm. It's calculated  between mean average trace "
                                                              "from previous iteration and current one. 1e-5 by default"
                                                              "bitwidth_per_scope"),
+                    "num_probes": with_attributes(_INTEGER,
+                                                   description="Number of random probe vectors evaluated per "
+                                                               "iteration of Hutchinson algorithm. The vector-Hessian "
+                                                               "products for all probes reuse the single gradients "
+                                                               "graph of each data batch, so the larger number "
+                                                               "reduces the amount of forward and backward passes "
+                                                               "per probe. 1 by default"),
                     "compression_ratio": with_attributes(_NUMBER,
                                                          description="The desired ratio between bits complexity of "
                                                                      "fully INT8 model and mixed-precision lower-bit "
@@ -321,6 +337,17 @@ QUANTIZATION_INITIALIZER_SCHEMA = {
                                                                       "meant for internal testing use. Users need not "
                                                                       "to configure.",
                                                           default=20),
+                    "surrogate_warmup_eval_number": with_attributes(_INTEGER,
+                                                                    description="The number of distinct policies to "
+                                                                                "be evaluated before a ridge "
+                                                                                "regression of the score over the "
+                                                                                "bitwidths starts to screen the "
+                                                                                "policies of AutoQ precision "
+                                                                                "initialization. The policies that "
+                                                                                "are predicted to score below the "
+                                                                                "best evaluated one are not "
+                                                                                "evaluated. 0 disables screening.",
+                                                                    default=0),
                     "bitwidth_per_scope": {
                         "type": "array",
                         "items": {
@@ -342,6 +369,13 @@ QUANTIZATION_INITIALIZER_SCHEMA = {
                                                                          " It can be used to accelerate mixed precision"
                                                                          "initialization by using average Hessian "
                                                                          "traces from previous run of HAWQ algorithm."),
+                    "cache_dir": with_attributes(_STRING,
+                                                 description="Directory to cache the average Hessian traces and the "
+                                                             "quantization noise of the weight quantizers between "
+                                                             "runs of HAWQ algorithm. The cache entries are keyed by "
+                                                             "the model graph, its weights, the initializing data "
+                                                             "and the settings and ranges of the weight "
+                                                             "quantizers."),
                     "dump_init_precision_data": with_attributes(_BOOLEAN,
                                                                 description="Whether to dump data related to Precision "
                                                                             "Initialization algorithm. "
@@ -409,6 +443,25 @@ ADAPTIVE_COMPRESSION_LEVEL_TRAINING_SCHEMA = {
                 "validate_every_n_epochs": with_attributes(_NUMBER,
                                                            description="Specifies across which number of epochs Runner"
                                                                        " should validate the compressed mode."),
+                "proxy_validation_confidence": with_attributes(_NUMBER,
+                                                               description="Confidence level of the interval "
+                                                                           "estimated for the metric value on the "
+                                                                           "validation subset when the proxy "
+                                                                           "validation function is passed to the "
+                                                                           "training loop. The full validation is "
+                                                                           "only run if the interval is not "
+                                                                           "enough to decide on the accuracy "
+                                                                           "budget sign and the best checkpoint.",
+                                                               default=0.95),
+                "parallel_compression_rate_candidates": with_attributes(_INTEGER,
+                                                                        description="Number of candidate "
+                                                                                    "compression rates to fine-tune "
+                                                                                    "concurrently in worker "
+                                                                                    "processes after the initial "
+                                                                                    "training phase. The results "
+                                                                                    "are used to predict the first "
+                                                                                    "target compression rate. "
+                                                                                    "Set to 0 to disable."),
             },
             "oneOf": [{"type": "object", "required": ["maximal_relative_accuracy_degradation"]},
                       {"type": "object", "required": ["maximal_absolute_accuracy_degradation"]}],
@@ -447,6 +500,16 @@ EARLY_EXIT_TRAINING_SCHEMA = {
                 "validate_every_n_epochs": with_attributes(_NUMBER,
                                                            description="Specifies across which number of epochs Runner"
                                                                        " should validate the compressed mode."),
+                "proxy_validation_confidence": with_attributes(_NUMBER,
+                                                               description="Confidence level of the interval "
+                                                                           "estimated for the metric value on the "
+                                                                           "validation subset when the proxy "
+                                                                           "validation function is passed to the "
+                                                                           "training loop. The full validation is "
+                                                                           "only run if the interval is not "
+                                                                           "enough to decide on the accuracy "
+                                                                           "budget sign and the best checkpoint.",
+                                                               default=0.95),
             },
             "oneOf": [{"type": "object", "required": ["maximal_relative_accuracy_degradation"]},
                       {"type": "object", "required": ["maximal_absolute_accuracy_degradation"]}],
@@ -577,6 +640,16 @@ QUANTIZATION_SCHEMA = {
                                                                    "standard QuantizeLinear-DequantizeLinear "
                                                                    "node pairs (8-bit quantization only in the latter "
                                                                    "case). Default: false"),
+        "export_packed_weights": with_attributes(_BOOLEAN,
+                                                 description="If set to true, the quantized weights are exported "
+                                                             "into the ONNX format as the uint8 initializers of the "
+                                                             "integer codes dequantized by the standard Cast-Sub-Mul "
+                                                             "operations instead of the floating point weights "
+                                                             "followed by the quantization operations. The "
+                                                             "activations are exported as specified by the "
+                                                             "`export_to_onnx_standard_ops` option. Only the "
+                                                             "quantizers with up to 256 levels are supported. "
+                                                             "Default: false"),
         "overflow_fix": with_attributes(_STRING,
                                           description="Option controls whether to apply the overflow "
                                                       "issue fix for the appropriate NNCF config or not. "
@@ -796,6 +869,17 @@ FILTER_PRUNING_SCHEMA = {
                                                                      " `False` by default.",
                                                          default=False
                                                          ),
+                    "shrink_model_on_export": with_attributes(_BOOLEAN,
+                                                              description="Whether to physically remove the pruned"
+                                                                          " filters from the model layers and the"
+                                                                          " corresponding input channels of the"
+                                                                          " following layers on export instead of"
+                                                                          " exporting zeroed filters. The model is"
+                                                                          " shrunk in place, so the training can not"
+                                                                          " be continued after the export. `False`"
+                                                                          " by default.",
+                                                              default=False
+                                                              ),
                     "save_ranking_coeffs_path": with_attributes(_STRING),
                     "load_ranking_coeffs_path": with_attributes(_STRING),
                     "legr_params":
@@ -11,7 +11,6 @@
  limitations under the License.
 """
 
-from typing import Callable
 from typing import Dict
 from typing import List
 
@@ -36,6 +35,29 @@ class ONNXGraph:
         outputs = self.model_with_shapes.graph.output
         self.activations_tensors.extend(inputs)
         self.activations_tensors.extend(outputs)
+        self.update_indexes()
+
+    def update_indexes(self) -> None:
+        """
+        Builds the indexes of the nodes, initializers and edges by their names, so that the lookups
+        do not require scanning the whole model. Must be called after the onnx model is modified.
+        """
+        self._node_by_name = {}  # type: Dict[str, NodeProto]
+        # The nodes by the names of their edges, for each of the 'input' and 'output' edge fields of the nodes
+        self._nodes_by_edge = {'input': {}, 'output': {}}  # type: Dict[str, Dict[str, List[NodeProto]]]
+        for node in self.onnx_model.graph.node:
+            self._node_by_name.setdefault(node.name, node)
+            for edge_field, nodes_by_edge in self._nodes_by_edge.items():
+                for edge_name in dict.fromkeys(getattr(node, edge_field)):
+                    nodes_by_edge.setdefault(edge_name, []).append(node)
+
+        self._initializer_by_name = {}  # type: Dict[str, onnx.TensorProto]
+        for init in self.onnx_model.graph.initializer:
+            self._initializer_by_name.setdefault(init.name, init)
+
+        self._activation_tensor_by_name = {}  # type: Dict[str, ValueInfoProto]
+        for tensor in self.activations_tensors:
+            self._activation_tensor_by_name.setdefault(tensor.name, tensor)
 
     def get_all_nodes(self) -> List[NodeProto]:
         """
@@ -59,32 +81,23 @@ class ONNXGraph:
         """
         Returns all nodes that have output with the name 'output_name'.
         """
-        return self._get_nodes_by_lambda(output_name, lambda node: node.output)
+        return list(self._nodes_by_edge['output'].get(output_name, []))
 
     def get_nodes_by_input(self, input_name: str) -> List[NodeProto]:
         """
         Returns all nodes that have input with the name 'input_name'.
         """
-        return self._get_nodes_by_lambda(input_name, lambda node: node.input)
-
-    def _get_nodes_by_lambda(self, name: str, func: Callable[[NodeProto], List[NodeProto]]):
-        output = []
-        graph = self.onnx_model.graph
-        for node in graph.node:
-            if name in func(node) or name == func(node):
-                output.append(node)
-        return output
+        return list(self._nodes_by_edge['input'].get(input_name, []))
 
     def get_node_edges(self, node_name: str) -> Dict[str, List[ValueInfoProto]]:
         """
         Returns node input and output edges.
         """
-        graph = self.onnx_model.graph
-        for node in graph.node:
-            if node.name == node_name:
-                return {'input': list(node.input),
-                        'output': list(node.output)}
-        raise RuntimeError('There is no node with the name {}'.format(node_name))
+        node = self._node_by_name.get(node_name)
+        if node is None:
+            raise RuntimeError('There is no node with the name {}'.format(node_name))
+        return {'input': list(node.input),
+                'output': list(node.output)}
 
     def get_nodes_by_type(self, node_type: str) -> List[NodeProto]:
         """
@@ -101,7 +114,7 @@ class ONNXGraph:
         """
         Returns weight Initializaer of the mode with the name 'node_name'.
         """
-        node_inputs = self.get_all_node_inputs(node_name)
+        node_inputs = self.get_node_edges(node_name)['input']
         # TODO(kshpv): add search of input weight tensor
         return node_inputs[1]
 
@@ -109,12 +122,10 @@ class ONNXGraph:
         """
         Returns tensor value of model's Initializer with the name equals to 'initializer_name'.
         """
-        graph = self.onnx_model.graph
-        for init in graph.initializer:
-            if init.name == initializer_name:
-                tensor = onnx.numpy_helper.to_array(init)
-                return tensor
-        raise RuntimeError('There is no initializer with the name {}'.format(initializer_name))
+        init = self._initializer_by_name.get(initializer_name)
+        if init is None:
+            raise RuntimeError('There is no initializer with the name {}'.format(initializer_name))
+        return onnx.numpy_helper.to_array(init)
 
     def get_tensor_shape(self, tensor: ValueInfoProto) -> List[int]:
         """
@@ -140,17 +151,17 @@ class ONNXGraph:
         """
         Returns tensor shape of the edge with the name 'edge_name'.
         """
-        for tensor in self.activations_tensors:
-            if tensor.name == edge_name:
-                return self.get_tensor_shape(tensor)
-        raise RuntimeError('There is no edge with the name {}'.format(edge_name))
+        return self.get_tensor_shape(self._get_activation_tensor(edge_name))
 
     def get_edge_dtype(self, edge_name: str) -> str:
         """
         Returns the data type of the edge with the name 'edge_name'.
         """
-        for tensor in self.activations_tensors:
-            if tensor.name == edge_name:
-                elem_type = tensor.type.tensor_type.elem_type
-                return onnx.TensorProto.DataType.Name(elem_type)
-        raise RuntimeError('There is no edge with the name {}'.format(edge_name))
+        elem_type = self._get_activation_tensor(edge_name).type.tensor_type.elem_type
+        return onnx.TensorProto.DataType.Name(elem_type)
+
+    def _get_activation_tensor(self, edge_name: str) -> ValueInfoProto:
+        tensor = self._activation_tensor_by_name.get(edge_name)
+        if tensor is None:
+            raise RuntimeError('There is no edge with the name {}'.format(edge_name))
+        return tensor
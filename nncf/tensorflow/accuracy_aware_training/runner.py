@@ -25,9 +25,11 @@ class TFAccuracyAwareTrainingRunner(BaseAccuracyAwareTrainingRunner):
     """
 
     def initialize_training_loop_fns(self, train_epoch_fn, validate_fn, configure_optimizers_fn=None,
-                                     dump_checkpoint_fn=None, tensorboard_writer=None, log_dir=None):
+                                     dump_checkpoint_fn=None, tensorboard_writer=None, log_dir=None,
+                                     proxy_validate_fn=None):
         super().initialize_training_loop_fns(train_epoch_fn, validate_fn, configure_optimizers_fn, dump_checkpoint_fn,
-                                             tensorboard_writer=tensorboard_writer, log_dir=log_dir)
+                                             tensorboard_writer=tensorboard_writer, log_dir=log_dir,
+                                             proxy_validate_fn=proxy_validate_fn)
         self._log_dir = self._log_dir if self._log_dir is not None \
             else 'runs'
         self._log_dir = configure_accuracy_aware_paths(self._log_dir)
@@ -49,7 +51,7 @@ class TFAccuracyAwareTrainingRunner(BaseAccuracyAwareTrainingRunner):
         self.cumulative_epoch_count += 1
 
     def validate(self, model):
-        self.current_val_metric_value = self._validate_fn(model, epoch=self.cumulative_epoch_count)
+        self.current_val_metric_value = self._run_validation(model)
         is_best = (not self.is_higher_metric_better) != (self.current_val_metric_value > self.best_val_metric_value)
         if is_best:
             self.best_val_metric_value = self.current_val_metric_value
@@ -11,7 +11,7 @@
  limitations under the License.
 """
 
-from itertools import islice
+from functools import partial
 
 import tensorflow as tf
 
@@ -19,6 +19,7 @@ from nncf.common.initialization.batchnorm_adaptation import BatchnormAdaptationA
 from nncf.common.utils.progress_bar import ProgressBar
 from nncf.tensorflow.graph.metatypes.keras_layers import TFBatchNormalizationLayerMetatype
 from nncf.tensorflow.graph.metatypes.matcher import get_keras_layer_metatype
+from nncf.tensorflow.initialization import get_prefetched_batches
 
 
 class BNTrainingStateSwitcher:
@@ -60,9 +61,11 @@ class TFBatchnormAdaptationAlgorithmImpl(BatchnormAdaptationAlgorithmImpl):
                              'does not support switch of devices. Model initial device '
                              'is used by default for batchnorm adaptation.')
         with BNTrainingStateSwitcher(model):
+            # The moving statistics of the batch-norm layers are updated by the ops of the traced graph
+            adaptation_step = tf.function(partial(model, training=True), experimental_relax_shapes=True)
             for (x, _) in ProgressBar(
-                    islice(self._data_loader, self._num_bn_adaptation_steps),
+                    get_prefetched_batches(self._data_loader, self._num_bn_adaptation_steps),
                     total=self._num_bn_adaptation_steps,
                     desc='BatchNorm statistics adaptation'
             ):
-                model(x, training=True)
+                adaptation_step(x)
@@ -11,6 +11,9 @@
  limitations under the License.
 """
 
+from itertools import islice
+from typing import Iterable
+
 import tensorflow as tf
 
 from nncf.common.initialization.dataloader import NNCFDataLoader
@@ -34,10 +37,28 @@ class TFInitializingDataLoader(NNCFDataLoader):
     def batch_size(self) -> int:
         return self._batch_size
 
+    @property
+    def dataset(self) -> tf.data.Dataset:
+        return self._data_loader
+
     def __iter__(self):
         return iter(self._data_loader)
 
 
+def get_prefetched_batches(data_loader: NNCFDataLoader, num_batches: int) -> Iterable:
+    """
+    Returns the first batches of the data loader. If the data loader wraps a `tf.data.Dataset`,
+    the batches are prefetched in the background while the previous ones are processed.
+
+    :param data_loader: NNCF data loader.
+    :param num_batches: Number of batches to take.
+    :return: Iterable over the batches.
+    """
+    if isinstance(data_loader, TFInitializingDataLoader) and isinstance(data_loader.dataset, tf.data.Dataset):
+        return data_loader.dataset.take(num_batches).prefetch(tf.data.AUTOTUNE)
+    return islice(data_loader, num_batches)
+
+
 def register_default_init_args(nncf_config: NNCFConfig,
                                data_loader: tf.data.Dataset,
                                batch_size: int,
@@ -13,7 +13,7 @@
 
 from typing import List
 from copy import deepcopy
-from itertools import islice
+from functools import partial
 import math
 
 import numpy as np
@@ -27,6 +27,7 @@ from nncf.common.tensor_statistics.collectors import ReductionShape
 from nncf.common.tensor_statistics.collectors import TensorStatisticCollectorBase
 from nncf.common.utils.progress_bar import ProgressBar
 from nncf.common.utils.helpers import should_consider_scope
+from nncf.tensorflow.initialization import get_prefetched_batches
 from nncf.tensorflow.layers.custom_objects import NNCF_QUANTIZATION_OPERATIONS
 from nncf.tensorflow.layers.wrapper import NNCFWrapper
 from nncf.tensorflow.layers.data_layout import get_channel_axis
@@ -35,12 +36,10 @@ from nncf.tensorflow.tensor_statistics.statistics import tf_convert_stat_to_min_
 from nncf.tensorflow.tensor_statistics.reduction import get_reduction_shape_activations
 from nncf.tensorflow.tensor_statistics.reduction import get_reduction_shape_weights
 from nncf.tensorflow.quantization.layers import FakeQuantize
-from nncf.tensorflow.tensor_statistics.collectors import TFMinMaxStatisticCollector
+from nncf.tensorflow.tensor_statistics.collectors import TFInGraphMinMaxStatisticCollector
 from nncf.tensorflow.tensor_statistics.collectors import TFMedianMADStatisticCollector
 from nncf.tensorflow.tensor_statistics.collectors import TFPercentileStatisticCollector
 from nncf.tensorflow.tensor_statistics.collectors import TFMeanPercentileStatisticCollector
-from nncf.tensorflow.tensor_statistics.collectors import TFMixedMinMaxStatisticCollector
-from nncf.tensorflow.tensor_statistics.collectors import TFMeanMinMaxStatisticCollector
 
 
 class TFRangeInitParams(RangeInitParams):
@@ -103,18 +102,28 @@ class RangeInitializer:
             num_samples = num_samples_to_collect_override
 
         if range_type == 'min_max':
-            return TFMinMaxStatisticCollector(collector_params.use_abs_max, reduction_shape, num_samples)
+            return TFInGraphMinMaxStatisticCollector(use_per_sample_stats=False,
+                                                     use_abs_max=collector_params.use_abs_max,
+                                                     use_means_of_mins=False,
+                                                     use_means_of_maxs=False,
+                                                     reduction_shape=reduction_shape,
+                                                     num_samples=num_samples)
         if range_type == 'mixed_min_max':
-            return TFMixedMinMaxStatisticCollector(collector_params.use_per_sample_stats(per_sample_stats=True),
-                                                   collector_params.use_abs_max,
-                                                   collector_params.use_means_of_mins,
-                                                   collector_params.use_means_of_maxs,
-                                                   reduction_shape,
-                                                   num_samples)
+            return TFInGraphMinMaxStatisticCollector(
+                use_per_sample_stats=collector_params.use_per_sample_stats(per_sample_stats=True),
+                use_abs_max=collector_params.use_abs_max,
+                use_means_of_mins=collector_params.use_means_of_mins,
+                use_means_of_maxs=collector_params.use_means_of_maxs,
+                reduction_shape=reduction_shape,
+                num_samples=num_samples)
         if range_type == 'mean_min_max':
-            return TFMeanMinMaxStatisticCollector(collector_params.use_per_sample_stats(per_sample_stats=True),
-                                                  collector_params.use_abs_max,
-                                                  reduction_shape, num_samples)
+            return TFInGraphMinMaxStatisticCollector(
+                use_per_sample_stats=collector_params.use_per_sample_stats(per_sample_stats=True),
+                use_abs_max=collector_params.use_abs_max,
+                use_means_of_mins=True,
+                use_means_of_maxs=True,
+                reduction_shape=reduction_shape,
+                num_samples=num_samples)
         if range_type == 'threesigma':
             return TFMedianMADStatisticCollector(reduction_shape,
                                                  num_samples)
@@ -188,12 +197,17 @@ class RangeInitializer:
             elif isinstance(layer, NNCFWrapper):
                 self._register_op_statistics(layer, op_statistics, handles)
 
+        collectors = [collector for *_, collector in layer_statistics + op_statistics]
+        collection_step = partial(model, training=False)
+        if all(isinstance(collector, TFInGraphMinMaxStatisticCollector) for collector in collectors):
+            # The statistics are accumulated by the ops of the traced graph
+            collection_step = tf.function(collection_step, experimental_relax_shapes=True)
         for (x, _) in ProgressBar(
-                islice(self.dataset, self.num_steps),
+                get_prefetched_batches(self.dataset, self.num_steps),
                 total=self.num_steps,
                 desc='Collecting tensor statistics/data'
         ):
-            model(x, training=False)
+            collection_step(x)
 
         for layer, collector in layer_statistics:
             target_stat = collector.get_statistics()
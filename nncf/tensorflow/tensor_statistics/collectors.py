@@ -25,6 +25,9 @@ from nncf.common.tensor_statistics.collectors import MeanPercentileStatisticColl
 from nncf.common.tensor_statistics.collectors import MixedMinMaxStatisticCollector
 from nncf.common.tensor_statistics.collectors import MeanMinMaxStatisticCollector
 from nncf.common.tensor_statistics.collectors import MinMaxStatisticCollector
+from nncf.common.tensor_statistics.collectors import OnlineTensorStatisticCollector
+from nncf.common.tensor_statistics.collectors import ReductionShape
+from nncf.common.tensor_statistics.collectors import StatisticsNotCollectedError
 from nncf.common.tensor_statistics.reduction import np_percentile_reduce_like
 from nncf.tensorflow.tensor_statistics.statistics import TFMinMaxTensorStatistic
 from nncf.tensorflow.tensor_statistics.statistics import TFPercentileTensorStatistic
@@ -116,6 +119,116 @@ class TFMeanMinMaxStatisticCollector(MeanMinMaxStatisticCollector):
         return TFMinMaxTensorStatistic(self._min_aggregate().tensor, self._max_aggregate().tensor)
 
 
+class TFInGraphMinMaxStatisticCollector(OnlineTensorStatisticCollector):
+    """
+    Collector of the min-max statistics which keeps the aggregated values and the number of the registered inputs
+    in `tf.Variable`s. Unlike the other TF collectors, the inputs may be registered inside `tf.function`,
+    so the statistics collection doesn't require the eager execution of the model.
+
+    The minimum values are aggregated either as the minimum or as the mean of the minimums of the inputs,
+    and the same is for the maximum values. The means are calculated over the inputs, or over the samples
+    of the inputs if the per-sample statistics are used.
+    """
+
+    def __init__(self,
+                 use_per_sample_stats: bool,
+                 use_abs_max: bool,
+                 use_means_of_mins: bool,
+                 use_means_of_maxs: bool,
+                 reduction_shape: ReductionShape = None,
+                 num_samples: int = None):
+        super().__init__(reduction_shape, num_samples)
+        self._use_per_sample_stats = use_per_sample_stats
+        self._use_abs_max = use_abs_max
+        self._use_means_of_mins = use_means_of_mins
+        self._use_means_of_maxs = use_means_of_maxs
+
+        self._num_registered_inputs = tf.Variable(0, trainable=False, dtype=tf.int64)
+        self._num_aggregated_values = tf.Variable(0, trainable=False, dtype=tf.int64)
+        self._min_values = tf.Variable(tf.zeros([0]), trainable=False, shape=tf.TensorShape(None))
+        self._max_values = tf.Variable(tf.zeros([0]), trainable=False, shape=tf.TensorShape(None))
+
+    def register_input(self, x: tf.Tensor) -> tf.Tensor:
+        if not self._enabled:
+            return x
+        if self._reduction_shape is None:
+            self._reduction_shape = tuple(range(len(x.shape)))
+        if self._num_samples is None:
+            self._register_input(x)
+        else:
+            tf.cond(self._num_registered_inputs < self._num_samples,
+                    lambda: self._register_input(x),
+                    lambda: tf.constant(False))
+        return x
+
+    def _register_input(self, x: tf.Tensor) -> tf.Tensor:
+        x = tf.cast(x, tf.float32)
+        min_reduced = tf.reduce_min(x, axis=self._reduction_shape)
+        if self._use_abs_max:
+            x = tf.math.abs(x)
+        max_reduced = tf.reduce_max(x, axis=self._reduction_shape)
+
+        if self._use_per_sample_stats:
+            num_values = tf.shape(min_reduced, out_type=tf.int64)[0]
+            min_values = self._reduce_values(min_reduced, self._use_means_of_mins, tf.reduce_min)
+            max_values = self._reduce_values(max_reduced, self._use_means_of_maxs, tf.reduce_max)
+        else:
+            num_values = tf.constant(1, dtype=tf.int64)
+            min_values = min_reduced
+            max_values = max_reduced
+
+        is_first_input = tf.equal(self._num_aggregated_values, 0)
+        self._min_values.assign(self._aggregate(is_first_input, self._min_values, min_values,
+                                                self._use_means_of_mins, tf.math.minimum))
+        self._max_values.assign(self._aggregate(is_first_input, self._max_values, max_values,
+                                                self._use_means_of_maxs, tf.math.maximum))
+        self._num_aggregated_values.assign_add(num_values)
+        self._num_registered_inputs.assign_add(1)
+        return tf.constant(True)
+
+    @staticmethod
+    def _reduce_values(values: tf.Tensor, use_means: bool, reduce_fn) -> tf.Tensor:
+        if use_means:
+            return tf.reduce_sum(values, axis=0)
+        return reduce_fn(values, axis=0)
+
+    @staticmethod
+    def _aggregate(is_first_input: tf.Tensor, aggregated: tf.Variable, values: tf.Tensor,
+                   use_means: bool, aggregate_fn) -> tf.Tensor:
+        if use_means:
+            aggregate_fn = tf.math.add
+        return tf.cond(is_first_input,
+                       lambda: values,
+                       lambda: aggregate_fn(aggregated, values))
+
+    def collected_samples(self) -> int:
+        return int(self._num_registered_inputs.numpy())
+
+    def get_statistics(self) -> TFMinMaxTensorStatistic:
+        if self.collected_samples() == 0:
+            raise StatisticsNotCollectedError()
+        return self._get_statistics()
+
+    def _get_statistics(self) -> TFMinMaxTensorStatistic:
+        num_values = tf.cast(self._num_aggregated_values, tf.float32)
+        min_values = tf.convert_to_tensor(self._min_values)
+        if self._use_means_of_mins:
+            min_values = min_values / num_values
+        max_values = tf.convert_to_tensor(self._max_values)
+        if self._use_means_of_maxs:
+            max_values = max_values / num_values
+        return TFMinMaxTensorStatistic(min_values, max_values)
+
+    def reset(self):
+        self._reset()
+
+    def _reset(self):
+        self._num_registered_inputs.assign(0)
+        self._num_aggregated_values.assign(0)
+        self._min_values.assign(tf.zeros([0]))
+        self._max_values.assign(tf.zeros([0]))
+
+
 class TFMedianMADStatisticCollector(MedianMADStatisticCollector):
     def _register_input(self, x: tf.Tensor):
         self._samples.append(x.numpy())
@@ -38,20 +38,16 @@ from nncf.torch.dynamic_graph.patch_pytorch import patch_extension_build_functio
 # It must be called before importing packages containing CUDA extensions
 patch_extension_build_function()
 
-# Required for correct COMPRESSION_ALGORITHMS registry functioning
-from nncf.torch.binarization import algo as binarization_algo
-from nncf.torch.quantization import algo as quantization_algo
-from nncf.torch.sparsity.const import algo as const_sparsity_algo
-from nncf.torch.sparsity.magnitude import algo as magnitude_sparsity_algo
-from nncf.torch.sparsity.rb import algo as rb_sparsity_algo
-from nncf.torch.pruning.filter_pruning import algo as filter_pruning_algo
-from nncf.torch.knowledge_distillation import algo as knowledge_distillation_algo
+# The compression algorithms are imported on demand by the PT_COMPRESSION_ALGORITHMS registry,
+# see nncf.torch.algo_selector.PT_COMPRESSION_ALGORITHM_MODULES
 
 # Functions most commonly used in integrating NNCF into training pipelines are
 # listed below for importing convenience
 
 from nncf.torch.model_creation import create_compressed_model
 from nncf.torch.checkpoint_loading import load_state
+from nncf.torch.checkpoint_loading import load_checkpoint
+from nncf.torch.quantization.weights_packing import load_packed_checkpoint
 from nncf.common.utils.logger import disable_logging
 from nncf.common.utils.logger import set_log_level
 from nncf.torch.initialization import register_default_init_args
@@ -61,14 +57,22 @@ from nncf.torch.dynamic_graph.io_handling import nncf_model_input
 from nncf.torch.dynamic_graph.io_handling import nncf_model_output
 from nncf.torch.dynamic_graph.context import no_nncf_trace
 from nncf.torch.dynamic_graph.context import forward_nncf_trace
+from nncf.torch.dynamic_graph.context import enable_scoped_tracing
+from nncf.torch.dynamic_graph.context import disable_scoped_tracing
 from nncf.common.accuracy_aware_training.training_loop import AdaptiveCompressionTrainingLoop
 from nncf.common.accuracy_aware_training.training_loop import EarlyExitCompressionTrainingLoop
 
 # NNCF relies on tracing PyTorch operations. Each code that uses NNCF
 # should be executed with PyTorch operators wrapped via a call to "patch_torch_operators",
 # so this call is moved to package __init__ to ensure this.
+# If the NNCF_TORCH_SCOPED_TRACING environment variable is set to 1, the operator calls
+# are only traced by the threads that have entered a TracingContext, e.g. the forward of an NNCFNetwork.
 from nncf.torch.dynamic_graph.patch_pytorch import patch_torch_operators
 
 from nncf.torch.extensions import force_build_cpu_extensions, force_build_cuda_extensions
 
 patch_torch_operators()
+
+import os
+if os.environ.get('NNCF_TORCH_SCOPED_TRACING') == '1':
+    enable_scoped_tracing()
@@ -0,0 +1,125 @@
+"""
+ Copyright (c) 2022 Intel Corporation
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+      http://www.apache.org/licenses/LICENSE-2.0
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+import os
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from shutil import copyfile
+from typing import Any, List, Optional
+
+import torch
+
+
+class AsyncCheckpointWriter:
+    """
+    Writes checkpoints to disk in a background thread, so that the training is only blocked for the time
+    it takes to copy the tensors of the checkpoint to the host memory. The CUDA tensors are copied
+    to the pinned memory asynchronously, the copies are awaited in the background thread.
+
+    The operations are executed in the order they were submitted. At most one checkpoint is being written
+    at a time: submitting the next one waits for the previous operations to finish and re-raises
+    the errors they have encountered.
+    """
+
+    def __init__(self):
+        self._executor = None  # type: Optional[ThreadPoolExecutor]
+        self._pending = []  # type: List[Future]
+
+    def save(self, checkpoint: Any, path: str):
+        """
+        Schedules saving of the checkpoint to the given path. The file is replaced atomically,
+        so the previous checkpoint at this path stays intact until the new one is fully written.
+
+        :param checkpoint: The checkpoint object, the nested dicts, lists and tuples of which may contain tensors.
+        :param path: The path to save the checkpoint to.
+        """
+        self.wait()
+        copy_done_event = None
+        if torch.cuda.is_initialized():
+            copy_done_event = torch.cuda.Event()
+        snapshot = _snapshot_to_host(checkpoint)
+        if copy_done_event is not None:
+            copy_done_event.record()
+        self._submit(_save, snapshot, path, copy_done_event)
+
+    def link(self, src_path: str, dst_path: str):
+        """
+        Schedules making the file at `dst_path` refer to the current contents of `src_path` without copying it.
+        The next `save` to `src_path` replaces the file instead of overwriting it, so the contents
+        at `dst_path` are preserved. Falls back to copying if the file system does not support hard links.
+        """
+        self._submit(_link, src_path, dst_path)
+
+    def remove(self, path: str):
+        """
+        Schedules removal of the file at the given path, if it exists.
+        """
+        self._submit(_remove, path)
+
+    def wait(self):
+        """
+        Waits for all of the scheduled operations to finish.
+        """
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+    def _submit(self, fn, *args):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='nncf_checkpoint_writer')
+        self._pending.append(self._executor.submit(fn, *args))
+
+
+def _snapshot_to_host(obj: Any) -> Any:
+    # Builds new containers, since e.g. the optimizer state dict shares the per-parameter state with the optimizer
+    if isinstance(obj, torch.Tensor):
+        obj = obj.detach()
+        if obj.is_cuda:
+            host_tensor = torch.empty(obj.size(), dtype=obj.dtype, layout=obj.layout, pin_memory=True)
+            return host_tensor.copy_(obj, non_blocking=True)
+        return obj.clone()
+    if isinstance(obj, dict):
+        # The shallow copy keeps the attributes of the dict, e.g. the metadata of a state dict
+        result = copy(obj)
+        for key, value in obj.items():
+            result[key] = _snapshot_to_host(value)
+        return result
+    if isinstance(obj, list):
+        return [_snapshot_to_host(value) for value in obj]
+    if isinstance(obj, tuple) and not hasattr(obj, '_fields'):
+        return tuple(_snapshot_to_host(value) for value in obj)
+    return obj
+
+
+def _save(checkpoint: Any, path: str, copy_done_event: Optional['torch.cuda.Event']):
+    if copy_done_event is not None:
+        copy_done_event.synchronize()
+    tmp_path = path + '.tmp'
+    torch.save(checkpoint, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _link(src_path: str, dst_path: str):
+    tmp_path = dst_path + '.tmp'
+    if os.path.lexists(tmp_path):
+        os.remove(tmp_path)
+    try:
+        os.link(src_path, tmp_path)
+    except OSError:
+        copyfile(src_path, tmp_path)
+    os.replace(tmp_path, dst_path)
+
+
+def _remove(path: str):
+    if os.path.exists(path):
+        os.remove(path)
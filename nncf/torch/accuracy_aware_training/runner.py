@@ -13,7 +13,6 @@
 
 import io
 import os.path as osp
-from shutil import copyfile
 
 import torch
 from torch.optim.lr_scheduler import ReduceLROnPlateau
@@ -34,7 +33,9 @@ try:
 except ImportError:
     IMG_PACKAGES_AVAILABLE = False
 
+from nncf.torch.checkpoint_loading import load_checkpoint
 from nncf.torch.checkpoint_loading import load_state
+from nncf.torch.accuracy_aware_training.checkpoint_writer import AsyncCheckpointWriter
 from nncf.torch.accuracy_aware_training.utils import is_main_process
 from nncf.common.utils.helpers import configure_accuracy_aware_paths
 from nncf.common.utils.logger import logger as nncf_logger
@@ -56,11 +57,15 @@ class PTAccuracyAwareTrainingRunner(BaseAccuracyAwareTrainingRunner):
 
         self._base_lr_reduction_factor_during_search = 0.5
         self.lr_updates_needed = lr_updates_needed
+        self._checkpoint_writer = AsyncCheckpointWriter()
+        self._tensorboard_writer = None
 
     def initialize_training_loop_fns(self, train_epoch_fn, validate_fn, configure_optimizers_fn,
-                                     dump_checkpoint_fn, tensorboard_writer=None, log_dir=None):
+                                     dump_checkpoint_fn, tensorboard_writer=None, log_dir=None,
+                                     proxy_validate_fn=None):
         super().initialize_training_loop_fns(train_epoch_fn, validate_fn, configure_optimizers_fn, dump_checkpoint_fn,
-                                             tensorboard_writer=tensorboard_writer, log_dir=log_dir)
+                                             tensorboard_writer=tensorboard_writer, log_dir=log_dir,
+                                             proxy_validate_fn=proxy_validate_fn)
         self._log_dir = self._log_dir if self._log_dir is not None \
             else 'runs'
         self._log_dir = configure_accuracy_aware_paths(self._log_dir)
@@ -93,7 +98,7 @@ class PTAccuracyAwareTrainingRunner(BaseAccuracyAwareTrainingRunner):
 
     def validate(self, model):
         with torch.no_grad():
-            self.current_val_metric_value = self._validate_fn(model, epoch=self.cumulative_epoch_count)
+            self.current_val_metric_value = self._run_validation(model)
         is_better_by_accuracy = (not self.is_higher_metric_better) != (
                 self.current_val_metric_value > self.best_val_metric_value)
         if is_better_by_accuracy:
@@ -137,7 +142,7 @@ class PTAccuracyAwareTrainingRunner(BaseAccuracyAwareTrainingRunner):
             best_checkpoint_filename = 'acc_aware_checkpoint_best.pth'
             best_path = osp.join(self._checkpoint_save_dir, best_checkpoint_filename)
             self._best_checkpoint = best_path
-            copyfile(checkpoint_path, best_path)
+            self._checkpoint_writer.link(checkpoint_path, best_path)
 
     def dump_checkpoint(self, model, compression_controller):
         if self._dump_checkpoint_fn is not None and is_main_process():
@@ -153,8 +158,9 @@ class PTAccuracyAwareTrainingRunner(BaseAccuracyAwareTrainingRunner):
                 'scheduler': compression_controller.scheduler.get_state()
             }
             checkpoint_path = osp.join(self._checkpoint_save_dir, 'acc_aware_checkpoint_last.pth')
-            torch.save(checkpoint, checkpoint_path)
-            nncf_logger.info("The checkpoint is saved in {}".format(checkpoint_path))
+            # The checkpoint is written in the background, the training is only blocked by the copying to host
+            self._checkpoint_writer.save(checkpoint, checkpoint_path)
+            nncf_logger.info("The checkpoint is being saved in {}".format(checkpoint_path))
             self._save_best_checkpoint(checkpoint_path)
 
     def add_tensorboard_scalar(self, key, data, step):
@@ -184,10 +190,11 @@ class PTAccuracyAwareTrainingRunner(BaseAccuracyAwareTrainingRunner):
         return dict(self._compressed_training_history)
 
     def load_best_checkpoint(self, model):
+        self._checkpoint_writer.wait()
         resuming_checkpoint_path = self._best_checkpoint
         nncf_logger.info('Loading the best checkpoint found during training '
                          '{}...'.format(resuming_checkpoint_path))
-        resuming_checkpoint = torch.load(resuming_checkpoint_path, map_location='cpu')
+        resuming_checkpoint = load_checkpoint(resuming_checkpoint_path, map_location='cpu')
         resuming_model_state_dict = resuming_checkpoint.get('state_dict', resuming_checkpoint)
         load_state(model, resuming_model_state_dict, is_resume=True)
 
@@ -213,6 +220,7 @@ class PTAdaptiveCompressionLevelTrainingRunner(PTAccuracyAwareTrainingRunner,
     def update_training_history(self, compression_rate, best_metric_value):
         best_accuracy_budget = best_metric_value - self.minimal_tolerable_accuracy
         self._compressed_training_history.append((compression_rate, best_accuracy_budget))
+        self._remove_unused_best_checkpoints()
 
         if IMG_PACKAGES_AVAILABLE:
             plt.figure()
@@ -223,9 +231,10 @@ class PTAdaptiveCompressionLevelTrainingRunner(PTAccuracyAwareTrainingRunner,
             buf.seek(0)
             image = PIL.Image.open(buf)
             image = ToTensor()(image)
-            self._tensorboard_writer.add_image('compression/accuracy_aware/acc_budget_vs_comp_rate',
-                                               image,
-                                               global_step=len(self.compressed_training_history))
+            if self._tensorboard_writer is not None:
+                self._tensorboard_writer.add_image('compression/accuracy_aware/acc_budget_vs_comp_rate',
+                                                   image,
+                                                   global_step=len(self.compressed_training_history))
 
     def _save_best_checkpoint(self, checkpoint_path):
         if self.best_val_metric_value == self.current_val_metric_value:
@@ -233,9 +242,25 @@ class PTAdaptiveCompressionLevelTrainingRunner(PTAccuracyAwareTrainingRunner,
                                        '{comp_rate:.3f}.pth'.format(comp_rate=self.compression_rate_target)
             best_path = osp.join(self._checkpoint_save_dir, best_checkpoint_filename)
             self._best_checkpoints[self.compression_rate_target] = best_path
-            copyfile(checkpoint_path, best_path)
+            self._checkpoint_writer.link(checkpoint_path, best_path)
+
+    def _remove_unused_best_checkpoints(self):
+        # Only the checkpoint with the highest compression rate among the ones with a non-negative accuracy budget
+        # is loaded in the end. The accuracy budget of the current target compression rate may still change.
+        possible_checkpoint_rates = self.get_compression_rates_with_positive_acc_budget()
+        retained_rates = {self.compression_rate_target}
+        if possible_checkpoint_rates:
+            retained_rates.add(max(possible_checkpoint_rates))
+        retained_paths = {self._best_checkpoints[rate] for rate in retained_rates if rate in self._best_checkpoints}
+        for comp_rate in list(self._best_checkpoints):
+            if comp_rate in retained_rates:
+                continue
+            path = self._best_checkpoints.pop(comp_rate)
+            if path not in retained_paths:
+                self._checkpoint_writer.remove(path)
 
     def load_best_checkpoint(self, model):
+        self._checkpoint_writer.wait()
         # load checkpoint with highest compression rate and positive acc budget
         possible_checkpoint_rates = self.get_compression_rates_with_positive_acc_budget()
         if not possible_checkpoint_rates:
@@ -246,7 +271,7 @@ class PTAdaptiveCompressionLevelTrainingRunner(PTAccuracyAwareTrainingRunner,
         resuming_checkpoint_path = self._best_checkpoints[best_checkpoint_compression_rate]
         nncf_logger.info('Loading the best checkpoint found during training '
                          '{}...'.format(resuming_checkpoint_path))
-        resuming_checkpoint = torch.load(resuming_checkpoint_path, map_location='cpu')
+        resuming_checkpoint = load_checkpoint(resuming_checkpoint_path, map_location='cpu')
         resuming_model_state_dict = resuming_checkpoint.get('state_dict', resuming_checkpoint)
         load_state(model, resuming_model_state_dict, is_resume=True)
 
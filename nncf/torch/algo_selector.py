@@ -12,6 +12,7 @@
 """
 
 # pylint:disable=relative-beyond-top-level
+import importlib
 from typing import Dict
 
 import torch
@@ -31,7 +32,48 @@ from nncf.common.utils.registry import Registry
 from nncf.common.statistics import NNCFStatistics
 from nncf.torch.utils import get_model_device
 
-PT_COMPRESSION_ALGORITHMS = Registry('compression algorithm', add_name_as_attr=True)
+
+class LazyAlgorithmsRegistry(Registry):
+    """
+    Registry of the compression algorithm builders which imports the module defining an algorithm
+    only when the algorithm is requested, so that importing NNCF does not import every algorithm.
+    """
+
+    def __init__(self, name, algorithm_modules: Dict[str, str], add_name_as_attr=False):
+        super().__init__(name, add_name_as_attr)
+        self._algorithm_modules = algorithm_modules
+
+    def _import_algorithm_module(self, name):
+        if name not in self._registry_dict and name in self._algorithm_modules:
+            importlib.import_module(self._algorithm_modules[name])
+
+    @property
+    def registry_dict(self):
+        for name in self._algorithm_modules:
+            self._import_algorithm_module(name)
+        return self._registry_dict
+
+    def get(self, name):
+        self._import_algorithm_module(name)
+        return super().get(name)
+
+    def __contains__(self, item):
+        return item in self.registry_dict.values()
+
+
+# Modules registering the builders of the respective compression algorithms on import
+PT_COMPRESSION_ALGORITHM_MODULES = {
+    'quantization': 'nncf.torch.quantization.algo',
+    'binarization': 'nncf.torch.binarization.algo',
+    'const_sparsity': 'nncf.torch.sparsity.const.algo',
+    'magnitude_sparsity': 'nncf.torch.sparsity.magnitude.algo',
+    'rb_sparsity': 'nncf.torch.sparsity.rb.algo',
+    'filter_pruning': 'nncf.torch.pruning.filter_pruning.algo',
+    'knowledge_distillation': 'nncf.torch.knowledge_distillation.algo',
+}
+
+PT_COMPRESSION_ALGORITHMS = LazyAlgorithmsRegistry('compression algorithm', PT_COMPRESSION_ALGORITHM_MODULES,
+                                                   add_name_as_attr=True)
 
 
 class ZeroCompressionLoss(PTCompressionLoss):
@@ -21,6 +21,7 @@ from pathlib import Path
 from typing import Callable
 from typing import Dict
 from typing import List
+from typing import Optional
 from typing import Tuple
 from typing import Union
 
@@ -34,6 +35,7 @@ import torch.optim
 import torch.utils.data
 import torch.utils.data.distributed
 from natsort import natsorted
+from sklearn.linear_model import Ridge
 from sklearn.preprocessing import MinMaxScaler
 
 from nncf.common.initialization.batchnorm_adaptation import BatchnormAdaptationAlgorithm
@@ -105,6 +107,62 @@ class ModelSizeCalculator:
     def get_model_size_ratio(self, per_quantizer_bw: Dict[QuantizerId, int]) -> np.float64:
         return self.get_model_size(per_quantizer_bw)/self.fp_model_size
 
+
+class StrategyScoreSurrogate:
+    """
+    Ridge regression of the quantized model score over the log2 of the per-quantizer bitwidths. Once it is fit
+    on enough evaluated strategies, it is used to skip the evaluation of the strategies that are unlikely
+    to outperform the best evaluated one. The tolerance band around the predictions is based on the
+    leave-one-out residuals of the regression, since the in-sample residuals of a regression over as many
+    features as there are quantizers underestimate its prediction error.
+    """
+
+    def __init__(self, warmup_eval_number: int, alpha: float = 1.0, tolerance_factor: float = 2.0):
+        self._warmup_eval_number = warmup_eval_number
+        self._alpha = alpha
+        self._tolerance_factor = tolerance_factor
+        self._regressor = Ridge(alpha=alpha)
+        self._features = []  # type: List[np.ndarray]
+        self._scores = []  # type: List[float]
+        self._residual_std = None  # type: Optional[float]
+
+    @staticmethod
+    def _get_features(strategy: Tuple[int, ...]) -> np.ndarray:
+        return np.log2(np.asarray(strategy, dtype=np.float64))
+
+    def is_ready(self) -> bool:
+        return self._residual_std is not None
+
+    def add(self, strategy: Tuple[int, ...], score: float):
+        self._features.append(self._get_features(strategy))
+        self._scores.append(score)
+        num_evaluated = len(self._scores)
+        # The regression is not screening until it is fit on more policies than there are features (quantizers)
+        if num_evaluated >= self._warmup_eval_number and num_evaluated > len(self._features[0]):
+            features, scores = np.stack(self._features), np.asarray(self._scores)
+            self._regressor.fit(features, scores)
+            residuals = scores - self._regressor.predict(features)
+            loo_residuals = residuals / (1.0 - self._get_leverages(features))
+            self._residual_std = float(np.sqrt(np.mean(loo_residuals ** 2)))
+
+    def _get_leverages(self, features: np.ndarray) -> np.ndarray:
+        """
+        Returns the diagonal of the hat matrix of the ridge regression with an unpenalized intercept, so that
+        the leave-one-out residuals are obtained from the in-sample ones without refitting the regression.
+        """
+        num_samples = features.shape[0]
+        centered_features = features - features.mean(axis=0)
+        gram = centered_features @ centered_features.T
+        hat_matrix = np.linalg.solve(gram + self._alpha * np.eye(num_samples), gram)
+        return np.diag(hat_matrix) + 1.0 / num_samples
+
+    def predict(self, strategy: Tuple[int, ...]) -> float:
+        return float(self._regressor.predict(self._get_features(strategy)[np.newaxis])[0])
+
+    def is_promising(self, predicted_score: float, best_score: float) -> bool:
+        return predicted_score + self._tolerance_factor * self._residual_std >= best_score
+
+
 class QuantizationEnvParams:
     def __init__(self, compression_ratio: float,
                  eval_subset_ratio: float,
@@ -113,7 +171,8 @@ class QuantizationEnvParams:
                  finetune: bool,
                  bits: List[int],
                  dump_init_precision_data: bool = False,
-                 log_dir: str = None):
+                 log_dir: str = None,
+                 surrogate_warmup_eval_number: int = 0):
         self.compression_ratio = compression_ratio
         self.eval_subset_ratio = eval_subset_ratio
         self.skip_constraint = skip_constraint
@@ -122,6 +181,7 @@ class QuantizationEnvParams:
         self.bits = bits
         self.dump_init_precision_data = dump_init_precision_data
         self.log_dir = log_dir
+        self.surrogate_warmup_eval_number = surrogate_warmup_eval_number
 
 
 class QuantizationEnv:
@@ -167,6 +227,12 @@ class QuantizationEnv:
         # Counter for number of evaluate_strategy calls
         self._n_eval = 0
 
+        # Scores of the evaluated strategies, keyed by the final bitwidth per quantizer
+        self._strategy_score_cache = {}  # type: Dict[Tuple[int, ...], float]
+        self._surrogate = None  # type: Optional[StrategyScoreSurrogate]
+        if params.surrogate_warmup_eval_number > 0:
+            self._surrogate = StrategyScoreSurrogate(params.surrogate_warmup_eval_number)
+
         # Configure search space for precision according to target device
         if self.hw_cfg_type is None:
             self.model_bitwidth_space = params.bits
@@ -592,7 +658,7 @@ class QuantizationEnv:
                 str(self.qctrl.all_quantizations[find_qid_by_str(self.qctrl, qid)]),
                 idx))
 
-        quantized_score = self._run_quantization_pipeline(finetune=self.finetune)
+        quantized_score = self._get_quantized_score(tuple(int(bw) for bw in self.master_df['action']))
 
         current_model_size = self.model_size_calculator(self._get_quantizer_bitwidth())
         current_model_ratio = self.model_size_calculator.get_model_size_ratio(self._get_quantizer_bitwidth())
@@ -614,6 +680,24 @@ class QuantizationEnv:
         return obs, reward, done, info_set
 
 
+    def _get_quantized_score(self, strategy: Tuple[int, ...]) -> float:
+        if strategy in self._strategy_score_cache:
+            quantized_score = self._strategy_score_cache[strategy]
+            logger.info("[Q.Env] Reusing Quantized Score of the Evaluated Strategy: {:.3f}".format(quantized_score))
+            return quantized_score
+
+        if self._surrogate is not None and self._surrogate.is_ready():
+            predicted_score = self._surrogate.predict(strategy)
+            if not self._surrogate.is_promising(predicted_score, max(self._strategy_score_cache.values())):
+                logger.info("[Q.Env] Skipping Evaluation, Predicted Score: {:.3f}".format(predicted_score))
+                return predicted_score
+
+        quantized_score = self._run_quantization_pipeline(finetune=self.finetune)
+        self._strategy_score_cache[strategy] = quantized_score
+        if self._surrogate is not None:
+            self._surrogate.add(strategy, quantized_score)
+        return quantized_score
+
     def set_next_step_prev_action(self, idx, action):
         self.master_df.loc[self.master_df.index[idx], 'prev_action'] = action
 
@@ -13,9 +13,11 @@
 
 import os.path
 import torch
-from torch.utils.cpp_extension import load
 
 from nncf.torch.extensions import CudaNotAvailableStub, ExtensionsType, ExtensionLoader, EXTENSIONS
+from nncf.torch.extensions import LazyExtension
+from nncf.torch.extensions import load_extension
+from nncf.torch.binarization.reference import ReferenceBinarizedFunctions
 from nncf.definitions import NNCF_PACKAGE_ROOT_DIR
 
 BASE_EXT_DIR = os.path.join(NNCF_PACKAGE_ROOT_DIR, "torch/extensions/src/binarization")
@@ -43,8 +45,11 @@ class BinarizedFunctionsCPULoader(ExtensionLoader):
 
     @staticmethod
     def load():
-        return load('binarized_functions_cpu', CPU_EXT_SRC_LIST, extra_include_paths=EXT_INCLUDE_DIRS,
-                    verbose=False)
+        return load_extension('binarized_functions_cpu', CPU_EXT_SRC_LIST, extra_include_paths=EXT_INCLUDE_DIRS)
+
+    @staticmethod
+    def fallback():
+        return ReferenceBinarizedFunctions
 
 
 @EXTENSIONS.register()
@@ -55,13 +60,17 @@ class BinarizedFunctionsCUDALoader(ExtensionLoader):
 
     @staticmethod
     def load():
-        return load('binarized_functions_cuda', CUDA_EXT_SRC_LIST, extra_include_paths=EXT_INCLUDE_DIRS,
-                    verbose=False)
+        return load_extension('binarized_functions_cuda', CUDA_EXT_SRC_LIST, extra_include_paths=EXT_INCLUDE_DIRS)
+
+    @staticmethod
+    def fallback():
+        return ReferenceBinarizedFunctions
 
 
-BinarizedFunctionsCPU = BinarizedFunctionsCPULoader.load()
+# The extensions are loaded on the first call to any of their functions
+BinarizedFunctionsCPU = LazyExtension(BinarizedFunctionsCPULoader)
 
 if torch.cuda.is_available():
-    BinarizedFunctionsCUDA = BinarizedFunctionsCUDALoader.load()
+    BinarizedFunctionsCUDA = LazyExtension(BinarizedFunctionsCUDALoader)
 else:
     BinarizedFunctionsCUDA = CudaNotAvailableStub
@@ -0,0 +1,60 @@
+"""
+ Copyright (c) 2022 Intel Corporation
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+      http://www.apache.org/licenses/LICENSE-2.0
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+# pylint:disable=invalid-name
+from typing import List
+
+import torch
+
+
+def _get_act_channels_shape(input_: torch.Tensor) -> List[int]:
+    shape = [1] * input_.dim()
+    shape[1] = input_.shape[1]
+    return shape
+
+
+class ReferenceBinarizedFunctions:
+    """
+    PyTorch implementation of the functions of the binarization extensions, used if the
+    extensions cannot be built in the current environment.
+    """
+
+    @staticmethod
+    def WeightBinarize_forward(input_: torch.Tensor, per_channel: bool) -> torch.Tensor:
+        if per_channel:
+            scale = input_.abs().mean(list(range(1, input_.dim())), keepdim=True)
+        else:
+            scale = input_.abs().mean()
+        sign = (input_ > 0).type(input_.dtype) * 2 - 1
+        return sign * scale
+
+    @staticmethod
+    def ActivationBinarize_forward(input_: torch.Tensor, scale: torch.Tensor,
+                                   thresholds: torch.Tensor) -> torch.Tensor:
+        thresholds = (thresholds * scale).view(_get_act_channels_shape(input_))
+        return (input_ > thresholds).type(input_.dtype) * scale
+
+    @staticmethod
+    def ActivationBinarize_backward(grad_output: torch.Tensor, input_: torch.Tensor, scale: torch.Tensor,
+                                    output: torch.Tensor) -> List[torch.Tensor]:
+        mask_lower = input_ < scale
+        mask_range = (input_ > 0).logical_and_(mask_lower)
+        grad_input = grad_output * mask_range.type(grad_output.dtype)
+
+        err = ((output - input_) / scale).masked_fill_(mask_lower.logical_not_(), 1)
+        grad_scale = (grad_output * err).sum().view_as(scale)
+
+        grad_thresholds = -grad_input
+        for dim in range(grad_thresholds.dim()):
+            if dim != 1:
+                grad_thresholds = grad_thresholds.sum(dim, keepdim=True)
+        return [grad_input, grad_scale, grad_thresholds]
@@ -10,10 +10,19 @@
  See the License for the specific language governing permissions and
  limitations under the License.
 """
+import functools
+import inspect
+import pickle  # nosec
 import re
+import struct
+import sys
 import warnings
+import zipfile
+from collections import OrderedDict
+from collections.abc import ItemsView
+from collections.abc import ValuesView
 from enum import Enum
-from typing import Dict, List, Set, Tuple
+from typing import Any, Dict, List, Set, Tuple, Union
 
 import torch
 
@@ -56,6 +65,250 @@ def load_state(model: torch.nn.Module, state_dict_to_load: dict, is_resume: bool
     return num_loaded_params
 
 
+# torch.load can memory-map the checkpoint file starting from PyTorch 2.1
+_TORCH_LOAD_SUPPORTS_MMAP = 'mmap' in inspect.signature(torch.load).parameters
+
+# Offset of the file name length and extra field length fields in the zip local file header (APPNOTE 4.3.7)
+_ZIP_LOCAL_HEADER_NAME_LENGTHS_OFFSET = 26
+
+_STORAGE_TYPE_NAME_VS_DTYPE = {
+    'DoubleStorage': torch.float64,
+    'FloatStorage': torch.float32,
+    'HalfStorage': torch.float16,
+    'BFloat16Storage': torch.bfloat16,
+    'LongStorage': torch.int64,
+    'IntStorage': torch.int32,
+    'ShortStorage': torch.int16,
+    'CharStorage': torch.int8,
+    'ByteStorage': torch.uint8,
+    'BoolStorage': torch.bool,
+    'UntypedStorage': torch.uint8,
+}
+
+
+def load_checkpoint(path: str, map_location: Union[str, torch.device] = 'cpu') -> Any:
+    """
+    Loads the checkpoint saved by torch.save so that the tensors are not read into memory all at once.
+    If the installed PyTorch supports it, the checkpoint file is memory-mapped, otherwise the state dicts
+    in the checkpoint are returned as LazyStateDict objects reading each tensor from the file on access.
+    Loading such a checkpoint into the model by load_state or load_state_dict needs only as much memory
+    in addition to the model as the largest tensor of the checkpoint takes.
+    The checkpoints that cannot be loaded lazily, e.g. saved in the legacy non-zip format or loaded to
+    a device other than CPU, are loaded by torch.load as usual.
+
+    :param path: Path to the checkpoint file.
+    :param map_location: The device to load the tensors to.
+    :return: The loaded checkpoint.
+    """
+    if _TORCH_LOAD_SUPPORTS_MMAP:
+        try:
+            return torch.load(path, map_location=map_location, mmap=True)
+        except RuntimeError:
+            # The legacy non-zip format cannot be memory-mapped
+            return torch.load(path, map_location=map_location)
+    if str(map_location) == 'cpu' and zipfile.is_zipfile(path):
+        try:
+            return _load_checkpoint_lazily(path)
+        except _LazyLoadingNotSupported as e:
+            nncf_logger.debug('The checkpoint {} cannot be loaded lazily: {}'.format(path, e))
+    return torch.load(path, map_location=map_location)
+
+
+class _LazyLoadingNotSupported(Exception):
+    pass
+
+
+class _LazyStorage:
+    """
+    Location of a storage record in the zip-based checkpoint file.
+    """
+
+    def __init__(self, path: str, record_info: zipfile.ZipInfo, dtype: torch.dtype, numel: int):
+        self.path = path
+        self.record_info = record_info
+        self.dtype = dtype
+        self.numel = numel
+
+    def read(self) -> torch.Tensor:
+        storage = torch.empty(self.numel, dtype=self.dtype)
+        nbytes = storage.numel() * storage.element_size()
+        info = self.record_info
+        if info.compress_type != zipfile.ZIP_STORED or info.file_size != nbytes:
+            raise RuntimeError('Unexpected layout of the {} record in {}'.format(info.filename, self.path))
+        with open(self.path, 'rb') as f:
+            # The record data follows the local file header, which has variable-length fields
+            f.seek(info.header_offset)
+            header = f.read(zipfile.sizeFileHeader)
+            if len(header) != zipfile.sizeFileHeader or header[:4] != zipfile.stringFileHeader:
+                raise RuntimeError('Bad local file header of the {} record in {}'.format(info.filename, self.path))
+            name_length, extra_length = struct.unpack_from('<HH', header, _ZIP_LOCAL_HEADER_NAME_LENGTHS_OFFSET)
+            f.seek(info.header_offset + zipfile.sizeFileHeader + name_length + extra_length)
+            if nbytes and f.readinto(storage.view(torch.uint8).numpy()) != nbytes:
+                raise RuntimeError('Unexpected end of the {} record in {}'.format(info.filename, self.path))
+        return storage
+
+
+class LazyTensor:
+    """
+    Tensor of the checkpoint loaded by load_checkpoint, which is not read from the file yet.
+    """
+
+    def __init__(self, storage: _LazyStorage, storage_offset: int, size: Tuple[int, ...], stride: Tuple[int, ...],
+                 requires_grad: bool):
+        self._storage = storage
+        self._storage_offset = storage_offset
+        self._size = torch.Size(size)
+        self._stride = stride
+        self._requires_grad = requires_grad
+
+    def size(self) -> torch.Size:
+        return self._size
+
+    @property
+    def shape(self) -> torch.Size:
+        return self._size
+
+    @property
+    def dtype(self) -> torch.dtype:
+        return self._storage.dtype
+
+    def materialize(self) -> torch.Tensor:
+        storage = self._storage.read()
+        tensor = torch.as_strided(storage, self._size, self._stride, self._storage_offset)
+        tensor.requires_grad_(self._requires_grad)
+        return tensor
+
+
+def _maybe_materialize(value: Any) -> Any:
+    if isinstance(value, LazyTensor):
+        return value.materialize()
+    return value
+
+
+class LazyStateDict(OrderedDict):
+    """
+    State dict of the checkpoint loaded by load_checkpoint, which reads each tensor from the checkpoint file
+    only when the tensor is accessed, so the tensors are read one at a time by load_state_dict.
+    """
+
+    def __getitem__(self, key: str) -> torch.Tensor:
+        return _maybe_materialize(super().__getitem__(key))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        return default
+
+    def pop(self, key: str, *args) -> Any:
+        if key not in self:
+            return super().pop(key, *args)
+        return _maybe_materialize(super().pop(key))
+
+    def items(self) -> ItemsView:
+        return ItemsView(self)
+
+    def values(self) -> ValuesView:
+        return ValuesView(self)
+
+    def get_lazy(self, key: str) -> Union[torch.Tensor, LazyTensor]:
+        """
+        Returns the tensor by the key without reading it from the checkpoint file.
+        """
+        return super().__getitem__(key)
+
+    def set_lazy(self, key: str, value: Union[torch.Tensor, LazyTensor]):
+        super().__setitem__(key, value)
+
+    def copy(self) -> 'LazyStateDict':
+        # load_state_dict works with a copy of the state dict, which should be lazy as well
+        result = LazyStateDict()
+        for key in self:
+            result.set_lazy(key, self.get_lazy(key))
+        if hasattr(self, '_metadata'):
+            result._metadata = self._metadata  # pylint:disable=attribute-defined-outside-init
+        return result
+
+    def __reduce__(self):
+        return OrderedDict, (list(self.items()),)
+
+
+class _LazyCheckpointUnpickler(pickle.Unpickler):
+    def __init__(self, file, path: str, record_prefix: str, records: Dict[str, zipfile.ZipInfo]):
+        super().__init__(file)
+        self._path = path
+        self._record_prefix = record_prefix
+        self._records = records
+
+    def find_class(self, module: str, name: str):
+        if module == 'torch' and name.endswith('Storage'):
+            if name not in _STORAGE_TYPE_NAME_VS_DTYPE:
+                raise _LazyLoadingNotSupported('unsupported storage type {}'.format(name))
+            return _STORAGE_TYPE_NAME_VS_DTYPE[name]
+        if module == 'torch._utils' and name == '_rebuild_tensor_v2':
+            return self._rebuild_tensor
+        if module == 'torch._utils' and name != '_rebuild_parameter':
+            raise _LazyLoadingNotSupported('unsupported tensor type {}'.format(name))
+        if module == 'torch._utils':
+            rebuild_parameter = super().find_class(module, name)
+            return lambda data, *args: rebuild_parameter(_maybe_materialize(data), *args)
+        return super().find_class(module, name)
+
+    def persistent_load(self, pid):
+        typename, dtype, key, _, numel = pid[:5]
+        if typename != 'storage':
+            raise _LazyLoadingNotSupported('unsupported persistent record {}'.format(typename))
+        record_name = self._record_prefix + 'data/' + key
+        if record_name not in self._records:
+            raise _LazyLoadingNotSupported('{} record is not found'.format(record_name))
+        return _LazyStorage(self._path, self._records[record_name], dtype, numel)
+
+    @staticmethod
+    def _rebuild_tensor(storage: _LazyStorage, storage_offset: int, size: Tuple[int, ...], stride: Tuple[int, ...],
+                        requires_grad: bool, *args) -> LazyTensor:
+        return LazyTensor(storage, storage_offset, size, stride, requires_grad)
+
+
+def _wrap_lazy_tensors(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        values = obj.values()
+        if values and all(isinstance(v, (LazyTensor, torch.Tensor)) for v in values):
+            state_dict = LazyStateDict()
+            for key, value in obj.items():
+                state_dict.set_lazy(key, value)
+            if hasattr(obj, '_metadata'):
+                state_dict._metadata = obj._metadata  # pylint:disable=attribute-defined-outside-init
+            return state_dict
+        for key, value in obj.items():
+            obj[key] = _wrap_lazy_tensors(value)
+        return obj
+    if isinstance(obj, list):
+        return [_wrap_lazy_tensors(v) for v in obj]
+    if isinstance(obj, tuple) and not hasattr(obj, '_fields'):
+        return tuple(_wrap_lazy_tensors(v) for v in obj)
+    if isinstance(obj, LazyTensor):
+        return obj.materialize()
+    if hasattr(obj, '__dict__') and not isinstance(obj, (type, torch.Tensor)):
+        for key, value in vars(obj).items():
+            setattr(obj, key, _wrap_lazy_tensors(value))
+    return obj
+
+
+def _load_checkpoint_lazily(path: str) -> Any:
+    with zipfile.ZipFile(path) as archive:
+        records = {info.filename: info for info in archive.infolist()}
+        names = list(records)
+        data_pkl_names = [name for name in names if name.endswith('data.pkl') and name.count('/') == 1]
+        if len(data_pkl_names) != 1:
+            raise _LazyLoadingNotSupported('data.pkl record is not found')
+        record_prefix = data_pkl_names[0][:-len('data.pkl')]
+        byteorder_record = record_prefix + 'byteorder'
+        if byteorder_record in names and archive.read(byteorder_record).decode() != sys.byteorder:
+            raise _LazyLoadingNotSupported('byte order of the checkpoint differs from the native one')
+        with archive.open(data_pkl_names[0]) as data_pkl:
+            checkpoint = _LazyCheckpointUnpickler(data_pkl, path, record_prefix, records).load()
+    return _wrap_lazy_tensors(checkpoint)
+
+
 class ParametersRegistry:
     """
     Provides an interface to register parameters and get access to all of them.
@@ -76,6 +329,22 @@ class ParametersRegistry:
 OPTIONAL_PARAMETERS_REGISTRY = ParametersRegistry()
 
 
+# Matches the index of the pre/post operation in the key, which is ignored on matching
+PRE_POST_OP_INDEX_PATTERN = re.compile('(pre_ops|post_ops)\\.(\\d+?)\\.op')
+
+# Legacy version-agnostic operation names in checkpoint keys vs the torch-specific operation names in model keys
+VERSION_AGNOSTIC_TO_SPECIFIC_NAMES = {'RELU': ('relu', 'relu_')}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_storage_names() -> Tuple[str, str, str]:
+    # Imported lazily to avoid the circular import of nncf_network
+    from nncf.torch.nncf_network import EXTERNAL_QUANTIZERS_STORAGE_NAME
+    from nncf.torch.nncf_network import LEGACY_ACT_STORAGE_NAME
+    from nncf.torch.nncf_network import MODEL_WRAPPED_BY_NNCF_ATTR_NAME
+    return MODEL_WRAPPED_BY_NNCF_ATTR_NAME, EXTERNAL_QUANTIZERS_STORAGE_NAME, LEGACY_ACT_STORAGE_NAME
+
+
 class ProcessedKeyStatus(Enum):
     """ Status of matching checkpoint key with model keys """
     MATCHED = 'Matched'
@@ -101,11 +370,11 @@ class ProcessedKeys:
 
     def add_skipped_and_missing_keys(self,
                                      model_state_dict: Dict[str, torch.Tensor]):
-        all_processed_keys = []
+        all_processed_keys = set()
         optional_param_names = OPTIONAL_PARAMETERS_REGISTRY.get_parameters_names()
         params_to_skip = tuple('.' + name for name in optional_param_names)
         for keys in self._keys.values():
-            all_processed_keys.extend(keys)
+            all_processed_keys.update(keys)
 
         for key in model_state_dict.keys():
             if key not in all_processed_keys:
@@ -155,6 +424,7 @@ class NormalizedKeys:
         self._unique_normalized_key_vs_orig_key_map = {}
         self.is_unified_group_detected = False
         self.has_legacy_storage_keys = False
+        keys_to_ignore = set(keys_to_ignore)
         unique_clipped_key_vs_orig_key_map, ignored_keys = self._clip_keys_without_collisions(keys, keys_to_ignore)
         self.ignored_orig_keys = ignored_keys
         ignored_keys = self._normalize_keys_without_collisions(unique_clipped_key_vs_orig_key_map, keys_to_ignore)
@@ -171,7 +441,7 @@ class NormalizedKeys:
 
     def _normalize_keys_without_collisions(self,
                                            unique_clipped_key_vs_orig_key_map: Dict[str, str],
-                                           keys_to_ignore: List[str]) -> List[str]:
+                                           keys_to_ignore: Set[str]) -> List[str]:
         ignored_keys = []
         normalized_key_vs_clipped_key_list_map = {}
         for clipped_key in unique_clipped_key_vs_orig_key_map:
@@ -202,7 +472,7 @@ class NormalizedKeys:
         return ignored_keys
 
     @staticmethod
-    def _clip_keys_without_collisions(keys: List[str], keys_to_ignore: List[str]) -> Tuple[Dict[str, str], List[str]]:
+    def _clip_keys_without_collisions(keys: List[str], keys_to_ignore: Set[str]) -> Tuple[Dict[str, str], List[str]]:
         clipped_key_vs_orig_key_list_map = {}
         ignored_keys = []
         for orig_key in keys:
@@ -228,17 +498,19 @@ class NormalizedKeys:
     @staticmethod
     def _key_clipper(key: str) -> str:
         new_key = key
-        from nncf.torch.nncf_network import MODEL_WRAPPED_BY_NNCF_ATTR_NAME
-        clip_patterns = [MODEL_WRAPPED_BY_NNCF_ATTR_NAME + '.', 'module.', '|OUTPUT', '|INPUT']
+        model_wrapped_by_nncf_attr_name, _, _ = _get_storage_names()
+        clip_patterns = [model_wrapped_by_nncf_attr_name + '.', 'module.', '|OUTPUT', '|INPUT']
         for pattern in clip_patterns:
-            new_key = new_key.replace(pattern, '')
+            if pattern in new_key:
+                new_key = new_key.replace(pattern, '')
         return new_key
 
     def _key_replacer(self, key: str) -> List[str]:
         new_key = key
 
-        match = re.search('(pre_ops|post_ops)\\.(\\d+?)\\.op', key)
-        new_key = new_key if not match else new_key.replace(match.group(), 'operation')
+        if 'ops.' in key:
+            match = PRE_POST_OP_INDEX_PATTERN.search(key)
+            new_key = new_key if not match else new_key.replace(match.group(), 'operation')
 
         new_key, did_replace = self._replace_legacy_act_quantizer_storage_name(new_key)
         if did_replace:
@@ -261,31 +533,29 @@ class NormalizedKeys:
             compression from scratch, but instead initialize group of parameters by one of the matched individual one.
             Returns original key if there's no ';' and operation doesn't start with EXTERNAL_QUANTIZERS_STORAGE_NAME
         """
+        if ';' not in new_key:
+            return [new_key]
         result = [new_key]
-        from nncf.torch.nncf_network import EXTERNAL_QUANTIZERS_STORAGE_NAME
-        if ';' in new_key and new_key.startswith(EXTERNAL_QUANTIZERS_STORAGE_NAME):
+        _, external_quantizers_storage_name, _ = _get_storage_names()
+        if new_key.startswith(external_quantizers_storage_name):
             group_of_keys = new_key.split(';')
             last_key = group_of_keys[-1]
             common_op = last_key.split('.')[-1]
             result = [
                 group_of_keys[0] + '.' + common_op,
-                EXTERNAL_QUANTIZERS_STORAGE_NAME + '.' + last_key
+                external_quantizers_storage_name + '.' + last_key
             ]
             for key in group_of_keys[1:-1]:
-                result.append(EXTERNAL_QUANTIZERS_STORAGE_NAME + '.' + key + '.' + common_op)
+                result.append(external_quantizers_storage_name + '.' + key + '.' + common_op)
         return result
 
     @staticmethod
     def _replace_legacy_act_quantizer_storage_name(checkpoint_key: str) -> Tuple[str, bool]:
-        did_replace = False
-        splits = checkpoint_key.split('.')
-        from nncf.torch.nncf_network import LEGACY_ACT_STORAGE_NAME
-        from nncf.torch.nncf_network import EXTERNAL_QUANTIZERS_STORAGE_NAME
-        if splits[0] == LEGACY_ACT_STORAGE_NAME:
-            did_replace = True
-            splits[0] = EXTERNAL_QUANTIZERS_STORAGE_NAME
-        reconstructed_key = '.'.join(splits)
-        return reconstructed_key, did_replace
+        _, external_quantizers_storage_name, legacy_act_storage_name = _get_storage_names()
+        storage_name, separator, rest_of_key = checkpoint_key.partition('.')
+        if storage_name == legacy_act_storage_name:
+            return external_quantizers_storage_name + separator + rest_of_key, True
+        return checkpoint_key, False
 
 
 class KeyMatcher:
@@ -308,7 +578,8 @@ class KeyMatcher:
 
         self.model_state_dict = model_state_dict
         self._processed_keys = ProcessedKeys()
-        self._new_dict = {}
+        self._is_lazy = isinstance(state_dict_to_load, LazyStateDict)
+        self._new_dict = LazyStateDict() if self._is_lazy else {}
         self._num_params_to_load = len(state_dict_to_load.items())
         self.ignored_keys = ignored_keys if ignored_keys else []
 
@@ -364,11 +635,17 @@ class KeyMatcher:
                                                              normalized_key_to_load)
             if normalized_key_to_load in normalized_model_keys:
                 model_key = normalized_model_keys.get_orig_key(normalized_key_to_load)
-                value_to_load = self.state_dict_to_load[key_to_load]
+                if self._is_lazy:
+                    value_to_load = self.state_dict_to_load.get_lazy(key_to_load)
+                else:
+                    value_to_load = self.state_dict_to_load[key_to_load]
                 size_of_value_to_load = value_to_load.size()
                 size_of_model_value = self.model_state_dict[model_key].size()
                 if size_of_value_to_load == size_of_model_value:
-                    self._new_dict[model_key] = value_to_load
+                    if self._is_lazy:
+                        self._new_dict.set_lazy(model_key, value_to_load)
+                    else:
+                        self._new_dict[model_key] = value_to_load
                     self._processed_keys.add_key(model_key, ProcessedKeyStatus.MATCHED)
                 else:
                     nncf_logger.warning("Different size of value of '{}' in resuming dictionary ({}) and in model ({})"
@@ -391,30 +668,27 @@ class KeyMatcher:
         :return: A mapping of the checkpoint key to a model key that matches version-agnostic names with their
             torch-specific counterparts.
         """
-        version_agnostic_to_specific_names = {"RELU": {"relu", "relu_"}}
         retval = {}
-        processed_keys_to_load = normalized_keys_to_load
+        # Hash set instead of the list to look up the checkpoint keys in constant time
+        keys_to_load = set(normalized_keys_to_load)
 
         for model_key in normalized_model_keys:
-            for agnostic_op_name, specific_op_name_set in version_agnostic_to_specific_names.items():
+            # Have to take care not to replace the matches to the class names
+            # The op names in existing checkpoint can only appear in external quantizers,
+            # i.e. external_quantizers.ResNet/ReLU[relu]/relu_0.signed_tensor, so only the portion
+            # after the last slash is rewritten
+            prefix, slash, last_portion = model_key.rpartition('/')
+            for agnostic_op_name, specific_op_names in VERSION_AGNOSTIC_TO_SPECIFIC_NAMES.items():
                 matches_for_curr_agnostic_op_name = []
                 has_specific_op_name = False
-                for specific_op_name in specific_op_name_set:
-                    # Have to take care not to replace the matches to the class names
-                    # The op names in existing checkpoint can only appear in external quantizers,
-                    # i.e. external_quantizers.ResNet/ReLU[relu]/relu_0.signed_tensor, so composing a regex to match
-                    # for that
-                    slash_split_str = model_key.split('/')
-                    last_portion = slash_split_str[-1]
+                for specific_op_name in specific_op_names:
+                    agnostic_version_of_model_key = model_key
                     if specific_op_name in last_portion:
-                        last_portion = last_portion.replace(specific_op_name, agnostic_op_name, 1)
+                        agnostic_version_of_model_key = prefix + slash + last_portion.replace(specific_op_name,
+                                                                                             agnostic_op_name, 1)
                         has_specific_op_name = True
-                    slash_split_str[-1] = last_portion
-                    agnostic_version_of_model_key = '/'.join(slash_split_str)
-                    processed_agnostic_version_of_model_key = agnostic_version_of_model_key
-                    if processed_agnostic_version_of_model_key in processed_keys_to_load:
-                        idx = processed_keys_to_load.index(processed_agnostic_version_of_model_key)
-                        matches_for_curr_agnostic_op_name.append(normalized_keys_to_load[idx])
+                    if agnostic_version_of_model_key in keys_to_load:
+                        matches_for_curr_agnostic_op_name.append(agnostic_version_of_model_key)
 
                 if not has_specific_op_name:
                     if matches_for_curr_agnostic_op_name:
@@ -18,6 +18,7 @@ from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 import torch
 
@@ -33,6 +34,19 @@ from nncf.torch.dynamic_graph.trace_tensor import TensorMeta
 
 _CURRENT_CONTEXT = None
 
+# In the scoped tracing mode the current context is only visible to the threads that have entered
+# a TracingContext, see enable_scoped_tracing()
+_SCOPED_TRACING_ENABLED = False
+
+
+class _ThreadTracingScopes(threading.local):
+    depth = 0
+
+
+_THREAD_TRACING_SCOPES = _ThreadTracingScopes()
+
+ROOT_SCOPE_ID = 0
+
 
 class PreHookId:
     def __init__(self, op_address: OperationAddress,
@@ -68,6 +82,7 @@ class TracingContext:
         self._save_context = None
         self._post_hooks = {}
         self._pre_hooks = {}  # type: Dict[PreHookId, List[Callable]]
+        self._pre_hook_ids_per_op_address = {}  # type: Dict[OperationAddress, List[PreHookId]]
         self._num_nested_hooks = 0
 
         self._threading = CopySafeThreadingVars()
@@ -82,7 +97,17 @@ class TracingContext:
 
         self._trace_dynamic_graph = False
 
+        self._is_frozen = False
+        self._frozen_op_addresses = {}  # type: Dict[Tuple[int, str, int], OperationAddress]
+
+        # Full scopes are interned into integer IDs so that the operator call counters
+        # are not keyed by the (expensive to build) string representation of the scope
+        self._scope_ids = {(): ROOT_SCOPE_ID}  # type: Dict[Tuple[ScopeElement, ...], int]
+        self._scope_elements_per_id = [()]  # type: List[Tuple[ScopeElement, ...]]
+        self._child_scope_ids = [[]]  # type: List[List[int]]
+
     def __enter__(self):
+        _enter_tracing_scope()
         global _CURRENT_CONTEXT
         self._save_context = _CURRENT_CONTEXT
         _CURRENT_CONTEXT = self
@@ -98,6 +123,7 @@ class TracingContext:
         global _CURRENT_CONTEXT
         _CURRENT_CONTEXT = self._save_context
         self._save_context = None
+        _exit_tracing_scope()
 
     def find_operator_node(self, tensor_metas: List[Optional[TensorMeta]],
                            op_address: OperationAddress) -> Optional[DynamicGraphNode]:
@@ -143,10 +169,11 @@ class TracingContext:
         order (e.g. if comments were added to the .py file with the model)
         """
 
-        call_order = self.get_operator_call_count_in_scope(operator_name, self.scope)
+        scope_id = self._current_scope_id
+        call_order = self._threading.thread_local.operator_counters.get(scope_id, {}).get(operator_name, 0)
 
         op_address = OperationAddress(operator_name,
-                                      self.scope,
+                                      Scope(list(self._scope_elements_per_id[scope_id])),
                                       call_order)
         return op_address
 
@@ -157,35 +184,62 @@ class TracingContext:
         """
         self._threading.thread_local.operator_counters = {}
 
-    @staticmethod
-    def _get_operator_counter_key(operator_name: str, scope: Scope):
-        return "{}_{}".format(str(scope), operator_name)
+    def _get_scope_id(self, scope_elements: Tuple[ScopeElement, ...]) -> int:
+        scope_id = self._scope_ids.get(scope_elements)
+        if scope_id is None:
+            with self._threading.cond:
+                scope_id = self._scope_ids.get(scope_elements)
+                if scope_id is None:
+                    parent_scope_id = self._get_scope_id(scope_elements[:-1])
+                    scope_id = len(self._scope_elements_per_id)
+                    self._scope_elements_per_id.append(scope_elements)
+                    self._child_scope_ids.append([])
+                    self._child_scope_ids[parent_scope_id].append(scope_id)
+                    self._scope_ids[scope_elements] = scope_id
+        return scope_id
+
+    @property
+    def _current_scope_id(self) -> int:
+        scope_ids = self._threading.thread_local.scope_ids
+        if scope_ids:
+            return scope_ids[-1]
+        return ROOT_SCOPE_ID
 
     def register_operator_call(self, operator_name: str, scope: Scope):
-        key = self._get_operator_counter_key(operator_name, scope)
-        if key in self._threading.thread_local.operator_counters:
-            self._threading.thread_local.operator_counters[key] += 1
-        else:
-            self._threading.thread_local.operator_counters[key] = 1
+        scope_id = self._get_scope_id(tuple(scope.scope_elements))
+        counters_in_scope = self._threading.thread_local.operator_counters.setdefault(scope_id, {})
+        counters_in_scope[operator_name] = counters_in_scope.get(operator_name, 0) + 1
 
     def get_operator_call_count_in_scope(self, operator_name: str, scope: Scope):
-        key = self._get_operator_counter_key(operator_name, scope)
-        if key in self._threading.thread_local.operator_counters:
-            return self._threading.thread_local.operator_counters[key]
-        return 0
+        scope_id = self._scope_ids.get(tuple(scope.scope_elements))
+        if scope_id is None:
+            return 0
+        return self._threading.thread_local.operator_counters.get(scope_id, {}).get(operator_name, 0)
 
     def reset_operator_call_count_in_scope(self, scope):
-        scoped_op_name = str(scope)
-        for key in self._threading.thread_local.operator_counters.keys():
-            if scoped_op_name in key:
-                self._threading.thread_local.operator_counters[key] = 0
+        """
+        Resets the operator call counters in the given scope and in all of its nested scopes.
+        """
+        scope_id = self._scope_ids.get(tuple(scope.scope_elements))
+        if scope_id is None:
+            return
+        operator_counters = self._threading.thread_local.operator_counters
+        scope_ids_to_reset = [scope_id]
+        while scope_ids_to_reset:
+            curr_scope_id = scope_ids_to_reset.pop()
+            operator_counters.pop(curr_scope_id, None)
+            scope_ids_to_reset.extend(self._child_scope_ids[curr_scope_id])
 
     def push_scope(self, called_module: torch.nn.Module):
         relative_scopes_list = self._get_scope_relative_to_last_registered_module_call(called_module)
+        parent_scope_elements = self._scope_elements_per_id[self._current_scope_id]
+        scope_id = self._get_scope_id(parent_scope_elements + tuple(relative_scopes_list.scope_elements))
         self.module_call_stack.append(called_module)
         self.relative_scopes_stack.append(relative_scopes_list)
+        self._threading.thread_local.scope_ids.append(scope_id)
 
     def pop_scope(self):
+        self._threading.thread_local.scope_ids.pop()
         self.relative_scopes_stack.pop()
         self.module_call_stack.pop()
 
@@ -196,14 +250,19 @@ class TracingContext:
             raise KeyError("Pre hook for context {} is already registered".format(str(pre_hook_id)))
         self._pre_hooks[pre_hook_id] = fn_list
 
+        # Keep the hook ids for each operation pre-sorted by the input port id so that
+        # the execution of the pre-hooks does not have to scan all the registered hooks
+        pre_hook_ids_for_op = self._pre_hook_ids_per_op_address.setdefault(op_address, [])
+        pre_hook_ids_for_op.append(pre_hook_id)
+        pre_hook_ids_for_op.sort(key=lambda x: x.input_port_id)
+
     def execute_pre_hooks(self, op_address: OperationAddress,
                           op_inputs: OperatorInput) -> OperatorInput:
         in_op = getattr(self, 'in_operator', False)
         self.in_operator = False
         self._threading.thread_local.num_nested_hooks += 1
 
-        pre_hook_ids_for_curr_op = [x for x in self._pre_hooks if x.op_address == op_address]
-        pre_hook_ids_for_curr_op = sorted(pre_hook_ids_for_curr_op, key=lambda x: x.input_port_id)
+        pre_hook_ids_for_curr_op = self._pre_hook_ids_per_op_address.get(op_address, [])
         for pre_hook_id in pre_hook_ids_for_curr_op:
             hook_list_for_current_input_port = self._pre_hooks[pre_hook_id]
             input_arg_to_process = pre_hook_id.input_port_id
@@ -213,6 +272,12 @@ class TracingContext:
         self.in_operator = in_op
         return op_inputs
 
+    def has_pre_hooks(self, op_address: OperationAddress) -> bool:
+        return op_address in self._pre_hook_ids_per_op_address
+
+    def has_post_hooks(self, op_address: OperationAddress) -> bool:
+        return op_address in self._post_hooks
+
     def register_post_hooks(self, fn_list: List[Callable], op_address: OperationAddress):
         if op_address in self._post_hooks:
             raise KeyError("Post hook for context {} is already registered".format(str(op_address)))
@@ -299,9 +364,51 @@ class TracingContext:
     def enable_trace_dynamic_graph(self):
         self._trace_dynamic_graph = True
 
+    @property
+    def is_frozen(self) -> bool:
+        return self._is_frozen and not self._trace_dynamic_graph
+
+    def freeze(self):
+        """
+        Switches the context to the frozen graph execution mode. In this mode the operations that are already
+        present in the dynamic graph are looked up by the integer id of the current scope, the operator name
+        and the call order, without building the operation address, and are dispatched directly to
+        the registered hooks. The operator input is only processed for the operations with pre-hooks and
+        the post-hooks are only dispatched for the operations that have them. Operations unknown to the graph
+        (i.e. when the control flow of the model diverges from the traced one) are still processed
+        by the regular tracing path.
+        """
+        if self.graph.is_graph_with_iteration_modules():
+            raise RuntimeError("Frozen graph execution mode is not supported for models with iteration modules")
+        frozen_op_addresses = {}
+        for node in self.graph.get_all_nodes():
+            op_address = node.op_exec_context.op_address
+            scope_id = self._get_scope_id(tuple(op_address.scope_in_model.scope_elements))
+            frozen_op_addresses[(scope_id, op_address.operator_name, op_address.call_order)] = op_address
+        self._frozen_op_addresses = frozen_op_addresses
+        self._is_frozen = True
+
+    def unfreeze(self):
+        self._is_frozen = False
+        self._frozen_op_addresses = {}
+
+    def get_frozen_operation_address(self, operator_name: str) -> Optional[OperationAddress]:
+        """
+        Returns the address of the next call of the operator in the current scope if this operation is
+        present in the frozen graph, otherwise None.
+        """
+        scope_id = self._current_scope_id
+        call_order = self._threading.thread_local.operator_counters.get(scope_id, {}).get(operator_name, 0)
+        return self._frozen_op_addresses.get((scope_id, operator_name, call_order))
+
+    def register_operator_call_in_current_scope(self, operator_name: str):
+        counters_in_scope = self._threading.thread_local.operator_counters.setdefault(self._current_scope_id, {})
+        counters_in_scope[operator_name] = counters_in_scope.get(operator_name, 0) + 1
+
     def _reset_thread_local(self):
         tl = self._threading.thread_local
         tl.scopes = []
+        tl.scope_ids = []
         tl.module_call_stack = []
         tl.in_operator = False
         tl.num_nested_hooks = 0
@@ -339,17 +446,41 @@ class TracingContext:
 
     @property
     def scope(self) -> Scope:
-        stack_copy = self.relative_scopes_stack.copy()
-        scope_el_list = []
-        for relative_scope in stack_copy:
-            for scope_element in relative_scope.scope_elements:
-                scope_el_list.append(scope_element)
-        return Scope(scope_el_list)
+        return Scope(list(self._scope_elements_per_id[self._current_scope_id]))
 
     def reset_graph(self):
+        self.unfreeze()
         self.graph = DynamicGraph()
 
 
+def _enter_tracing_scope():
+    _THREAD_TRACING_SCOPES.depth += 1
+
+
+def _exit_tracing_scope():
+    _THREAD_TRACING_SCOPES.depth -= 1
+
+
+def enable_scoped_tracing():
+    """
+    Switches to the mode in which the operator calls are only traced by the threads that have entered
+    a TracingContext, e.g. by calling the forward of an NNCFNetwork. The torch operators stay patched
+    for the entire process, but in the other threads the patched operators call the original ones right away,
+    so that e.g. the uncompressed models run by the other threads are neither traced nor hooked while
+    an NNCFNetwork is being executed.
+    """
+    global _SCOPED_TRACING_ENABLED
+    _SCOPED_TRACING_ENABLED = True
+
+
+def disable_scoped_tracing():
+    """
+    Switches back to the mode in which the active TracingContext traces the operator calls of all threads.
+    """
+    global _SCOPED_TRACING_ENABLED
+    _SCOPED_TRACING_ENABLED = False
+
+
 @contextmanager
 def no_nncf_trace():
     ctx = get_current_context()
@@ -372,4 +503,6 @@ def forward_nncf_trace():
 
 
 def get_current_context() -> TracingContext:
+    if _SCOPED_TRACING_ENABLED and not _THREAD_TRACING_SCOPES.depth:
+        return None
     return _CURRENT_CONTEXT
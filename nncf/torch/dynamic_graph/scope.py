@@ -57,7 +57,7 @@ class Scope:
         return '/'.join([str(scope_el) for scope_el in self.scope_elements])
 
     def __hash__(self):
-        return hash(str(self))
+        return hash(tuple(self.scope_elements))
 
     def __eq__(self, other: 'Scope'):
         return self.scope_elements == other.scope_elements
@@ -30,8 +30,10 @@ from nncf.common.graph.layer_attributes import GroupNormLayerAttributes
 from nncf.common.graph.layer_attributes import LinearLayerAttributes
 from nncf.common.utils.logger import logger as nncf_logger
 from nncf.common.utils.debug import is_debug
+from nncf.torch.dynamic_graph.context import TracingContext
 from nncf.torch.dynamic_graph.context import get_current_context
 from nncf.torch.dynamic_graph.op_input_processing import OperatorInput
+from nncf.torch.dynamic_graph.operation_address import OperationAddress
 from nncf.torch.dynamic_graph.trace_tensor import make_tensor_metas
 from nncf.torch.dynamic_graph.trace_tensor import trace_tensors
 from nncf.torch.layer_utils import _NNCFModuleMixin
@@ -93,44 +95,13 @@ def wrap_operator(operator, operator_info: 'PatchedOperatorInfo'):
                 from nncf.torch.dynamic_graph.trace_functions import forward_trace_only
                 result = forward_trace_only(operator, *args, **kwargs)
             else:
-                node = None
                 op_name = operator_info.name
-                op_address = ctx.get_caller_context(op_name)
-
-                layer_attrs = None
-                ignored_algos = []
-                # Collect module attributes, if required
-                if ctx.trace_dynamic_graph:
-                    if op_name in OP_NAMES_REQUIRING_MODULE_ATTRS:
-                        curr_module = ctx.get_current_module()
-                        if curr_module is None:
-                            raise RuntimeError("Operation {} requires module attributes, "
-                                               "but it was executed outside any module".format(op_name))
-                        layer_attrs = _get_layer_attributes(curr_module, op_name)
-                        if isinstance(curr_module, _NNCFModuleMixin):
-                            ignored_algos = deepcopy(curr_module.ignored_algorithms)
-
-                ctx.register_operator_call(op_address.operator_name, op_address.scope_in_model)
-                op_input = OperatorInput(list(args), kwargs)
-                processed_input = ctx.execute_pre_hooks(op_address, op_input)
-
-                if ctx.trace_dynamic_graph:
-                    tensor_metas = make_tensor_metas(processed_input)
-                    node = ctx.find_operator_node(tensor_metas, op_address)
-
-                args = tuple(processed_input.op_args)
-                kwargs = processed_input.op_kwargs
-                result = operator(*args, **kwargs)
-
-                if isinstance(result, type(NotImplemented)):
-                    nncf_logger.debug("Operation {} returned NotImplemented".format(op_name))
-                elif ctx.trace_dynamic_graph and node is None:
-                    node = ctx.maybe_add_node(processed_input, tensor_metas, op_address, layer_attrs, ignored_algos)
-
-                if is_debug() and ctx.trace_dynamic_graph and node is not None:
-                    ctx.register_node_call(node)
-                result = trace_tensors(result, node)
-                result = ctx.execute_post_hooks(op_address, result)
+                op_address = ctx.get_frozen_operation_address(op_name) if ctx.is_frozen else None
+                if op_address is not None:
+                    result = _execute_frozen_operator(operator, ctx, op_address, args, kwargs)
+                else:
+                    op_address = ctx.get_caller_context(op_name)
+                    result = _execute_traced_operator(operator, ctx, op_address, args, kwargs)
         except:
             # Looks like the __repr__ call made during IDE debug to display tensor contents does not exit properly,
             # but instead throws an exception. This try...except block handles such a situation.
@@ -147,6 +118,70 @@ def wrap_operator(operator, operator_info: 'PatchedOperatorInfo'):
     return wrapped
 
 
+def _execute_traced_operator(operator, ctx: TracingContext, op_address: OperationAddress, args, kwargs):
+    node = None
+    op_name = op_address.operator_name
+
+    layer_attrs = None
+    ignored_algos = []
+    # Collect module attributes, if required
+    if ctx.trace_dynamic_graph:
+        if op_name in OP_NAMES_REQUIRING_MODULE_ATTRS:
+            curr_module = ctx.get_current_module()
+            if curr_module is None:
+                raise RuntimeError("Operation {} requires module attributes, "
+                                   "but it was executed outside any module".format(op_name))
+            layer_attrs = _get_layer_attributes(curr_module, op_name)
+            if isinstance(curr_module, _NNCFModuleMixin):
+                ignored_algos = deepcopy(curr_module.ignored_algorithms)
+
+    ctx.register_operator_call(op_address.operator_name, op_address.scope_in_model)
+    op_input = OperatorInput(list(args), kwargs)
+    processed_input = ctx.execute_pre_hooks(op_address, op_input)
+
+    if ctx.trace_dynamic_graph:
+        tensor_metas = make_tensor_metas(processed_input)
+        node = ctx.find_operator_node(tensor_metas, op_address)
+
+    args = tuple(processed_input.op_args)
+    kwargs = processed_input.op_kwargs
+    result = operator(*args, **kwargs)
+
+    if isinstance(result, type(NotImplemented)):
+        nncf_logger.debug("Operation {} returned NotImplemented".format(op_name))
+    elif ctx.trace_dynamic_graph and node is None:
+        node = ctx.maybe_add_node(processed_input, tensor_metas, op_address, layer_attrs, ignored_algos)
+
+    if is_debug() and ctx.trace_dynamic_graph and node is not None:
+        ctx.register_node_call(node)
+    result = trace_tensors(result, node)
+    result = ctx.execute_post_hooks(op_address, result)
+    return result
+
+
+def _execute_frozen_operator(operator, ctx: TracingContext, op_address: OperationAddress, args, kwargs):
+    """
+    Executes the operator in the frozen graph mode. The operation address is taken from the frozen graph instead
+    of being built from the current scope, the operator input index is only built if the operation has pre-hooks
+    registered and the post-hooks are only dispatched if the operation has them.
+    """
+    op_name = op_address.operator_name
+    ctx.register_operator_call_in_current_scope(op_name)
+    if ctx.has_pre_hooks(op_address):
+        processed_input = ctx.execute_pre_hooks(op_address, OperatorInput(list(args), kwargs))
+        args = tuple(processed_input.op_args)
+        kwargs = processed_input.op_kwargs
+    result = operator(*args, **kwargs)
+
+    if isinstance(result, type(NotImplemented)):
+        nncf_logger.debug("Operation {} returned NotImplemented".format(op_name))
+
+    result = trace_tensors(result, None)
+    if ctx.has_post_hooks(op_address):
+        result = ctx.execute_post_hooks(op_address, result)
+    return result
+
+
 def wrap_module_call(module_call):
     def wrapped(self, *args, **kwargs):
         ctx = get_current_context()
@@ -20,6 +20,7 @@ from nncf.common.exporter import Exporter
 from nncf.torch.dynamic_graph.graph_tracer import create_dummy_forward_fn
 from nncf.torch.dynamic_graph.graph_tracer import create_mock_tensor
 from nncf.torch.nested_objects_traversal import objwalk
+from nncf.torch.quantization.weights_packing import save_packed_checkpoint
 from nncf.torch.utils import is_tensor, get_model_device
 
 
@@ -44,10 +45,12 @@ def count_tensors(model_retval: Any) -> int:
 
 class PTExporter(Exporter):
     """
-    This class provides export of the compressed model to the ONNX format.
+    This class provides export of the compressed model to the ONNX format
+    or to the compact checkpoint with the packed integer weights.
     """
 
     _ONNX_FORMAT = 'onnx'
+    _PACKED_CHECKPOINT_FORMAT = 'packed_checkpoint'
 
     def export_model(self, save_path: str, save_format: Optional[str] = None) -> None:
         """
@@ -57,6 +60,9 @@ class PTExporter(Exporter):
         :param save_format: Saving format.
             One of the following:
                 - `onnx` for export to the ONNX format.
+                - `packed_checkpoint` for export to the checkpoint with the quantized weights
+                stored as the 8-bit or packed 4-bit integer codes, which can be loaded
+                by `nncf.torch.load_packed_checkpoint`.
             The ONNX format will be used if `save_format` is not specified.
         """
         if save_format is None:
@@ -64,6 +70,7 @@ class PTExporter(Exporter):
 
         format_to_export_fn = {
             PTExporter._ONNX_FORMAT: self._export_to_onnx,
+            PTExporter._PACKED_CHECKPOINT_FORMAT: self._export_to_packed_checkpoint,
         }
 
         export_fn = format_to_export_fn.get(save_format)
@@ -75,6 +82,14 @@ class PTExporter(Exporter):
 
         export_fn(save_path)
 
+    def _export_to_packed_checkpoint(self, save_path: str) -> None:
+        """
+        Exports the compressed model to the checkpoint with the packed integer weights.
+
+        :param save_path: The path where the checkpoint will be saved.
+        """
+        save_packed_checkpoint(self._model, save_path)
+
     def _export_to_onnx(self, save_path: str) -> None:
         """
         Exports the compressed model to the ONNX format.
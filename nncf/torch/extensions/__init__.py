@@ -1,11 +1,28 @@
 import enum
+import importlib
+import os
+import subprocess  # nosec
+import sys
+import threading
+from typing import List, Optional, Type
+
 import torch
 
 from abc import ABC, abstractmethod
+from nncf.common.utils.logger import logger as nncf_logger
 from nncf.common.utils.registry import Registry
+from nncf.version import __version__ as nncf_version
 
 EXTENSIONS = Registry('extensions')
 
+# Package where the extensions built ahead of time by setup.py are placed
+PREBUILT_EXTENSIONS_PACKAGE = 'nncf.torch.extensions'
+
+# Set this variable to change the location of the persistent JIT build cache for the extensions.
+# If TORCH_EXTENSIONS_DIR is set, the extensions are built in the location controlled by PyTorch instead.
+NNCF_EXTENSIONS_DIR_ENV_VAR = 'NNCF_EXTENSIONS_DIR'
+DEFAULT_NNCF_EXTENSIONS_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'nncf', 'torch_extensions')
+
 
 class ExtensionsType(enum.Enum):
     CPU = 0
@@ -23,6 +40,90 @@ class ExtensionLoader(ABC):
     def load():
         pass
 
+    @staticmethod
+    def fallback():
+        """
+        Returns an object providing the same functions as the extension, implemented without
+        C++ code, to be used when the extension cannot be built, or None if there is no such object.
+        """
+        return None
+
+
+def get_build_directory(name: str) -> Optional[str]:
+    """
+    Returns the directory where the JIT build of the extension with the given name is cached.
+    The directory is keyed by the versions of NNCF, PyTorch, CUDA and Python, so that the
+    build is reused by all the processes running in the same environment and is not
+    rebuilt back and forth by different environments sharing the cache location.
+
+    :param name: The name of the extension.
+    :return: The path to the build directory, or None if TORCH_EXTENSIONS_DIR is set and the
+        directory should be chosen by PyTorch.
+    """
+    if 'TORCH_EXTENSIONS_DIR' in os.environ:
+        return None
+    cache_dir = os.environ.get(NNCF_EXTENSIONS_DIR_ENV_VAR, DEFAULT_NNCF_EXTENSIONS_DIR)
+    version_key = 'nncf_{}_torch_{}_cuda_{}_py{}{}'.format(nncf_version, torch.__version__, torch.version.cuda,
+                                                        sys.version_info.major, sys.version_info.minor)
+    version_key = ''.join(c if c.isalnum() or c in '._' else '_' for c in version_key)
+    build_directory = os.path.join(cache_dir, version_key, name)
+    os.makedirs(build_directory, exist_ok=True)
+    return build_directory
+
+
+def load_extension(name: str, sources: List[str], extra_include_paths: List[str] = None,
+                   extra_cflags: List[str] = None, extra_ldflags: List[str] = None):
+    """
+    Returns the extension built ahead of time during NNCF installation if it is available and
+    compatible with the current environment, otherwise builds the extension just in time
+    or reuses a previous build from the persistent build cache.
+    """
+    try:
+        return importlib.import_module('{}.{}'.format(PREBUILT_EXTENSIONS_PACKAGE, name))
+    except ImportError:
+        pass
+    # Importing the module is relatively slow, so it is done only if the extension needs to be built
+    from torch.utils.cpp_extension import load  # pylint:disable=import-outside-toplevel
+    return load(name, sources, extra_cflags=extra_cflags, extra_ldflags=extra_ldflags,
+                extra_include_paths=extra_include_paths, build_directory=get_build_directory(name),
+                verbose=False)
+
+
+class LazyExtension:
+    """
+    Provides access to the functions of the extension, which is loaded (and built, if needed)
+    on the first access instead of the import time. If the extension cannot be built, e.g.
+    because no compiler is available, the fallback implementation of the loader is used instead.
+    """
+
+    def __init__(self, loader: Type[ExtensionLoader]):
+        self._loader = loader
+        self._extension = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        if self._extension is None:
+            with self._lock:
+                if self._extension is None:
+                    self._extension = self._load()
+        return self._extension
+
+    def _load(self):
+        try:
+            return self._loader.load()
+        except (RuntimeError, OSError, ImportError, subprocess.SubprocessError) as e:
+            fallback = self._loader.fallback()
+            if fallback is None:
+                raise
+            reason = str(e).splitlines()[0] if str(e) else type(e).__name__
+            nncf_logger.warning('Could not load the {} extension, the slower PyTorch implementation will be used '
+                                'instead. Reason: {}'.format(self._loader.__name__, reason))
+            nncf_logger.debug('Extension loading error:\n{}'.format(e))
+            return fallback
+
+    def __getattr__(self, item):
+        return getattr(self.get(), item)
+
 
 def _force_build_extensions(ext_type: ExtensionsType):
     for class_type in EXTENSIONS.registry_dict.values():
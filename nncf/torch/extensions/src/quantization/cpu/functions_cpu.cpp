@@ -1,8 +1,227 @@
+#include <algorithm>
+#include <cmath>
+#include <limits>
+#include <vector>
+
+#include <ATen/AccumulateType.h>
+#include <ATen/Parallel.h>
+
 #include "common_cpu_funcs.h"
 #include "common_defs.h"
 
 namespace {
 
+// Number of elements below which the fused kernels do not spawn extra threads
+constexpr int64_t GRAIN_SIZE = 32768;
+
+template <typename scalar_t>
+struct ComputeType { using type = scalar_t; };
+
+template <>
+struct ComputeType<at::Half> { using type = float; };
+
+// Describes how the scale elements map onto the elements of a contiguous input:
+// the input is a sequence of blocks of `elements_per_scale` elements each, and
+// the block with index `i` uses the scale element with index `i % scale_count`.
+struct ScaleLayout {
+    int64_t scale_count;
+    int64_t elements_per_scale;
+};
+
+// Returns false if the scale is neither per-tensor nor per-channel along a single
+// dimension of the input, i.e. the fused kernels are not applicable.
+bool get_scale_layout(const at::Tensor& input, const at::Tensor& scale, ScaleLayout& layout) {
+    if (scale.numel() == 1) {
+        layout = {1, std::max<int64_t>(input.numel(), 1)};
+        return true;
+    }
+    if (scale.dim() != input.dim()) {
+        return false;
+    }
+    int64_t channel_dim = -1;
+    for (int64_t dim_idx = 0; dim_idx < scale.dim(); dim_idx++) {
+        if (scale.size(dim_idx) != 1) {
+            if (channel_dim != -1 || scale.size(dim_idx) != input.size(dim_idx)) {
+                return false;
+            }
+            channel_dim = dim_idx;
+        }
+    }
+    int64_t elements_per_scale = 1;
+    for (int64_t dim_idx = channel_dim + 1; dim_idx < input.dim(); dim_idx++) {
+        elements_per_scale *= input.size(dim_idx);
+    }
+    layout = {scale.size(channel_dim), std::max<int64_t>(elements_per_scale, 1)};
+    return true;
+}
+
+// Same as std::nearbyint in the default rounding mode, but can be vectorized by the compiler:
+// adding and subtracting 2^(number of mantissa bits) rounds half to even, larger values are integral.
+template <typename T>
+inline T round_half_to_even(T value) {
+    constexpr T threshold = T(1) / std::numeric_limits<T>::epsilon();
+    T abs_value = std::fabs(value);
+    T rounded = (abs_value + threshold) - threshold;
+    return abs_value < threshold ? std::copysign(rounded, value) : value;
+}
+
+template <typename scalar_t>
+struct FakeQuantizeParams {
+    using compute_t = typename ComputeType<scalar_t>::type;
+
+    FakeQuantizeParams(scalar_t input_low, scalar_t input_range, scalar_t levels) {
+        low = static_cast<compute_t>(input_low);
+        high = low + static_cast<compute_t>(input_range);
+        s = (static_cast<compute_t>(levels) - 1) / static_cast<compute_t>(input_range);
+        zero_point = std::nearbyint(-low * s);
+        reverted_range = 1 / static_cast<compute_t>(input_range);
+    }
+
+    inline compute_t quantize(compute_t x) const {
+        compute_t output = high < x ? high : x;
+        output = output < low ? low : output;
+        output = round_half_to_even((output - low) * s - zero_point);
+        return output / s;
+    }
+
+    compute_t low;
+    compute_t high;
+    compute_t s;
+    compute_t zero_point;
+    compute_t reverted_range;
+};
+
+// Single pass over the input which writes directly to the preallocated output
+template <typename scalar_t>
+at::Tensor q_cpu_fused_forward(
+        const at::Tensor& input,
+        const at::Tensor& input_low,
+        const at::Tensor& input_range,
+        scalar_t levels,
+        const ScaleLayout& layout) {
+    using compute_t = typename ComputeType<scalar_t>::type;
+
+    auto input_ = input.contiguous();
+    auto input_low_ = input_low.contiguous();
+    auto input_range_ = input_range.contiguous();
+    auto output = at::empty_like(input_, at::MemoryFormat::Contiguous);
+
+    const scalar_t* input_data = input_.data_ptr<scalar_t>();
+    const scalar_t* input_low_data = input_low_.data_ptr<scalar_t>();
+    const scalar_t* input_range_data = input_range_.data_ptr<scalar_t>();
+    scalar_t* output_data = output.data_ptr<scalar_t>();
+
+    at::parallel_for(0, input_.numel(), GRAIN_SIZE, [&](int64_t begin, int64_t end) {
+        int64_t idx = begin;
+        while (idx < end) {
+            int64_t block_idx = idx / layout.elements_per_scale;
+            int64_t block_end = std::min(end, (block_idx + 1) * layout.elements_per_scale);
+            int64_t scale_idx = block_idx % layout.scale_count;
+            const FakeQuantizeParams<scalar_t> params(input_low_data[scale_idx], input_range_data[scale_idx], levels);
+            #pragma omp simd
+            for (int64_t i = idx; i < block_end; i++) {
+                compute_t x = input_data[i];
+                output_data[i] = static_cast<scalar_t>(params.quantize(x));
+            }
+            idx = block_end;
+        }
+    });
+    return output;
+}
+
+// Computes all the gradients in a single pass over the input. The gradients w.r.t. the
+// scale parameters are accumulated into per-chunk partial sums which are reduced afterwards,
+// so that no intermediate tensors of the input size are allocated besides grad_input.
+template <typename scalar_t>
+std::vector<at::Tensor> q_cpu_fused_backward(
+        const at::Tensor& grad_output,
+        const at::Tensor& input,
+        const at::Tensor& input_low,
+        const at::Tensor& input_range,
+        scalar_t levels,
+        scalar_t levels_low,
+        scalar_t levels_high,
+        bool is_asymmetric,
+        const ScaleLayout& layout) {
+    using compute_t = typename ComputeType<scalar_t>::type;
+    using acc_t = at::acc_type<scalar_t, /*is_cuda=*/false>;
+
+    auto grad_output_ = grad_output.contiguous();
+    auto input_ = input.contiguous();
+    auto input_low_ = input_low.contiguous();
+    auto input_range_ = input_range.contiguous();
+    auto grad_input = at::empty_like(input_, at::MemoryFormat::Contiguous);
+
+    const scalar_t* grad_output_data = grad_output_.data_ptr<scalar_t>();
+    const scalar_t* input_data = input_.data_ptr<scalar_t>();
+    const scalar_t* input_low_data = input_low_.data_ptr<scalar_t>();
+    const scalar_t* input_range_data = input_range_.data_ptr<scalar_t>();
+    scalar_t* grad_input_data = grad_input.data_ptr<scalar_t>();
+
+    const int64_t numel = input_.numel();
+    const int64_t scale_count = layout.scale_count;
+    const compute_t alpha = static_cast<compute_t>(levels_low) / static_cast<compute_t>(levels_high);
+    const int64_t num_chunks = std::max<int64_t>(
+        std::min<int64_t>(at::get_num_threads(), at::divup(numel, GRAIN_SIZE)), 1);
+    const int64_t chunk_size = at::divup(numel, num_chunks);
+
+    std::vector<acc_t> partial_grad_range(num_chunks * scale_count, 0);
+    std::vector<acc_t> partial_grad_low(num_chunks * scale_count, 0);
+
+    at::parallel_for(0, num_chunks, 1, [&](int64_t chunk_begin, int64_t chunk_end) {
+        for (int64_t chunk_idx = chunk_begin; chunk_idx < chunk_end; chunk_idx++) {
+            int64_t idx = chunk_idx * chunk_size;
+            const int64_t end = std::min(numel, idx + chunk_size);
+            while (idx < end) {
+                int64_t block_idx = idx / layout.elements_per_scale;
+                int64_t block_end = std::min(end, (block_idx + 1) * layout.elements_per_scale);
+                int64_t scale_idx = block_idx % scale_count;
+                const FakeQuantizeParams<scalar_t> params(input_low_data[scale_idx], input_range_data[scale_idx], levels);
+                acc_t grad_range_sum = 0;
+                acc_t grad_low_sum = 0;
+                #pragma omp simd reduction(+:grad_range_sum, grad_low_sum)
+                for (int64_t i = idx; i < block_end; i++) {
+                    compute_t x = input_data[i];
+                    compute_t grad = grad_output_data[i];
+                    bool is_hi = x > params.high;
+                    bool is_lo = x < params.low;
+                    bool is_outside = is_hi || is_lo;
+                    compute_t err = (params.quantize(x) - x) * params.reverted_range;
+                    compute_t grad_range = is_hi ? grad : (is_lo ? alpha * grad : err * grad);
+                    grad_input_data[i] = static_cast<scalar_t>(is_outside ? compute_t(0) : grad);
+                    grad_range_sum += grad_range;
+                    grad_low_sum += is_outside ? grad : compute_t(0);
+                }
+                idx = block_end;
+                partial_grad_range[chunk_idx * scale_count + scale_idx] += grad_range_sum;
+                partial_grad_low[chunk_idx * scale_count + scale_idx] += grad_low_sum;
+            }
+        }
+    });
+
+    auto grad_input_range = at::empty_like(input_range_, at::MemoryFormat::Contiguous);
+    auto grad_input_low = at::empty_like(input_low_, at::MemoryFormat::Contiguous);
+    scalar_t* grad_input_range_data = grad_input_range.data_ptr<scalar_t>();
+    scalar_t* grad_input_low_data = grad_input_low.data_ptr<scalar_t>();
+    for (int64_t scale_idx = 0; scale_idx < scale_count; scale_idx++) {
+        acc_t grad_range_sum = 0;
+        acc_t grad_low_sum = 0;
+        for (int64_t chunk_idx = 0; chunk_idx < num_chunks; chunk_idx++) {
+            grad_range_sum += partial_grad_range[chunk_idx * scale_count + scale_idx];
+            grad_low_sum += partial_grad_low[chunk_idx * scale_count + scale_idx];
+        }
+        grad_input_range_data[scale_idx] = static_cast<scalar_t>(grad_range_sum);
+        grad_input_low_data[scale_idx] = static_cast<scalar_t>(grad_low_sum);
+    }
+
+    if (is_asymmetric) {
+        return {grad_input, grad_input_low, grad_input_range};
+    }
+    auto dummy_variable = torch::autograd::make_variable(at::empty(input_low.sizes()), true);
+    return {grad_input, dummy_variable, grad_input_range};
+}
+
+// Generic implementation for scales of arbitrary broadcastable shapes
 template <typename scalar_t>
 at::Tensor q_cpu_forward(
         at::Tensor input,
@@ -79,9 +298,17 @@ at::Tensor q_forward(
         TORCH_CHECK(input_low.size(i) == input_range.size(i), "input_low and input_range have different dimension sizes");
     }
 
+    ScaleLayout layout;
+    bool is_fusable = input_range.scalar_type() == input.scalar_type() &&
+                      get_scale_layout(input, input_range, layout);
+
     at::Tensor output;
     AT_DISPATCH_FLOATING_TYPES_AND_HALF(input.type(), "q_cpu_forward", ([&] {
-      output = q_cpu_forward<scalar_t>(input, input_low, input_range, levels);
+      if (is_fusable) {
+        output = q_cpu_fused_forward<scalar_t>(input, input_low, input_range, levels, layout);
+      } else {
+        output = q_cpu_forward<scalar_t>(input, input_low, input_range, levels);
+      }
     }));
 
     return output;
@@ -101,9 +328,19 @@ std::vector<at::Tensor> q_backward(
     CHECK_INPUT(input_low);
     CHECK_INPUT(input_range);
 
+    ScaleLayout layout;
+    bool is_fusable = grad_output.sizes() == input.sizes() &&
+                      grad_output.scalar_type() == input.scalar_type() &&
+                      input_range.scalar_type() == input.scalar_type() &&
+                      get_scale_layout(input, input_range, layout);
+
     std::vector<at::Tensor> results;
     AT_DISPATCH_FLOATING_TYPES_AND_HALF(input.type(), "q_cpu_backward", ([&] {
-        results = q_cpu_backward<scalar_t>(grad_output, input, input_low, input_range, levels, level_low, level_high, is_asymmetric);
+        if (is_fusable) {
+            results = q_cpu_fused_backward<scalar_t>(grad_output, input, input_low, input_range, levels, level_low, level_high, is_asymmetric, layout);
+        } else {
+            results = q_cpu_backward<scalar_t>(grad_output, input, input_low, input_range, levels, level_low, level_high, is_asymmetric);
+        }
     }));
 
     return results;
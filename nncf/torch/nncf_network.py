@@ -386,6 +386,20 @@ class NNCFNetwork(nn.Module, PostGraphBuildActing):
     def disable_dynamic_graph_building(self):
         self._compressed_context.disable_node_additions()
 
+    def enable_frozen_graph_mode(self):
+        """
+        Enables the opt-in frozen graph execution mode, which reduces the per-operation tracing overhead of
+        the forward calls once the compressed graph is stable. Operations that were not encountered while
+        building the graph are still executed with full tracing.
+        """
+        self._compressed_context.freeze()
+
+    def disable_frozen_graph_mode(self):
+        self._compressed_context.unfreeze()
+
+    def is_frozen_graph_mode_enabled(self) -> bool:
+        return self._compressed_context.is_frozen
+
     def _get_dummy_forward_fn_for_graph_building(self, with_input_tracing, with_output_tracing):
         if self._user_dummy_forward_fn is None:
             return create_dummy_forward_fn(self.input_infos,
@@ -434,12 +448,15 @@ class NNCFNetwork(nn.Module, PostGraphBuildActing):
         return get_all_modules_by_type(self.get_nncf_wrapped_model(), nncf_module_names_list)
 
     def rebuild_graph(self, *input_args):
+        was_frozen = self._compressed_context.is_frozen
         self._compressed_context.reset_graph()
         dummy_forward_fn = self._get_dummy_forward_fn_for_graph_building(with_input_tracing=False,
                                                                          with_output_tracing=False)
         builder = GraphBuilder(dummy_forward_fn)
         self._compressed_graph = builder.build_graph(self, self._compressed_context,
                                                      input_infos=self.input_infos)
+        if was_frozen:
+            self._compressed_context.freeze()
 
     def post_build_graph_actions(self):
         # Reset initialization flags (`initialized`) for all quantization modules
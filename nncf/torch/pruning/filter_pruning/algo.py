@@ -12,6 +12,7 @@
 """
 
 import json
+import time
 from typing import Dict, List, Tuple, Union
 
 import numpy as np
@@ -31,6 +32,7 @@ from nncf.common.pruning.mask_propagation import MaskPropagationAlgorithm
 from nncf.common.pruning.schedulers import PRUNING_SCHEDULERS
 from nncf.common.pruning.schedulers import PruningScheduler
 from nncf.common.pruning.statistics import FilterPruningStatistics
+from nncf.common.pruning.statistics import PrunedModelExportStatistics
 from nncf.common.pruning.statistics import PrunedModelTheoreticalBorderline
 from nncf.common.pruning.statistics import PrunedLayerSummary
 from nncf.common.pruning.statistics import PrunedModelStatistics
@@ -66,6 +68,7 @@ from nncf.torch.layers import NNCF_PRUNING_MODULES_DICT
 from nncf.torch.nncf_network import NNCFNetwork
 from nncf.torch.pruning.base_algo import BasePruningAlgoBuilder
 from nncf.torch.pruning.base_algo import BasePruningAlgoController
+from nncf.torch.pruning.operations import ModelPruner
 from nncf.torch.pruning.operations import PTElementwisePruningOp
 from nncf.torch.pruning.operations import PT_PRUNING_OPERATOR_METATYPES
 from nncf.torch.pruning.tensor_processor import PTNNCFPruningTensorProcessor
@@ -76,6 +79,7 @@ from nncf.torch.pruning.filter_pruning.global_ranking.legr import LeGR
 from nncf.torch.pruning.filter_pruning.layers import FilterPruningMask
 from nncf.torch.pruning.structs import PrunedModuleInfo
 from nncf.torch.pruning.utils import init_output_masks_in_graph
+from nncf.torch.quantization.layers import BaseQuantizer
 from nncf.torch.structures import LeGRInitArgs, DistributedCallbacksArgs
 from nncf.torch.utils import get_filters_num
 
@@ -160,6 +164,9 @@ class FilterPruningController(BasePruningAlgoController):
         self.filter_importance = FILTER_IMPORTANCE_FUNCTIONS.get(params.get('filter_importance', 'L2'))
         self.ranking_type = params.get('interlayer_ranking_type', 'unweighted_ranking')
         self.all_weights = params.get("all_weights", False)
+        self.shrink_model_on_export = params.get('shrink_model_on_export', False)
+        self._model_shrunk = False
+        self.export_statistics = None  # type: PrunedModelExportStatistics
         scheduler_cls = PRUNING_SCHEDULERS.get(params.get('schedule', 'exponential'))
         self._scheduler = scheduler_cls(self, params)
 
@@ -364,6 +371,36 @@ class FilterPruningController(BasePruningAlgoController):
                                        conv_op_metatypes=GENERAL_CONV_LAYER_METATYPES,
                                        linear_op_metatypes=LINEAR_LAYER_METATYPES)
 
+    def _calculate_flops_and_weights_by_pruned_filters_num(self,
+                                                           pruned_filters_num: Dict[int, int]) -> Tuple[int, int]:
+        """
+        Calculates number of weights and flops of the model with the given number of filters
+        pruned in each of the pruning groups.
+
+        :param pruned_filters_num: dictionary of group ids and corresponding numbers of pruned filters
+        :return: flops and weights number in pruned model
+        """
+        tmp_in_channels = self._modules_in_channels.copy()
+        tmp_out_channels = self._modules_out_channels.copy()
+        for cluster_id, num_pruned in pruned_filters_num.items():
+            cluster = self.pruned_module_groups_info.get_cluster_by_id(cluster_id)
+            for node in cluster.elements:
+                tmp_out_channels[node.node_name] -= num_pruned
+                if node.is_depthwise:
+                    tmp_in_channels[node.node_name] -= num_pruned
+
+            # Prune in channels in all next nodes
+            for node_name in self.next_nodes[cluster_id]:
+                tmp_in_channels[node_name] -= num_pruned
+
+        return count_flops_and_weights(self._model.get_original_graph(),
+                                       self._modules_in_shapes,
+                                       self._modules_out_shapes,
+                                       input_channels=tmp_in_channels,
+                                       output_channels=tmp_out_channels,
+                                       conv_op_metatypes=GENERAL_CONV_LAYER_METATYPES,
+                                       linear_op_metatypes=LINEAR_LAYER_METATYPES)
+
     def _find_uniform_pruning_level_for_target_flops(self, target_flops_pruning_level: float) -> float:
         """
         Searching for the minimal uniform layer-wise weight pruning level (proportion of zero filters in a layer)
@@ -401,6 +438,9 @@ class FilterPruningController(BasePruningAlgoController):
         If pruning_level is a dict, the keys should correspond to layer group id's and the
         values to groupwise pruning level to be set in the model.
         """
+        if self._model_shrunk:
+            raise RuntimeError('Can not set the pruning level: the pruned filters were already removed from '
+                               'the model on export')
         groupwise_pruning_levels_set = isinstance(pruning_level, dict)
         passed_pruning_level = pruning_level
 
@@ -543,7 +583,7 @@ class FilterPruningController(BasePruningAlgoController):
         """
         Sorting all prunable filters in the network by importance and pruning the amount of the
         least important filters sufficient to achieve the target pruning level by flops.
-        Filters are pruned one-by-one and the corresponding flops value is checked.
+        The number of pruned filters is found by binary search over the sorted filters.
 
         :param target_flops_pruning_level: target proportion of flops removed from the model
         :return:
@@ -586,50 +626,55 @@ class FilterPruningController(BasePruningAlgoController):
         cluster_indexes = torch.cat(cluster_indexes)
         filter_indexes = torch.cat(filter_indexes)
 
-        # 3. Sort all filter groups by importances and prune the least important filters
-        # until target flops pruning level is achieved
-        sorted_importances = sorted(zip(importances, cluster_indexes, filter_indexes), key=lambda x: x[0])
-        cur_num = 0
-        tmp_in_channels = self._modules_in_channels.copy()
-        tmp_out_channels = self._modules_out_channels.copy()
-        tmp_pruning_quotas = self.pruning_quotas.copy()
-
-        while cur_num < len(sorted_importances):
-            cluster_idx = int(sorted_importances[cur_num][1])
-            filter_idx = int(sorted_importances[cur_num][2])
-
-            if tmp_pruning_quotas[cluster_idx] > 0:
-                tmp_pruning_quotas[cluster_idx] -= 1
+        # 3. Sort all filter groups by importances. The least important filters of a group are pruned first
+        # as long as the group has pruning quota left, the filters that exceed the quota are never pruned
+        sorted_order = np.argsort(importances.detach().cpu().numpy(), kind='stable')
+        sorted_cluster_indexes = cluster_indexes.cpu().numpy().astype(int)[sorted_order]
+        sorted_filter_indexes = filter_indexes.cpu().numpy()[sorted_order]
+
+        remaining_quotas = self.pruning_quotas.copy()
+        is_prunable = np.zeros(len(sorted_order), dtype=bool)
+        for idx, cluster_idx in enumerate(sorted_cluster_indexes):
+            if remaining_quotas[cluster_idx] > 0:
+                remaining_quotas[cluster_idx] -= 1
+                is_prunable[idx] = True
+        pruned_cluster_indexes = sorted_cluster_indexes[is_prunable]
+        pruned_filter_indexes = sorted_filter_indexes[is_prunable]
+
+        # 4. Model flops decrease monotonically with the number of pruned filters, so the smallest
+        # number of the least important filters sufficient to achieve the target flops is found by binary search
+        def flops_and_weights_for_num_pruned(num_pruned: int) -> Tuple[int, int]:
+            cluster_ids, pruned_nums = np.unique(pruned_cluster_indexes[:num_pruned], return_counts=True)
+            return self._calculate_flops_and_weights_by_pruned_filters_num(
+                dict(zip(cluster_ids.tolist(), pruned_nums.tolist())))
+
+        flops, params_num = flops_and_weights_for_num_pruned(len(pruned_cluster_indexes))
+        if flops >= target_flops:
+            raise RuntimeError("Can't prune model to asked flops pruning level")
+
+        left, right = 1, len(pruned_cluster_indexes)
+        while left < right:
+            middle = (left + right) // 2
+            middle_flops, middle_params_num = flops_and_weights_for_num_pruned(middle)
+            if middle_flops < target_flops:
+                right = middle
+                flops, params_num = middle_flops, middle_params_num
             else:
-                cur_num += 1
-                continue
-
+                left = middle + 1
+        num_pruned = left
+
+        # 5. Set the binary masks for the pruned filters
+        pruned_cluster_indexes = pruned_cluster_indexes[:num_pruned]
+        pruned_filter_indexes = pruned_filter_indexes[:num_pruned]
+        for cluster_idx in np.unique(pruned_cluster_indexes).tolist():
+            cluster_filter_indexes = torch.from_numpy(pruned_filter_indexes[pruned_cluster_indexes == cluster_idx])
             cluster = self.pruned_module_groups_info.get_cluster_by_id(cluster_idx)
             for node in cluster.elements:
-                tmp_out_channels[node.node_name] -= 1
-                if node.is_depthwise:
-                    tmp_in_channels[node.node_name] -= 1
+                mask = node.operand.binary_filter_pruning_mask
+                mask[cluster_filter_indexes.to(mask.device)] = 0
 
-                node.operand.binary_filter_pruning_mask[filter_idx] = 0
-
-            # Prune in channels in all next nodes
-            next_nodes = self.next_nodes[cluster.id]
-            for node_id in next_nodes:
-                tmp_in_channels[node_id] -= 1
-
-            flops, params_num = count_flops_and_weights(self._model.get_original_graph(),
-                                                        self._modules_in_shapes,
-                                                        self._modules_out_shapes,
-                                                        input_channels=tmp_in_channels,
-                                                        output_channels=tmp_out_channels,
-                                                        conv_op_metatypes=GENERAL_CONV_LAYER_METATYPES,
-                                                        linear_op_metatypes=LINEAR_LAYER_METATYPES)
-            if flops < target_flops:
-                self.current_flops = flops
-                self.current_params_num = params_num
-                return
-            cur_num += 1
-        raise RuntimeError("Can't prune model to asked flops pruning level")
+        self.current_flops = flops
+        self.current_params_num = params_num
 
     def _propagate_masks(self):
         nncf_logger.debug("Propagating pruning masks")
@@ -650,12 +695,58 @@ class FilterPruningController(BasePruningAlgoController):
     def prepare_for_export(self):
         """
         Applies pruning masks to layer weights before exporting the model to ONNX.
+        If the `shrink_model_on_export` option is set, the pruned filters are physically removed from the model.
         """
+        if self._model_shrunk:
+            return
         self._propagate_masks()
 
         pruned_layers_stats = self.get_stats_for_pruned_modules()
         nncf_logger.debug('Pruned layers statistics: \n%s', pruned_layers_stats.draw())
 
+        if self.shrink_model_on_export:
+            self._shrink_model()
+
+    def _shrink_model(self):
+        """
+        Physically removes the pruned filters from the model in place and collects the statistics
+        of the FLOPS, weights and latency reduction.
+        """
+        for module in self._model.modules():
+            if isinstance(module, BaseQuantizer) and module.per_channel:
+                raise RuntimeError('Can not shrink the pruned model with per-channel quantizers. Please, disable '
+                                   'the `shrink_model_on_export` option or use per-tensor quantization.')
+
+        full_flops = sum(self._model.get_flops_per_module().values())
+        full_params = self._model.get_parameters_count_in_model()
+        full_latency = self._measure_dummy_forward_latency()
+
+        ModelPruner(self._model, self._model.get_original_graph(), PT_PRUNING_OPERATOR_METATYPES).apply_mask()
+        self._model_shrunk = True
+
+        shrunk_flops = sum(self._model.get_flops_per_module().values())
+        shrunk_params = self._model.get_parameters_count_in_model()
+        shrunk_latency = self._measure_dummy_forward_latency()
+
+        self.export_statistics = PrunedModelExportStatistics(full_flops, shrunk_flops, full_params, shrunk_params,
+                                                             full_latency, shrunk_latency)
+        nncf_logger.info(self.export_statistics.to_str())
+
+    def _measure_dummy_forward_latency(self, num_runs: int = 10) -> float:
+        """
+        Returns the mean latency of the forward pass on the dummy input, in milliseconds.
+        """
+        self._model.do_dummy_forward(force_eval=True)  # warm up
+        is_cuda = next(self._model.parameters()).is_cuda
+        if is_cuda:
+            torch.cuda.synchronize()
+        start_time = time.perf_counter()
+        for _ in range(num_runs):
+            self._model.do_dummy_forward(force_eval=True)
+        if is_cuda:
+            torch.cuda.synchronize()
+        return (time.perf_counter() - start_time) * 1000 / num_runs
+
     def compression_stage(self) -> CompressionStage:
         target_pruning_level = self.scheduler.target_level
         actual_pruning_level = self._pruning_level
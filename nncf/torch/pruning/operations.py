@@ -10,6 +10,7 @@
  See the License for the specific language governing permissions and
  limitations under the License.
 """
+from typing import Optional
 
 import torch
 
@@ -74,14 +75,26 @@ from nncf.common.pruning.operations import (
 )
 from nncf.common.graph.operator_metatypes import UnknownMetatype
 from nncf.common.utils.logger import logger as nncf_logger
+from nncf.common.pruning.utils import get_input_masks
 from nncf.common.pruning.utils import is_prunable_depthwise_conv
+from nncf.common.tensor import NNCFTensor
 from nncf.torch.nncf_network import NNCFNetwork
 from nncf.torch.layers import NNCF_WRAPPED_USER_MODULES_DICT
+from nncf.torch.pruning.filter_pruning.layers import FilterPruningMask
 from nncf.torch.pruning.tensor_processor import PTNNCFPruningTensorProcessor
 
 PT_PRUNING_OPERATOR_METATYPES = PruningOperationsMetatypeRegistry("operator_metatypes")
 
 
+def get_bool_mask(mask: Optional[NNCFTensor]) -> Optional[torch.Tensor]:
+    """
+    Returns the pruning mask as a boolean tensor, or None if the mask is None.
+    """
+    if mask is None:
+        return None
+    return mask.tensor.bool()
+
+
 class PTPruner:
     @classmethod
     def input_prune(cls, model: NNCFNetwork, node: NNCFNode, graph: NNCFGraph) -> None:
@@ -129,11 +142,10 @@ class PTConvolutionPruningOp(ConvolutionPruningOp, PTPruner):
 
     @classmethod
     def input_prune(cls, model: NNCFNetwork, node: NNCFNode, graph: NNCFGraph) -> None:
-        input_mask = node.data['input_masks'][0]
-        if input_mask is None:
+        bool_mask = get_bool_mask(get_input_masks(node, graph)[0])
+        if bool_mask is None:
             return
-        bool_mask = torch.tensor(input_mask, dtype=torch.bool)
-        new_num_channels = int(torch.sum(input_mask))
+        new_num_channels = int(torch.sum(bool_mask))
 
         is_depthwise = is_prunable_depthwise_conv(node)
         node_module = model.get_containing_module(node.node_name)
@@ -145,36 +157,29 @@ class PTConvolutionPruningOp(ConvolutionPruningOp, PTPruner):
             node_module.in_channels = new_num_channels
             old_num_channels = int(node_module.weight.size(0))
         else:
-            out_channels = node_module.weight.size(0)
-            broadcasted_mask = bool_mask.repeat(out_channels).view(out_channels, bool_mask.size(0))
-            new_weight_shape = list(node_module.weight.shape)
-            new_weight_shape[1] = new_num_channels
-
             node_module.in_channels = new_num_channels
-            node_module.weight = torch.nn.Parameter(node_module.weight[broadcasted_mask].view(new_weight_shape))
+            node_module.weight = torch.nn.Parameter(node_module.weight[:, bool_mask])
 
         nncf_logger.info('Pruned Convolution {} by input mask. Old input filters number: {}, new filters number:'
-                         ' {}.'.format(node.data['key'], old_num_channels, new_num_channels))
+                         ' {}.'.format(node.node_name, old_num_channels, new_num_channels))
 
     @classmethod
     def output_prune(cls, model: NNCFNetwork, node: NNCFNode, graph: NNCFGraph) -> None:
-        mask = node.data['output_mask']
-        if mask is None:
+        bool_mask = get_bool_mask(node.data['output_mask'])
+        if bool_mask is None:
             return
 
-        bool_mask = torch.tensor(mask, dtype=torch.bool)
-
         node_module = model.get_containing_module(node.node_name)
-        old_num_clannels = int(node_module.weight.size(0))
+        old_num_channels = int(node_module.weight.size(0))
 
-        node_module.out_channels = int(torch.sum(mask))
+        node_module.out_channels = int(torch.sum(bool_mask))
         node_module.weight = torch.nn.Parameter(node_module.weight[bool_mask])
 
         if node_module.bias is not None:
             node_module.bias = torch.nn.Parameter(node_module.bias[bool_mask])
 
         nncf_logger.info('Pruned Convolution {} by pruning mask. Old output filters number: {}, new filters number:'
-                         ' {}.'.format(node.data['key'], old_num_clannels, node_module.out_channels))
+                         ' {}.'.format(node.node_name, old_num_channels, node_module.out_channels))
 
 
 @PT_PRUNING_OPERATOR_METATYPES.register('transpose_convolution')
@@ -183,51 +188,78 @@ class PTTransposeConvolutionPruningOp(TransposeConvolutionPruningOp, PTPruner):
 
     @classmethod
     def input_prune(cls, model: NNCFNetwork, node: NNCFNode, graph: NNCFGraph) -> None:
-        input_mask = node.data['input_masks'][0]
-        if input_mask is None:
+        bool_mask = get_bool_mask(get_input_masks(node, graph)[0])
+        if bool_mask is None:
             return
-        bool_mask = torch.tensor(input_mask, dtype=torch.bool)
 
         node_module = model.get_containing_module(node.node_name)
-        old_num_clannels = int(node_module.weight.size(0))
+        old_num_channels = int(node_module.weight.size(0))
 
         node_module.in_channels = int(torch.sum(bool_mask))
         node_module.weight = torch.nn.Parameter(node_module.weight[bool_mask])
 
         nncf_logger.info('Pruned ConvTranspose {} by input mask. Old input filters number: {}, new filters number:'
-                         ' {}.'.format(node.data['key'], old_num_clannels, node_module.in_channels))
+                         ' {}.'.format(node.node_name, old_num_channels, node_module.in_channels))
 
     @classmethod
     def output_prune(cls, model: NNCFNetwork, node: NNCFNode, graph: NNCFGraph) -> None:
-        output_mask = node.data['output_mask']
-        if output_mask is None:
+        bool_mask = get_bool_mask(node.data['output_mask'])
+        if bool_mask is None:
             return
 
-        bool_mask = torch.tensor(output_mask, dtype=torch.bool)
-        new_num_channels = int(torch.sum(bool_mask))
-
         node_module = model.get_containing_module(node.node_name)
-        old_num_clannels = int(node_module.weight.size(1))
-
-        in_channels = node_module.weight.size(0)
-        broadcasted_mask = bool_mask.repeat(in_channels).view(in_channels, bool_mask.size(0))
-        new_weight_shape = list(node_module.weight.shape)
-        new_weight_shape[1] = new_num_channels
+        old_num_channels = int(node_module.weight.size(1))
 
-        node_module.out_channels = new_num_channels
-        node_module.weight = torch.nn.Parameter(node_module.weight[broadcasted_mask].view(new_weight_shape))
+        node_module.out_channels = int(torch.sum(bool_mask))
+        node_module.weight = torch.nn.Parameter(node_module.weight[:, bool_mask])
 
         if node_module.bias is not None:
             node_module.bias = torch.nn.Parameter(node_module.bias[bool_mask])
 
         nncf_logger.info('Pruned ConvTranspose {} by pruning mask. Old output filters number: {}, new filters number:'
-                         ' {}.'.format(node.data['key'], old_num_clannels, node_module.out_channels))
+                         ' {}.'.format(node.node_name, old_num_channels, node_module.out_channels))
 
 
 @PT_PRUNING_OPERATOR_METATYPES.register('linear')
 class PTLinearPruningOp(LinearPruningOp, PTPruner):
     subtypes = [PTLinearMetatype, PTMatMulMetatype]
 
+    @classmethod
+    def input_prune(cls, model: NNCFNetwork, node: NNCFNode, graph: NNCFGraph) -> None:
+        bool_mask = get_bool_mask(get_input_masks(node, graph)[0])
+        if bool_mask is None:
+            return
+
+        node_module = model.get_containing_module(node.node_name)
+        if not isinstance(node_module, torch.nn.Linear):
+            raise RuntimeError('Can not prune the input of {}: only the torch.nn.Linear modules'
+                               ' can be pruned'.format(node.node_name))
+        old_num_features = node_module.in_features
+
+        node_module.in_features = int(torch.sum(bool_mask))
+        node_module.weight = torch.nn.Parameter(node_module.weight[:, bool_mask])
+
+        nncf_logger.info('Pruned Linear {} by input mask. Old input features number: {}, new features number:'
+                         ' {}.'.format(node.node_name, old_num_features, node_module.in_features))
+
+    @classmethod
+    def output_prune(cls, model: NNCFNetwork, node: NNCFNode, graph: NNCFGraph) -> None:
+        bool_mask = get_bool_mask(node.data['output_mask'])
+        if bool_mask is None:
+            return
+
+        node_module = model.get_containing_module(node.node_name)
+        old_num_features = node_module.out_features
+
+        node_module.out_features = int(torch.sum(bool_mask))
+        node_module.weight = torch.nn.Parameter(node_module.weight[bool_mask])
+
+        if node_module.bias is not None:
+            node_module.bias = torch.nn.Parameter(node_module.bias[bool_mask])
+
+        nncf_logger.info('Pruned Linear {} by pruning mask. Old output features number: {}, new features number:'
+                         ' {}.'.format(node.node_name, old_num_features, node_module.out_features))
+
 
 @PT_PRUNING_OPERATOR_METATYPES.register('batch_norm')
 class PTBatchNormPruningOp(BatchNormPruningOp, PTPruner):
@@ -235,24 +267,25 @@ class PTBatchNormPruningOp(BatchNormPruningOp, PTPruner):
 
     @classmethod
     def input_prune(cls, model: NNCFNetwork, node: NNCFNode, graph: NNCFGraph) -> None:
-        input_mask = node.data['input_masks'][0]
-        if input_mask is None:
+        bool_mask = get_bool_mask(get_input_masks(node, graph)[0])
+        if bool_mask is None:
             return
 
         node_module = model.get_containing_module(node.node_name)
 
-        bool_mask = torch.tensor(input_mask, dtype=torch.bool)
-        old_num_clannels = int(node_module.weight.size(0))
-        new_num_channels = int(torch.sum(input_mask))
+        old_num_channels = node_module.num_features
+        new_num_channels = int(torch.sum(bool_mask))
 
         node_module.num_features = new_num_channels
-        node_module.weight = torch.nn.Parameter(node_module.weight[bool_mask])
-        node_module.bias = torch.nn.Parameter(node_module.bias[bool_mask])
-        node_module.running_mean = torch.nn.Parameter(node_module.running_mean[bool_mask], requires_grad=False)
-        node_module.running_var = torch.nn.Parameter(node_module.running_var[bool_mask], requires_grad=False)
+        if node_module.affine:
+            node_module.weight = torch.nn.Parameter(node_module.weight[bool_mask])
+            node_module.bias = torch.nn.Parameter(node_module.bias[bool_mask])
+        if node_module.track_running_stats:
+            node_module.running_mean = node_module.running_mean[bool_mask]
+            node_module.running_var = node_module.running_var[bool_mask]
 
         nncf_logger.info('Pruned BatchNorm {} by input mask. Old num features: {}, new num features:'
-                         ' {}.'.format(node.data['key'], old_num_clannels, new_num_channels))
+                         ' {}.'.format(node.node_name, old_num_channels, new_num_channels))
 
 
 @PT_PRUNING_OPERATOR_METATYPES.register('group_norm')
@@ -261,24 +294,24 @@ class PTGroupNormPruningOp(GroupNormPruningOp, PTPruner):
 
     @classmethod
     def input_prune(cls, model: NNCFNetwork, node: NNCFNode, graph: NNCFGraph) -> None:
-        input_mask = node.data['input_masks'][0]
-        if input_mask is None:
+        bool_mask = get_bool_mask(get_input_masks(node, graph)[0])
+        if bool_mask is None:
             return
 
         node_module = model.get_containing_module(node.node_name)
 
-        bool_mask = torch.tensor(input_mask, dtype=torch.bool)
-        old_num_clannels = int(node_module.weight.size(0))
-        new_num_channels = int(torch.sum(input_mask))
+        old_num_channels = node_module.num_channels
+        new_num_channels = int(torch.sum(bool_mask))
 
+        # Only the instance normalization case (num_groups == num_channels) accepts the pruned input
         node_module.num_channels = new_num_channels
         node_module.num_groups = new_num_channels
-
-        node_module.weight = torch.nn.Parameter(node_module.weight[bool_mask])
-        node_module.bias = torch.nn.Parameter(node_module.bias[bool_mask])
+        if node_module.affine:
+            node_module.weight = torch.nn.Parameter(node_module.weight[bool_mask])
+            node_module.bias = torch.nn.Parameter(node_module.bias[bool_mask])
 
         nncf_logger.info('Pruned GroupNorm {} by input mask. Old num features: {}, new num features:'
-                         ' {}.'.format(node.data['key'], old_num_clannels, new_num_channels))
+                         ' {}.'.format(node.node_name, old_num_channels, new_num_channels))
 
 
 @PT_PRUNING_OPERATOR_METATYPES.register('elementwise')
@@ -287,23 +320,22 @@ class PTElementwisePruningOp(ElementwisePruningOp, PTPruner):
 
     @classmethod
     def input_prune(cls, model: NNCFNetwork, node: NNCFNode, graph: NNCFGraph) -> None:
-        input_mask = node.data['input_masks'][0]
-        if input_mask is None:
+        bool_mask = get_bool_mask(get_input_masks(node, graph)[0])
+        if bool_mask is None:
             return
 
-        bool_mask = torch.tensor(input_mask, dtype=torch.bool)
         node_module = model.get_containing_module(node.node_name)
 
         if isinstance(node_module, tuple(NNCF_WRAPPED_USER_MODULES_DICT)):
             assert node_module.target_weight_dim_for_compression == 0, \
                 "Implemented only for target_weight_dim_for_compression == 0"
-            old_num_clannels = int(node_module.weight.size(0))
-            new_num_channels = int(torch.sum(input_mask))
+            old_num_channels = int(node_module.weight.size(0))
+            new_num_channels = int(torch.sum(bool_mask))
             node_module.weight = torch.nn.Parameter(node_module.weight[bool_mask])
             node_module.n_channels = new_num_channels
 
             nncf_logger.info('Pruned Elementwise {} by input mask. Old num features: {}, new num features:'
-                             ' {}.'.format(node.data['key'], old_num_clannels, new_num_channels))
+                             ' {}.'.format(node.node_name, old_num_channels, new_num_channels))
 
 
 @PT_PRUNING_OPERATOR_METATYPES.register('stop_propagation_ops')
@@ -313,7 +345,7 @@ class PTStopMaskForwardPruningOp(StopMaskForwardPruningOp, PTPruner):
 
 
 @PT_PRUNING_OPERATOR_METATYPES.register('reshape')
-class PTReshape(ReshapePruningOp):
+class PTReshape(ReshapePruningOp, PTPruner):
     subtypes = [PTReshapeMetatype]
 
 
@@ -323,6 +355,12 @@ class PTConcatPruningOp(ConcatPruningOp, PTPruner):
 
 
 class ModelPruner(MaskPropagationAlgorithm):
+    """
+    Physically removes the pruned filters from the model layers, along with the corresponding input channels
+    of the following layers and the features of the following Batch/Group Norms, so that the layers become
+    smaller instead of having zeroed filters.
+    """
+
     def __init__(self, model: NNCFNetwork, graph: NNCFGraph,
                  pruning_operator_metatypes: PruningOperationsMetatypeRegistry):
         super().__init__(graph, pruning_operator_metatypes, PTNNCFPruningTensorProcessor)
@@ -333,6 +371,8 @@ class ModelPruner(MaskPropagationAlgorithm):
         Applying propagated masks for all nodes in topological order:
         1. running input_prune method for this node
         2. running output_prune method for this node
+        Then the binary filter pruning masks of the pruned modules are resized to the new weight shapes.
+        Resizing is done after all nodes are pruned since the masks share memory with the propagated ones.
         """
         pruned_node_modules = []
         with torch.no_grad():
@@ -343,8 +383,21 @@ class ModelPruner(MaskPropagationAlgorithm):
                     node_cls.input_prune(self._model, node, self._graph)
                     node_cls.output_prune(self._model, node, self._graph)
                     pruned_node_modules.append(node_module)
+            for node_module in pruned_node_modules:
+                self._resize_pruning_masks(node_module)
             nncf_logger.info('Finished mask applying step')
 
+    @staticmethod
+    def _resize_pruning_masks(node_module: torch.nn.Module):
+        pre_ops = getattr(node_module, 'pre_ops', {})
+        for op in pre_ops.values():
+            operand = getattr(op, 'operand', None)
+            if isinstance(operand, FilterPruningMask):
+                mask = operand.binary_filter_pruning_mask
+                new_size = node_module.weight.size(operand.mask_applying_dim)
+                if mask.size(0) != new_size:
+                    operand.binary_filter_pruning_mask = torch.ones(new_size, dtype=mask.dtype, device=mask.device)
+
     def prune_model(self):
         """
         Model pruner work in two stages:
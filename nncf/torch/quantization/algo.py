@@ -19,6 +19,7 @@ from pathlib import Path
 from string import Template
 from typing import Any, Union
 from typing import Dict
+from typing import Hashable
 from typing import List
 from typing import Optional
 from typing import Set
@@ -1236,6 +1237,10 @@ class QuantizationController(QuantizationControllerBase):
         for quantizer in self.all_quantizations.values():  # type: BaseQuantizer
             quantizer.set_export_mode(export_mode)
 
+        if algo_config.get('export_packed_weights', False):
+            for weight_quantizer_info in self.weight_quantizers.values():
+                weight_quantizer_info.quantizer_module_ref.set_export_mode(QuantizerExportMode.PACKED_WEIGHTS)
+
         params = algo_config.get('params', None)
         self.is_staged_scheduler = bool(params)
 
@@ -1274,6 +1279,29 @@ class QuantizationController(QuantizationControllerBase):
         for quantizer in sorted_quantizers.values():  # type: BaseQuantizer
             quantizer.broadcast_initialized_params()
 
+    def _get_observed_tensor_keys(self) -> Dict[str, Hashable]:
+        """
+        Maps the activation quantizers that observe a single tensor to the name of the node producing it, so
+        that e.g. the quantizers inserted at several consumers of the same tensor share the statistics
+        computation during range initialization.
+        """
+        graph = self._model.get_original_graph()
+        observed_tensor_keys = {}
+        for aq_id, aq_info in self.non_weight_quantizers.items():
+            producer_names = set()
+            for target_point in aq_info.affected_insertions:
+                if target_point.target_type is TargetType.OPERATOR_POST_HOOK:
+                    producer_names.add(target_point.target_node_name)
+                elif target_point.target_type is TargetType.OPERATOR_PRE_HOOK:
+                    node = graph.get_node_by_name(target_point.target_node_name)
+                    producer_names.update(edge.from_node.node_name for edge in graph.get_input_edges(node)
+                                          if edge.input_port_id == target_point.input_port_id)
+                else:
+                    producer_names.add(None)
+            if len(producer_names) == 1 and None not in producer_names:
+                observed_tensor_keys[str(aq_id)] = next(iter(producer_names))
+        return observed_tensor_keys
+
     def _do_runtime_range_init(self, range_init_params: PTRangeInitParams):
         modules_to_init = OrderedDict()
         for wq_id, wq_info in self.weight_quantizers.items():
@@ -1294,7 +1322,8 @@ class QuantizationController(QuantizationControllerBase):
         # and input_range)
         modules_to_init = OrderedDict(sorted(modules_to_init.items()))
         self.modules_to_range_init = modules_to_init
-        runner = DataLoaderRangeInitializeRunner(self._model, modules_to_init, range_init_params.device)
+        runner = DataLoaderRangeInitializeRunner(self._model, modules_to_init, range_init_params.device,
+                                                 observed_tensor_keys=self._get_observed_tensor_keys())
 
         quantizers = [module for module, config, is_weights, input_shape in modules_to_init.values()]
         quantizers_switcher = QuantizersSwitcher(quantizers)
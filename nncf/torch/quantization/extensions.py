@@ -12,10 +12,14 @@
 """
 
 import os.path
+import sys
+
 import torch
-from torch.utils.cpp_extension import load
 
 from nncf.torch.extensions import CudaNotAvailableStub, ExtensionsType, ExtensionLoader, EXTENSIONS
+from nncf.torch.extensions import LazyExtension
+from nncf.torch.extensions import load_extension
+from nncf.torch.quantization.reference import ReferenceQuantizedFunctions
 from nncf.definitions import NNCF_PACKAGE_ROOT_DIR
 
 BASE_EXT_DIR = os.path.join(NNCF_PACKAGE_ROOT_DIR, "torch/extensions/src/quantization")
@@ -29,6 +33,19 @@ CPU_EXT_SRC_LIST = [
     os.path.join(NNCF_PACKAGE_ROOT_DIR, "torch/extensions/src/common/cpu/tensor_funcs.cpp")
 ]
 
+# OpenMP is required for the parallel loops in the fused CPU kernels to actually run in parallel,
+# and disabling FP trapping lets the compiler vectorize the branches in these loops. Apple clang does not
+# accept -fopenmp, so on macOS the kernels are built without it and at::parallel_for runs them serially.
+if sys.platform == 'win32':
+    CPU_EXT_CFLAGS = ['/O2', '/openmp']
+    CPU_EXT_LDFLAGS = []
+elif sys.platform.startswith('linux'):
+    CPU_EXT_CFLAGS = ['-O3', '-fopenmp', '-fno-trapping-math']
+    CPU_EXT_LDFLAGS = ['-fopenmp']
+else:
+    CPU_EXT_CFLAGS = ['-O3', '-fno-trapping-math']
+    CPU_EXT_LDFLAGS = []
+
 CUDA_EXT_SRC_LIST = [
     os.path.join(BASE_EXT_DIR, "cuda/functions_cuda.cpp"),
     os.path.join(BASE_EXT_DIR, "cuda/functions_cuda_impl.cu")
@@ -43,8 +60,12 @@ class QuantizedFunctionsCPULoader(ExtensionLoader):
 
     @staticmethod
     def load():
-        return load('quantized_functions_cpu', CPU_EXT_SRC_LIST, extra_include_paths=EXT_INCLUDE_DIRS,
-                    verbose=False)
+        return load_extension('quantized_functions_cpu', CPU_EXT_SRC_LIST, extra_include_paths=EXT_INCLUDE_DIRS,
+                              extra_cflags=CPU_EXT_CFLAGS, extra_ldflags=CPU_EXT_LDFLAGS)
+
+    @staticmethod
+    def fallback():
+        return ReferenceQuantizedFunctions
 
 
 @EXTENSIONS.register()
@@ -55,13 +76,17 @@ class QuantizedFunctionsCUDALoader(ExtensionLoader):
 
     @staticmethod
     def load():
-        return load('quantized_functions_cuda', CUDA_EXT_SRC_LIST, extra_include_paths=EXT_INCLUDE_DIRS,
-                    verbose=False)
+        return load_extension('quantized_functions_cuda', CUDA_EXT_SRC_LIST, extra_include_paths=EXT_INCLUDE_DIRS)
+
+    @staticmethod
+    def fallback():
+        return ReferenceQuantizedFunctions
 
 
-QuantizedFunctionsCPU = QuantizedFunctionsCPULoader.load()
+# The extensions are loaded on the first call to any of their functions
+QuantizedFunctionsCPU = LazyExtension(QuantizedFunctionsCPULoader)
 
 if torch.cuda.is_available():
-    QuantizedFunctionsCUDA = QuantizedFunctionsCUDALoader.load()
+    QuantizedFunctionsCUDA = LazyExtension(QuantizedFunctionsCUDALoader)
 else:
     QuantizedFunctionsCUDA = CudaNotAvailableStub
@@ -98,11 +98,13 @@ class GradientsCalculator:
 class HessianTraceEstimator:
     """
     Performs estimation of Hessian Trace based on Hutchinson algorithm.
+    Several probe vectors can be evaluated per iteration: the vector-Hessian products for all of them
+    are computed from the single gradients graph created for each data batch.
     """
 
     def __init__(self, model: nn.Module, criterion_fn: Callable[[Any, Any, _Loss], torch.Tensor], criterion: _Loss,
                  device: str, data_loader: DataLoader,
-                 num_data_points: int):
+                 num_data_points: int, num_probes: int = 1):
         self._model = model
         parameters = [p for p in model.parameters() if p.requires_grad]
         self._parameter_handler = ParameterHandler(parameters, device)
@@ -112,7 +114,9 @@ class HessianTraceEstimator:
         self._gradients_calculator = GradientsCalculator(self._model, criterion_fn, criterion, data_loader,
                                                          self._num_data_iter,
                                                          self._parameter_handler)
+        self._num_probes = num_probes
         self._diff_eps = 1e-6
+        self._confidence_z_score = 1.96  # for the 95% confidence interval
 
     def get_average_traces(self, max_iter=500, tolerance=1e-5) -> Tensor:
         """
@@ -123,38 +127,67 @@ class HessianTraceEstimator:
         :return: Tensor with average hessian trace per parameter
         """
         avg_total_trace = 0.
-        avg_traces_per_iter = []  # type: List[Tensor]
+        num_samples = 0
+        sum_avg_traces_per_param = None  # type: Tensor
+        sum_avg_total_trace = 0.
+        sum_squared_avg_total_trace = 0.
         mean_avg_traces_per_param = None
 
         for i in range(max_iter):
-            avg_traces_per_iter.append(self._calc_avg_traces_per_param())
-
-            mean_avg_traces_per_param = self._get_mean(avg_traces_per_iter)
+            avg_traces_per_probe = self._calc_avg_traces_per_param()
+            num_samples += avg_traces_per_probe.size(0)
+            sum_probes = torch.sum(avg_traces_per_probe, dim=0)
+            if sum_avg_traces_per_param is None:
+                sum_avg_traces_per_param = sum_probes
+            else:
+                sum_avg_traces_per_param = sum_avg_traces_per_param + sum_probes
+            total_trace_per_probe = torch.sum(avg_traces_per_probe, dim=1)
+            sum_avg_total_trace += torch.sum(total_trace_per_probe).item()
+            sum_squared_avg_total_trace += torch.sum(total_trace_per_probe ** 2).item()
+
+            mean_avg_traces_per_param = sum_avg_traces_per_param / num_samples
             mean_avg_total_trace = torch.sum(mean_avg_traces_per_param)
 
             diff_avg = abs(mean_avg_total_trace - avg_total_trace) / (avg_total_trace + self._diff_eps)
             if diff_avg < tolerance:
                 return mean_avg_traces_per_param
             avg_total_trace = mean_avg_total_trace
-            nncf_logger.info('{}# difference_avg={} avg_trace={}'.format(i, diff_avg, avg_total_trace))
+            confidence_interval = self._get_confidence_interval(sum_avg_total_trace, sum_squared_avg_total_trace,
+                                                                num_samples)
+            nncf_logger.info('{}# difference_avg={} avg_trace={} (95% confidence interval +-{} over {} probes)'.format(
+                i, diff_avg, avg_total_trace, confidence_interval, num_samples))
 
         return mean_avg_traces_per_param
 
+    def _get_confidence_interval(self, sum_values: float, sum_squared_values: float, num_values: int) -> float:
+        if num_values < 2:
+            return float('inf')
+        mean = sum_values / num_values
+        variance = max(sum_squared_values - num_values * mean ** 2, 0.) / (num_values - 1)
+        return self._confidence_z_score * (variance / num_values) ** 0.5
+
     def _calc_avg_traces_per_param(self) -> Tensor:
-        v = self._parameter_handler.sample_rademacher_like_params()
-        vhp = self._parameter_handler.sample_normal_like_params()
+        """
+        Returns the Hutchinson estimates of the average hessian trace for each parameter,
+        one row per probe vector.
+        """
+        probes = []
+        vhps = []
+        for _ in range(self._num_probes):
+            probes.append(self._parameter_handler.sample_rademacher_like_params())
+            vhps.append(self._parameter_handler.sample_normal_like_params())
         num_all_data = self._num_data_iter * self._batch_size
         for gradients in self._gradients_calculator:
-            vhp_curr = torch.autograd.grad(gradients,
-                                           self._parameter_handler.parameters,
-                                           grad_outputs=v,
-                                           only_inputs=True,
-                                           retain_graph=False)
-            vhp = [a + b * float(self._batch_size) + 0. for a, b in zip(vhp, vhp_curr)]
-        vhp = [a / float(num_all_data) for a in vhp]
-        avg_traces_per_param = torch.stack([torch.sum(a * b) / a.size().numel() for (a, b) in zip(vhp, v)])
-        return avg_traces_per_param
-
-    @staticmethod
-    def _get_mean(data: List[Tensor]) -> Tensor:
-        return torch.mean(torch.stack(data), dim=0)
+            for probe_idx, v in enumerate(probes):
+                # The gradients graph is kept until the products for all probes are computed
+                vhp_curr = torch.autograd.grad(gradients,
+                                               self._parameter_handler.parameters,
+                                               grad_outputs=v,
+                                               only_inputs=True,
+                                               retain_graph=probe_idx < self._num_probes - 1)
+                vhps[probe_idx] = [a + b * float(self._batch_size) + 0. for a, b in zip(vhps[probe_idx], vhp_curr)]
+        avg_traces_per_probe = []
+        for v, vhp in zip(probes, vhps):
+            vhp = [a / float(num_all_data) for a in vhp]
+            avg_traces_per_probe.append(torch.stack([torch.sum(a * b) / a.size().numel() for (a, b) in zip(vhp, v)]))
+        return torch.stack(avg_traces_per_probe)
@@ -15,6 +15,7 @@ from collections import OrderedDict
 from copy import deepcopy
 from typing import Callable
 from typing import Dict
+from typing import Hashable
 from typing import List
 from typing import Tuple
 
@@ -42,6 +43,11 @@ from nncf.torch.quantization.layers import BaseQuantizer
 from nncf.torch.quantization.translator import PTTargetPointTranslator
 from nncf.torch.quantization.layers import SymmetricQuantizer
 from nncf.torch.tensor_statistics.algo import TensorStatisticObservationPoint
+from nncf.torch.tensor_statistics.collectors import DEFAULT_NUM_HISTOGRAM_BINS
+from nncf.torch.tensor_statistics.collectors import PTCollectorsGroup
+from nncf.torch.tensor_statistics.collectors import PTSharedInputObservers
+from nncf.torch.tensor_statistics.collectors import PTHistogramMedianMADStatisticCollector
+from nncf.torch.tensor_statistics.collectors import PTHistogramPercentileStatisticCollector
 from nncf.torch.tensor_statistics.collectors import PTMinMaxStatisticCollector
 from nncf.torch.tensor_statistics.collectors import PTMedianMADStatisticCollector
 from nncf.torch.tensor_statistics.collectors import PTPercentileStatisticCollector
@@ -192,6 +198,15 @@ class StatCollectorGenerator:
             min_percentile = init_config.init_type_specific_params.get("min_percentile", 0.1)
             max_percentile = init_config.init_type_specific_params.get("max_percentile", 99.9)
             return PTMeanPercentileStatisticCollector([min_percentile, max_percentile], reduction_shape, num_samples)
+        if init_config.init_type == "histogram_threesigma":
+            num_bins = init_config.init_type_specific_params.get("num_bins", DEFAULT_NUM_HISTOGRAM_BINS)
+            return PTHistogramMedianMADStatisticCollector(reduction_shape, num_samples, num_bins)
+        if init_config.init_type == "histogram_percentile":
+            min_percentile = init_config.init_type_specific_params.get("min_percentile", 0.1)
+            max_percentile = init_config.init_type_specific_params.get("max_percentile", 99.9)
+            num_bins = init_config.init_type_specific_params.get("num_bins", DEFAULT_NUM_HISTOGRAM_BINS)
+            return PTHistogramPercentileStatisticCollector([min_percentile, max_percentile], reduction_shape,
+                                                           num_samples, num_bins)
         raise RuntimeError("Unknown range init type: {}".format(init_config.init_type))
 
     @classmethod
@@ -232,10 +247,17 @@ class DataLoaderRangeInitializeRunner(DataLoaderBaseRunner):
             model: NNCFNetwork,
             modules_to_init_vs_init_configs: Dict[str, Tuple[BaseQuantizer, RangeInitConfig, bool, Tuple[int]]],
             init_device: str,
-            batch_size: int = None
+            batch_size: int = None,
+            observed_tensor_keys: Dict[str, Hashable] = None
     ):
+        """
+        :param observed_tensor_keys: Maps the names of the modules to init to the keys of the tensors that
+            the modules observe. The modules with equal keys observe the same tensor and share the reductions
+            of it. If a name is missing, the corresponding module is considered to observe a distinct tensor.
+        """
         super().__init__(model, init_device)
         self.modules_to_init = modules_to_init_vs_init_configs
+        self.observed_tensor_keys = observed_tensor_keys if observed_tensor_keys is not None else {}
         self.progressbar_description = 'Range parameters initialization'
 
         #pylint:disable=line-too-long
@@ -243,12 +265,15 @@ class DataLoaderRangeInitializeRunner(DataLoaderBaseRunner):
         self.hook_handles = []
         self.batch_size = batch_size
 
-    def _get_fwd_hook(self, collector: TensorStatisticCollectorBase) -> Callable:
+    @staticmethod
+    def _get_fwd_hook(observers: PTSharedInputObservers, collectors_group: PTCollectorsGroup) -> Callable:
         def fwd_hook(module, input_, output):
-            collector.register_input(input_[0])
+            observers.register_input(input_[0], collectors_group)
         return fwd_hook
 
     def _prepare_initialization(self):
+        #pylint:disable=line-too-long
+        tensor_vs_module_collectors = OrderedDict()  # type: Dict[Hashable, Dict[BaseQuantizer, List[TensorStatisticCollectorBase]]]
         for name, data in self.modules_to_init.items():
             quantizer_module, init_config, is_weights, input_shape = data
             num_samples_override = None
@@ -286,10 +311,16 @@ class DataLoaderRangeInitializeRunner(DataLoaderBaseRunner):
             )
 
             self.collectors_and_modules_to_init[name] = collector, quantizer_module
-
-            self.hook_handles.append(
-                quantizer_module.register_forward_hook(self._get_fwd_hook(collector))
-            )
+            tensor_key = self.observed_tensor_keys.get(name, quantizer_module)
+            module_vs_collectors = tensor_vs_module_collectors.setdefault(tensor_key, OrderedDict())
+            module_vs_collectors.setdefault(quantizer_module, []).append(collector)
+
+        # The collectors of all the quantizer modules observing the same tensor share the reductions of it
+        for module_vs_collectors in tensor_vs_module_collectors.values():
+            observers = PTSharedInputObservers(len(module_vs_collectors))
+            for quantizer_module, collectors in module_vs_collectors.items():
+                fwd_hook = self._get_fwd_hook(observers, PTCollectorsGroup(collectors))
+                self.hook_handles.append(quantizer_module.register_forward_hook(fwd_hook))
 
     def _apply_initializers(self):
         for handle in self.hook_handles:
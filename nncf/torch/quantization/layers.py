@@ -18,6 +18,7 @@ import torch
 from torch import nn
 from functools import partial
 
+from nncf.torch.dynamic_graph.context import get_current_context
 from nncf.torch.dynamic_graph.context import no_nncf_trace
 from torch import distributed
 
@@ -29,7 +30,8 @@ from nncf.common.quantization.structs import QuantizationMode, QuantizerConfig,
 from nncf.common.quantization.quantizers import calculate_symmetric_level_ranges
 from nncf.common.quantization.quantizers import calculate_asymmetric_level_ranges
 from nncf.torch.quantization.quantize_functions import symmetric_quantize, asymmetric_quantize, \
-    ExportQuantizeToFakeQuantize, get_scale_zp_from_input_low_input_high, ExportQuantizeToONNXQuantDequant, TuneRange
+    ExportQuantizeToFakeQuantize, get_scale_zp_from_input_low_input_high, ExportQuantizeToONNXQuantDequant, TuneRange, \
+    ExportPackedWeightToONNXDequant
 from nncf.torch.layer_utils import COMPRESSION_MODULES, CompressionParameter
 from nncf.common.utils.registry import Registry
 from nncf.torch.utils import get_flat_tensor_contents_string, no_jit_trace, is_tracing_state
@@ -42,6 +44,7 @@ INITIALIZABLE_MODULES = Registry('initializable_modules')
 class QuantizerExportMode(Enum):
     FAKE_QUANTIZE = "fake_quantize"
     ONNX_QUANTIZE_DEQUANTIZE_PAIRS = "quantize_dequantize"
+    PACKED_WEIGHTS = "packed_weights"
 
     @staticmethod
     def from_str(config_value: str) -> 'HWConfigType':
@@ -49,6 +52,8 @@ class QuantizerExportMode(Enum):
             return QuantizerExportMode.FAKE_QUANTIZE
         if config_value == QuantizerExportMode.ONNX_QUANTIZE_DEQUANTIZE_PAIRS.value:
             return QuantizerExportMode.ONNX_QUANTIZE_DEQUANTIZE_PAIRS
+        if config_value == QuantizerExportMode.PACKED_WEIGHTS.value:
+            return QuantizerExportMode.PACKED_WEIGHTS
         raise RuntimeError("Unknown quantizer ONNX export mode string")
 
 
@@ -114,6 +119,9 @@ class BaseQuantizer(nn.Module):
         self.call_count = 0
         self._scale_shape = qspec.scale_shape
         self._export_mode = QuantizerExportMode.FAKE_QUANTIZE
+        # In the inference mode the quantized weights do not change between forward calls, so the
+        # quantization result is stored along with the state of the weight and of the quantizer it depends on
+        self._quantized_weight_cache = None  # type: Optional[Tuple[Tuple, torch.Tensor]]
 
         class LoadStateListener:
             """
@@ -126,6 +134,8 @@ class BaseQuantizer(nn.Module):
 
             def hook_fn(self, state_dict, prefix, local_metadata, strict, missing_keys, unexpected_keys, error_msgs,
                         module):
+                # pylint: disable=protected-access
+                module._reset_quantized_weight_cache()
                 for module_key in module.state_dict().keys():
                     candidate = prefix + module_key
                     if candidate in state_dict:
@@ -154,6 +164,10 @@ class BaseQuantizer(nn.Module):
         self.enabled[0] = 0
         self.disable_gradients()
 
+    def train(self, mode: bool = True):
+        self._reset_quantized_weight_cache()
+        return super().train(mode)
+
     def forward(self, x):
         if is_debug():
             self.call_count += 1
@@ -175,8 +189,38 @@ class BaseQuantizer(nn.Module):
             # scopes" depends on whether the input tensors to an operation were traced or not.
             return self.quantize(x, execute_traced_op_as_identity=True)
 
+        if self._is_quantized_weight_cacheable(x):
+            return self._quantize_weight_with_cache(x)
         return self.quantize(x, execute_traced_op_as_identity=False)
 
+    def _is_quantized_weight_cacheable(self, x) -> bool:
+        if self.training or torch.is_grad_enabled() or not isinstance(x, nn.Parameter):
+            return False
+        # The quantization operation must be executed while the dynamic graph is being built
+        ctx = get_current_context()
+        return ctx is None or not ctx.trace_dynamic_graph
+
+    def _get_quantized_weight_cache_key(self, x: torch.Tensor) -> Tuple:
+        # In-place modifications of tensors (e.g. by optimizers or `load_state_dict`) increase the tensor version
+        # pylint: disable=protected-access
+        tensors_state = tuple((t.data_ptr(), t._version) for t in [x, *self.parameters(), *self.buffers()])
+        return tensors_state + (x.dtype, x.device, self.levels, self.level_low, self.level_high)
+
+    def _quantize_weight_with_cache(self, x: torch.Tensor) -> torch.Tensor:
+        key = self._get_quantized_weight_cache_key(x)
+        if self._quantized_weight_cache is not None and self._quantized_weight_cache[0] == key:
+            # The operation is still executed (as identity) so that the traced operations are the same
+            # as without the cache
+            self.quantize(x, execute_traced_op_as_identity=True)
+            return self._quantized_weight_cache[1]
+        self._quantized_weight_cache = None
+        result = self.quantize(x, execute_traced_op_as_identity=False)
+        self._quantized_weight_cache = key, result
+        return result
+
+    def _reset_quantized_weight_cache(self):
+        self._quantized_weight_cache = None
+
     def quantize(self, x, execute_traced_op_as_identity: bool = False):
         raise NotImplementedError
 
@@ -196,6 +240,7 @@ class BaseQuantizer(nn.Module):
         own_device = get_model_device(self)
         min_values = min_values.to(own_device)
         max_values = max_values.to(own_device)
+        self._reset_quantized_weight_cache()
         self._apply_minmax_init(min_values, max_values, log_module_name)
 
     def _apply_minmax_init(self, min_values, max_values, log_module_name: str = None):
@@ -219,6 +264,7 @@ class BaseQuantizer(nn.Module):
 
     @num_bits.setter
     def num_bits(self, num_bits: int):
+        self._reset_quantized_weight_cache()
         self._num_bits.fill_(num_bits)
 
     @property
@@ -231,9 +277,11 @@ class BaseQuantizer(nn.Module):
         return self._scale_shape
 
     def broadcast_initialized_params(self, src: int = 0):
+        self._reset_quantized_weight_cache()
         distributed.broadcast(self._num_bits, src=src)
 
     def set_export_mode(self, mode: QuantizerExportMode):
+        self._reset_quantized_weight_cache()
         self._export_mode = mode
 
     def _get_input_low_input_high(self):
@@ -257,7 +305,35 @@ class BaseQuantizer(nn.Module):
                                                                            input_high)
         return x, y_scale, y_zero_point
 
+    def get_quantization_grid(self) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Returns the grid of the values the quantizer maps its input to in the inference mode:
+        the lowest value and the distance between the neighbour values. The grid has `self.levels` values.
+        """
+        raise NotImplementedError
+
+    def quantize_to_codes(self, x: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """
+        Quantizes the input to the integer codes of the quantization grid values, so that
+        the quantized input is `(codes - zero_point) * scale`.
+
+        :param x: The input tensor.
+        :return: The uint8 codes and the scale and the zero point broadcastable to the input shape.
+        """
+        self.set_level_ranges()
+        if self.levels > 256:
+            raise RuntimeError('Can not represent the {}-level quantization with uint8 codes'.format(self.levels))
+        with torch.no_grad():
+            input_low, step = self.get_quantization_grid()
+            quantized_x = self.quantize(x.detach(), execute_traced_op_as_identity=False)
+            codes = torch.clamp(torch.round((quantized_x - input_low) / step), 0, self.levels - 1)
+        return codes.to(torch.uint8), step, -input_low / step
+
     def run_export_quantization(self, x: torch.Tensor):
+        if self._export_mode == QuantizerExportMode.PACKED_WEIGHTS:
+            with no_jit_trace():
+                codes, scale, zero_point = self.quantize_to_codes(x)
+            return ExportPackedWeightToONNXDequant.apply(x, codes, scale, zero_point)
         if self._export_mode == QuantizerExportMode.FAKE_QUANTIZE:
             x, levels, input_low, input_high = self._prepare_fq_export_quantization(x)
             return ExportQuantizeToFakeQuantize.apply(x, levels,
@@ -430,6 +506,7 @@ class SymmetricQuantizer(BaseQuantizer):
 
     @signed.setter
     def signed(self, signed: bool):
+        self._reset_quantized_weight_cache()
         self.signed_tensor.fill_(signed)
 
     def quantize(self, x, execute_traced_op_as_identity: bool = False):
@@ -471,6 +548,10 @@ class SymmetricQuantizer(BaseQuantizer):
         input_high = input_range
         return input_low, input_high
 
+    def get_quantization_grid(self) -> Tuple[torch.Tensor, torch.Tensor]:
+        input_low, input_high = self._get_input_low_input_high(self.scale, self.level_low, self.level_high, self.eps)
+        return input_low, (input_high - input_low) / (self.levels - 1)
+
     def _prepare_export_quantization(self, x: torch.Tensor):
         with no_jit_trace():
             input_low, input_high = self._get_input_low_input_high(self.scale,
@@ -609,6 +690,10 @@ class AsymmetricQuantizer(BaseQuantizer):
         input_high = input_low + input_range_tuned
         return input_low, input_high
 
+    def get_quantization_grid(self) -> Tuple[torch.Tensor, torch.Tensor]:
+        input_low, input_high = self._get_input_low_input_high(self.input_range, self.input_low, self.levels, self.eps)
+        return input_low, (input_high - input_low) / (self.levels - 1)
+
     def _prepare_export_quantization(self, x: torch.Tensor):
         with no_jit_trace():
             input_low, input_high = self._get_input_low_input_high(self.input_range,
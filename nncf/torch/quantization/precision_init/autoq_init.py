@@ -46,7 +46,8 @@ class AutoQPrecisionInitParams(BasePrecisionInitParams):
                  hw_cfg_type: HWConfigType = None,
                  skip_constraint: bool = False,
                  finetune: bool = False,
-                 bits: List[int] = None):
+                 bits: List[int] = None,
+                 surrogate_warmup_eval_number: int = 0):
         super().__init__(user_init_args)
         self.dump_autoq_data = dump_autoq_data
         self.iter_number = iter_number
@@ -60,6 +61,7 @@ class AutoQPrecisionInitParams(BasePrecisionInitParams):
         self.skip_constraint = skip_constraint
         self.finetune = finetune
         self.bits = bits
+        self.surrogate_warmup_eval_number = surrogate_warmup_eval_number
 
     @classmethod
     def from_config(cls, autoq_init_config_dict: Dict,
@@ -73,6 +75,7 @@ class AutoQPrecisionInitParams(BasePrecisionInitParams):
         skip_constraint = dict_copy.pop('skip_constraint', False)
         finetune = dict_copy.pop('finetune', False)
         bits = dict_copy.pop('bits',  [2, 4, 8])
+        surrogate_warmup_eval_number = dict_copy.pop('surrogate_warmup_eval_number', 0)
 
         return cls(
             user_init_args=user_init_args,
@@ -84,7 +87,8 @@ class AutoQPrecisionInitParams(BasePrecisionInitParams):
             eval_subset_ratio=eval_subset_ratio,
             skip_constraint=skip_constraint,
             finetune=finetune,
-            bits=bits)
+            bits=bits,
+            surrogate_warmup_eval_number=surrogate_warmup_eval_number)
 
 
 class AutoQPrecisionInitializer(BasePrecisionInitializer):
@@ -140,7 +144,8 @@ class AutoQPrecisionInitializer(BasePrecisionInitializer):
             finetune=self._params.finetune,
             bits=self._params.bits,
             dump_init_precision_data=self._dump_autoq_data,
-            log_dir=Path(DEBUG_LOG_DIR) / Path("autoq"))
+            log_dir=Path(DEBUG_LOG_DIR) / Path("autoq"),
+            surrogate_warmup_eval_number=self._params.surrogate_warmup_eval_number)
 
         # Instantiate Quantization Environment
         env = QuantizationEnv(
@@ -0,0 +1,187 @@
+"""
+ Copyright (c) 2022 Intel Corporation
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+      http://www.apache.org/licenses/LICENSE-2.0
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+import hashlib
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import torch
+from torch.utils.data import DataLoader
+from torch.utils.data import SequentialSampler
+
+from nncf.common.quantization.structs import QuantizerConfig
+from nncf.common.utils.logger import logger as nncf_logger
+from nncf.torch.layers import NNCF_PADDING_VALUE_ATTR_NAME
+from nncf.torch.nested_objects_traversal import objwalk
+from nncf.torch.nncf_network import NNCFNetwork
+from nncf.torch.quantization.layers import BaseQuantizer
+from nncf.torch.quantization.precision_init.perturbations import Perturbations
+from nncf.torch.utils import is_tensor
+
+HAWQ_CACHE_VERSION = 2
+
+
+def _update_with_tensor(hasher: 'hashlib._Hash', tensor: torch.Tensor):
+    tensor = tensor.detach().cpu().contiguous()
+    hasher.update(str((tensor.dtype, tuple(tensor.shape))).encode())
+    # The raw bytes are hashed, since numpy has no counterpart for some of the dtypes, e.g. bfloat16
+    hasher.update(tensor.reshape(-1).view(torch.uint8).numpy().tobytes())
+
+
+def get_model_fingerprint(model: NNCFNetwork, quantized_weight_ids: List[Any]) -> str:
+    """
+    Calculates the digest of the model graph structure, of the weights of the original model
+    and of the set of the quantized weights.
+
+    :param model: The compressed model.
+    :param quantized_weight_ids: Identifiers of the weight quantizers in the execution order.
+    :return: Hex digest of the model.
+    """
+    hasher = hashlib.sha256()
+    graph = model.get_original_graph()
+    for node in sorted(graph.get_all_nodes(), key=lambda x: x.node_name):
+        layer_attributes = node.layer_attributes
+        if layer_attributes is not None:
+            # Layer attributes have no stable string representation
+            layer_attributes = sorted(vars(layer_attributes).items())
+        hasher.update('{}:{}:{}'.format(node.node_name, node.node_type, layer_attributes).encode())
+    edges = sorted('{}->{}:{}'.format(edge.from_node.node_name, edge.to_node.node_name, edge.input_port_id)
+                   for edge in graph.get_all_edges())
+    hasher.update('\n'.join(edges).encode())
+    hasher.update('\n'.join(str(qid) for qid in quantized_weight_ids).encode())
+    for key, value in model.get_nncf_wrapped_model().state_dict().items():
+        if 'pre_ops.' in key or 'post_ops.' in key or key.endswith('.' + NNCF_PADDING_VALUE_ATTR_NAME):
+            continue
+        hasher.update(key.encode())
+        _update_with_tensor(hasher, value)
+    return hasher.hexdigest()
+
+
+def get_weight_quantizers_fingerprint(weight_quantizers: Dict[Any, BaseQuantizer]) -> str:
+    """
+    Calculates the digest of the weight quantizers settings that the quantization noise depends on: the level
+    ranges (narrow range, half range used for the overflow fix, signedness) and the quantizer ranges set by
+    the range initialization.
+
+    :param weight_quantizers: The weight quantizer modules per quantizer id in the execution order.
+    :return: Hex digest of the weight quantizers.
+    """
+    hasher = hashlib.sha256()
+    for qid, quantizer in weight_quantizers.items():
+        # pylint:disable=protected-access
+        hasher.update(str((str(qid), type(quantizer).__name__, quantizer.narrow_range, quantizer._half_range,
+                           quantizer._signedness_to_force, quantizer.per_channel,
+                           quantizer.is_using_log_scale_storage)).encode())
+        for key, value in sorted(quantizer.state_dict().items()):
+            # The bitwidth is set by the quantizer configuration each noise value is calculated for
+            if key.endswith('_num_bits'):
+                continue
+            hasher.update(key.encode())
+            _update_with_tensor(hasher, value)
+    return hasher.hexdigest()
+
+
+def get_data_loader_fingerprint(data_loader: DataLoader, num_data_points: int) -> str:
+    """
+    Calculates the digest of the data used for the Hessian traces estimation. The contents of the first batch
+    are only taken into account for the data loaders without shuffling, for the others the digest is
+    defined by the dataset type, its size and the batch size.
+
+    :param data_loader: The initializing data loader.
+    :param num_data_points: Number of the data points used for the estimation.
+    :return: Hex digest of the data.
+    """
+    hasher = hashlib.sha256()
+    dataset = getattr(data_loader, 'dataset', None)
+    try:
+        dataset_size = len(dataset)
+    except TypeError:
+        dataset_size = None
+    sampler = getattr(data_loader, 'sampler', None)
+    hasher.update(str((type(dataset).__name__, dataset_size, getattr(data_loader, 'batch_size', None),
+                       type(sampler).__name__, num_data_points)).encode())
+    if isinstance(sampler, SequentialSampler):
+        objwalk(next(iter(data_loader)), is_tensor, lambda x: _update_with_tensor(hasher, x) or x)
+    return hasher.hexdigest()
+
+
+class HAWQCache:
+    """
+    On-disk cache of the data that is the most expensive to obtain within the HAWQ precision initialization:
+    the average Hessian traces per layer and the quantization noise of each weight quantizer for each
+    quantizer configuration. Re-running the initialization for the same model with a different compression ratio
+    or a different set of bitwidths skips the traces estimation and only calculates the missing perturbations.
+
+    The traces are keyed by the model fingerprint (graph structure, weights and quantized weights), by the
+    initializing data and by the estimator parameters. The perturbations don't depend on the data and are
+    keyed by the model fingerprint and by the settings and the ranges of the weight quantizers.
+    """
+
+    def __init__(self, cache_dir: str, model_fingerprint: str, traces_key: str, perturbations_key: str):
+        self._cache_dir = Path(cache_dir)
+        self._traces_digest = hashlib.sha256((model_fingerprint + traces_key).encode()).hexdigest()
+        self._perturbations_digest = hashlib.sha256((model_fingerprint + perturbations_key).encode()).hexdigest()
+
+    @property
+    def traces_path(self) -> Path:
+        return self._cache_dir / 'hawq_traces_{}.pth'.format(self._traces_digest[:32])
+
+    @property
+    def perturbations_path(self) -> Path:
+        return self._cache_dir / 'hawq_perturbations_{}.pth'.format(self._perturbations_digest[:32])
+
+    def load_traces(self, device: str = None) -> Optional[torch.Tensor]:
+        content = self._load(self.traces_path, self._traces_digest)
+        if content is None:
+            return None
+        nncf_logger.info('Loaded cached Hessian traces from {}'.format(self.traces_path))
+        return content.to(device)
+
+    def save_traces(self, traces: torch.Tensor):
+        self._save(self.traces_path, self._traces_digest, traces.detach().cpu())
+
+    def load_perturbations(self, device: str = None) -> Perturbations:
+        perturbations = Perturbations()
+        content = self._load(self.perturbations_path, self._perturbations_digest)
+        if content is not None:
+            for layer_id, qconfig_state, perturbation in content:
+                perturbations.add(layer_id, QuantizerConfig.from_state(qconfig_state), perturbation.to(device))
+            nncf_logger.info('Loaded {} cached quantization noise values from {}'.format(len(content),
+                                                                                          self.perturbations_path))
+        return perturbations
+
+    def save_perturbations(self, perturbations: Perturbations):
+        content = [(layer_id, qconfig.get_state(), perturbation.detach().cpu())
+                   for layer_id, perturbations_per_qconfig in perturbations.get_all().items()
+                   for qconfig, perturbation in perturbations_per_qconfig.items()]
+        self._save(self.perturbations_path, self._perturbations_digest, content)
+
+    @staticmethod
+    def _load(path: Path, digest: str) -> Any:
+        if not path.is_file():
+            return None
+        try:
+            cached = torch.load(str(path), map_location='cpu')
+        except Exception as error:  # pylint:disable=broad-except
+            nncf_logger.warning('Failed to read the HAWQ cache file {}: {}'.format(path, error))
+            return None
+        if not isinstance(cached, dict) or cached.get('version') != HAWQ_CACHE_VERSION or \
+                cached.get('digest') != digest:
+            return None
+        return cached['content']
+
+    def _save(self, path: Path, digest: str, content: Any):
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp{}'.format(os.getpid()))
+        torch.save({'version': HAWQ_CACHE_VERSION, 'digest': digest, 'content': content}, str(tmp_path))
+        os.replace(str(tmp_path), str(path))
@@ -38,6 +38,10 @@ from nncf.torch.quantization.precision_init.adjacent_quantizers import GroupsOfA
 from nncf.torch.quantization.precision_init.base_init import BasePrecisionInitParams
 from nncf.torch.quantization.precision_init.base_init import BasePrecisionInitializer
 from nncf.torch.quantization.precision_init.compression_ratio import CompressionRatioCalculator
+from nncf.torch.quantization.precision_init.hawq_cache import HAWQCache
+from nncf.torch.quantization.precision_init.hawq_cache import get_data_loader_fingerprint
+from nncf.torch.quantization.precision_init.hawq_cache import get_model_fingerprint
+from nncf.torch.quantization.precision_init.hawq_cache import get_weight_quantizers_fingerprint
 from nncf.torch.quantization.precision_init.hawq_debug import HAWQDebugger
 from nncf.torch.quantization.precision_init.perturbations import PerturbationObserver
 from nncf.torch.quantization.precision_init.perturbations import Perturbations
@@ -74,9 +78,11 @@ class HAWQPrecisionInitParams(BasePrecisionInitParams):
                  num_data_points: int = None,
                  iter_number: int = None,
                  tolerance: float = None,
+                 num_probes: int = None,
                  compression_ratio: float = None,
                  dump_hawq_data: bool = None,
-                 bitwidth_assignment_mode: BitwidthAssignmentMode = None):
+                 bitwidth_assignment_mode: BitwidthAssignmentMode = None,
+                 cache_dir: str = None):
         super().__init__(user_init_args)
         self.bitwidths = bitwidths
         self.bitwidth_per_scope = bitwidth_per_scope
@@ -84,9 +90,11 @@ class HAWQPrecisionInitParams(BasePrecisionInitParams):
         self.num_data_points = num_data_points
         self.iter_number = iter_number
         self.tolerance = tolerance
+        self.num_probes = num_probes
         self.compression_ratio = compression_ratio
         self.dump_hawq_data = dump_hawq_data
         self.bitwidth_assignment_mode = bitwidth_assignment_mode
+        self.cache_dir = cache_dir
 
     @classmethod
     def from_config(cls, hawq_init_config_dict: Dict,
@@ -98,11 +106,13 @@ class HAWQPrecisionInitParams(BasePrecisionInitParams):
             num_data_points=hawq_init_config_dict.get('num_data_points', 100),
             iter_number=hawq_init_config_dict.get('iter_number', 200),
             tolerance=hawq_init_config_dict.get('tolerance', 1e-4),
+            num_probes=hawq_init_config_dict.get('num_probes', 1),
             compression_ratio=hawq_init_config_dict.get('compression_ratio', 1.5),
             dump_hawq_data=hawq_init_config_dict.get('dump_init_precision_data', False),
             bitwidth_assignment_mode=BitwidthAssignmentMode.from_str(
                 hawq_init_config_dict.get('bitwidth_assignment_mode', BitwidthAssignmentMode.LIBERAL.value)
-            )
+            ),
+            cache_dir=hawq_init_config_dict.get('cache_dir', None)
         )
 
 
@@ -236,6 +246,7 @@ class HAWQPrecisionInitializer(BasePrecisionInitializer):
         self._num_data_points = params.num_data_points
         self._iter_number = params.iter_number
         self._tolerance = params.tolerance
+        self._num_probes = params.num_probes
         self._compression_ratio = params.compression_ratio
         self._bitwidths = self._hw_precision_constraints.get_all_unique_bitwidths() \
             if self._hw_precision_constraints else params.bitwidths
@@ -248,6 +259,8 @@ class HAWQPrecisionInitializer(BasePrecisionInitializer):
             flops_per_module, current_quantizer_setup,
             self._groups_of_adjacent_quantizers.weight_qp_id_per_activation_qp_id)
         self._dump_hawq_data = params.dump_hawq_data
+        self._cache_dir = params.cache_dir
+        self._cache = None  # type: HAWQCache
         self._original_qp_id_vs_quantizer_module_id_dict = deepcopy(algo.setup_to_module_id_translation_dict)
 
     def apply_init(self) -> SingleConfigQuantizerSetup:
@@ -257,6 +270,9 @@ class HAWQPrecisionInitializer(BasePrecisionInitializer):
         original_device = get_model_device(self._model)
         self._model.to(self._init_device)
 
+        if self._cache_dir:
+            self._cache = self._create_cache()
+
         traces_per_layer = self._calc_traces(self._criterion_fn, self._criterion, self._iter_number, self._tolerance)
         if not traces_per_layer:
             raise RuntimeError('Failed to calculate hessian traces!')
@@ -294,7 +310,7 @@ class HAWQPrecisionInitializer(BasePrecisionInitializer):
             raise AttributeError('Invalid compression ratio={}. Should be within range [{:.3f}, {:.3f}]'.format(
                 self._compression_ratio, min_ratio, max_ratio))
 
-        perturbations, weight_observers = self.calc_quantization_noise(covering_qconfig_sequences, traces_order)
+        perturbations, weight_observers = self._get_quantization_noise(covering_qconfig_sequences, traces_order)
 
         metric_per_qconfig_sequence = self.calc_hawq_metric_per_qconfig_sequence(
             weight_qconfig_sequences_in_trace_order, perturbations,
@@ -442,6 +458,10 @@ class HAWQPrecisionInitializer(BasePrecisionInitializer):
                      iter_number: int, tolerance: float) -> TracesPerLayer:
         if self._traces_per_layer_path:
             return TracesPerLayer(torch.load(self._traces_per_layer_path).to(self._init_device))
+        if self._cache is not None:
+            cached_traces = self._cache.load_traces(self._init_device)
+            if cached_traces is not None:
+                return TracesPerLayer(cached_traces)
 
         quantizers_switcher = QuantizersSwitcher(list(self._all_quantizers_per_scope.values()))
         params_to_restore = self.disable_all_gradients_except_weights_of_quantized_modules(
@@ -451,7 +471,7 @@ class HAWQPrecisionInitializer(BasePrecisionInitializer):
             self._quantizers_handler.get_skipped_quantized_weight_node_names())
 
         trace_estimator = HessianTraceEstimator(self._model, criterion_fn, criterion, self._init_device,
-                                                self._data_loader, self._num_data_points)
+                                                self._data_loader, self._num_data_points, self._num_probes)
         try:
             avg_traces = trace_estimator.get_average_traces(max_iter=iter_number, tolerance=tolerance)
         except RuntimeError as error:
@@ -466,8 +486,18 @@ class HAWQPrecisionInitializer(BasePrecisionInitializer):
         self.restore_disabled_gradients(quantizers_switcher, self._model, self._algo.weight_quantizers,
                                         params_to_restore)
 
+        if self._cache is not None:
+            self._cache.save_traces(avg_traces)
         return TracesPerLayer(avg_traces)
 
+    def _create_cache(self) -> HAWQCache:
+        quantized_weight_ids = list(self._weight_quantizations_by_execution_order.keys())
+        model_fingerprint = get_model_fingerprint(self._model, quantized_weight_ids)
+        traces_key = str((get_data_loader_fingerprint(self._data_loader, self._num_data_points),
+                          self._iter_number, self._tolerance, self._num_probes, type(self._criterion).__name__))
+        perturbations_key = get_weight_quantizers_fingerprint(self._weight_quantizations_by_execution_order)
+        return HAWQCache(self._cache_dir, model_fingerprint, traces_key, perturbations_key)
+
     @staticmethod
     def restore_disabled_gradients(quantizers_switcher: QuantizersSwitcher,
                                    model: nn.Module,
@@ -572,6 +602,34 @@ class HAWQPrecisionInitializer(BasePrecisionInitializer):
 
         return perturbations, observers_for_all_qconfig_sequences
 
+    def _get_quantization_noise(self, covering_qconfig_sequences: List[CoveringQConfigSequenceForQuantNoiseCalculation],
+                                traces_order: TracesOrder) -> Tuple[Perturbations, List[List[PerturbationObserver]]]:
+        """
+        Calculates the quantization noise for the covering sequences, reusing the cached noise values if any.
+        The observers are only collected when the noise is calculated for all sequences, i.e. the cache
+        is not used for reading in the debug mode or when the HAWQ data is dumped.
+        """
+        if self._cache is None:
+            return self.calc_quantization_noise(covering_qconfig_sequences, traces_order)
+        if is_debug() or self._dump_hawq_data:
+            perturbations, weight_observers = self.calc_quantization_noise(covering_qconfig_sequences, traces_order)
+            self._cache.save_perturbations(perturbations)
+            return perturbations, weight_observers
+
+        perturbations = self._cache.load_perturbations(self._init_device)
+        missing_qconfig_sequences = []
+        for qconfig_sequence in covering_qconfig_sequences:
+            if not all(perturbations.contains(traces_order.get_execution_index_by_traces_index(trace_idx), qconfig)
+                       for trace_idx, qconfig in enumerate(qconfig_sequence)):
+                missing_qconfig_sequences.append(qconfig_sequence)
+        if missing_qconfig_sequences:
+            new_perturbations, _ = self.calc_quantization_noise(missing_qconfig_sequences, traces_order)
+            for layer_id, perturbations_per_qconfig in new_perturbations.get_all().items():
+                for qconfig, perturbation in perturbations_per_qconfig.items():
+                    perturbations.add(layer_id, qconfig, perturbation)
+            self._cache.save_perturbations(perturbations)
+        return perturbations, []
+
     @staticmethod
     def calc_hawq_metric_per_qconfig_sequence(qconfig_sequences_in_trace_order: List[QConfigSequenceForHAWQToEvaluate],
                                               perturbations: Perturbations,
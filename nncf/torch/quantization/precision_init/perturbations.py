@@ -57,6 +57,9 @@ class Perturbations:
         else:
             self._perturbations[layer_id] = {qconfig: perturbation}
 
+    def contains(self, layer_id: int, qconfig: QuantizerConfig) -> bool:
+        return qconfig in self._perturbations.get(layer_id, {})
+
     def get(self, layer_id: int, qconfig: QuantizerConfig) -> Tensor:
         layer_perturbations = self._perturbations[layer_id]
         return layer_perturbations[qconfig]
@@ -148,6 +148,27 @@ class ExportQuantizeToONNXQuantDequant(torch.autograd.Function):
         return grad_output
 
 
+class ExportPackedWeightToONNXDequant(torch.autograd.Function):
+    """
+    Exports the quantized weight as the integer codes stored in an uint8 initializer,
+    which are dequantized by the standard ONNX operations.
+    """
+
+    @staticmethod
+    def symbolic(g, input_, codes, scale, zero_point):
+        float_codes = g.op("Cast", codes, to_i=1)  # TensorProto.FLOAT
+        return g.op("Mul", g.op("Sub", float_codes, zero_point), scale)
+
+    @staticmethod
+    def forward(ctx, input_, codes, scale, zero_point):
+        return torch.clone(input_)
+
+    @staticmethod
+    def backward(ctx, grad_output):
+        # backward is not used during export
+        return grad_output
+
+
 def get_scale_zp_from_input_low_input_high(level_low, level_high, input_low, input_high):
     levels = level_high - level_low + 1
     assert levels in [255, 256], "Can only export to INT8 256-level ONNX Quantize/Dequantize pairs"
@@ -0,0 +1,58 @@
+"""
+ Copyright (c) 2022 Intel Corporation
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+      http://www.apache.org/licenses/LICENSE-2.0
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+# pylint:disable=invalid-name
+from typing import List
+
+import torch
+
+
+def sum_like(tensor_to_sum: torch.Tensor, ref_tensor: torch.Tensor) -> torch.Tensor:
+    if ref_tensor.numel() == 1:
+        return tensor_to_sum.sum().view_as(ref_tensor)
+    for dim, size in enumerate(ref_tensor.shape):
+        if size == 1:
+            tensor_to_sum = tensor_to_sum.sum(dim, keepdim=True)
+    return tensor_to_sum
+
+
+class ReferenceQuantizedFunctions:
+    """
+    PyTorch implementation of the functions of the quantization extensions, used if the
+    extensions cannot be built in the current environment.
+    """
+
+    @staticmethod
+    def Quantize_forward(input_: torch.Tensor, input_low: torch.Tensor, input_range: torch.Tensor,
+                         levels: int) -> torch.Tensor:
+        scale = (levels - 1) / input_range
+        output = torch.max(torch.min(input_, input_low + input_range), input_low)
+        zero_point = (-input_low * scale).round_()
+        output = output.sub_(input_low).mul_(scale).sub_(zero_point).round_()
+        return output.div_(scale)
+
+    @staticmethod
+    def Quantize_backward(grad_output: torch.Tensor, input_: torch.Tensor, input_low: torch.Tensor,
+                          input_range: torch.Tensor, levels: int, level_low: int, level_high: int,
+                          is_asymmetric: bool) -> List[torch.Tensor]:
+        # pylint:disable=unused-argument
+        output = ReferenceQuantizedFunctions.Quantize_forward(input_, input_low, input_range, levels)
+        mask_hi = input_ > (input_low + input_range)
+        mask_lo = input_ < input_low
+        err = (output - input_).mul_(input_range.reciprocal())
+        err = err.masked_fill_(mask_hi, 1).masked_fill_(mask_lo, level_low / level_high).mul_(grad_output)
+        grad_input_range = sum_like(err, input_range)
+
+        outside_mask = mask_hi.logical_or_(mask_lo)
+        grad_input = grad_output.masked_fill(outside_mask, 0)
+        grad_input_low = sum_like(grad_output.masked_fill(outside_mask.logical_not_(), 0), input_low)
+        return [grad_input, grad_input_low, grad_input_range]
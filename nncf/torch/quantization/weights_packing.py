@@ -0,0 +1,243 @@
+"""
+ Copyright (c) 2022 Intel Corporation
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+      http://www.apache.org/licenses/LICENSE-2.0
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import torch
+
+from nncf.common.utils.logger import logger as nncf_logger
+from nncf.torch.checkpoint_loading import LazyStateDict
+from nncf.torch.checkpoint_loading import LazyTensor
+from nncf.torch.checkpoint_loading import load_checkpoint
+from nncf.torch.layer_utils import _NNCFModuleMixin
+from nncf.torch.layers import NNCF_PADDING_VALUE_ATTR_NAME
+from nncf.torch.module_operations import UpdateParameter
+from nncf.torch.module_operations import UpdateParameterList
+from nncf.torch.nncf_network import EXTERNAL_QUANTIZERS_STORAGE_NAME
+from nncf.torch.nncf_network import NNCFNetwork
+from nncf.torch.quantization.layers import BaseQuantizer
+
+PACKED_CHECKPOINT_VERSION = 1
+MAX_NIBBLE_PACKED_LEVELS = 16
+MAX_BYTE_PACKED_LEVELS = 256
+
+
+def pack_int4(codes: torch.Tensor) -> torch.Tensor:
+    """
+    Packs the flattened 4-bit codes into bytes, two codes per byte (the first one in the lower nibble).
+
+    :param codes: Unsigned integer codes in the [0, 15] range.
+    :return: The uint8 tensor with (codes.numel() + 1) // 2 elements.
+    """
+    codes = codes.flatten().to(torch.uint8)
+    if codes.numel() % 2:
+        codes = torch.cat([codes, codes.new_zeros(1)])
+    return codes[0::2] | (codes[1::2] << 4)
+
+
+def unpack_int4(packed: torch.Tensor, numel: int) -> torch.Tensor:
+    """
+    Unpacks the codes packed by `pack_int4`.
+
+    :param packed: The uint8 tensor of packed codes.
+    :param numel: The number of the packed codes.
+    :return: The flattened uint8 tensor of codes.
+    """
+    codes = torch.stack([packed & 0x0F, packed >> 4], dim=1).flatten()
+    return codes[:numel]
+
+
+class PackedWeight(LazyTensor):
+    """
+    Weight of the quantized model stored as the integer codes of the quantization grid values
+    along with the per-tensor or per-channel scales and zero points. The weight is dequantized to
+    `(codes - zero_point) * scale` only when it is materialized.
+    """
+
+    def __init__(self, components: Dict[str, torch.Tensor], shape: Tuple[int, ...], num_bits: int):
+        # pylint:disable=super-init-not-called
+        self._components = components
+        self._size = torch.Size(shape)
+        self.num_bits = num_bits
+
+    @classmethod
+    def from_quantizer(cls, quantizer: BaseQuantizer, weight: torch.Tensor) -> Optional['PackedWeight']:
+        """
+        Packs the weight quantized by the quantizer.
+
+        :param quantizer: The weight quantizer.
+        :param weight: The weight which is fed to the quantizer.
+        :return: The packed weight, or None if the quantizer has more levels than 8-bit codes can represent.
+        """
+        quantizer.set_level_ranges()
+        levels = quantizer.levels
+        if levels > MAX_BYTE_PACKED_LEVELS:
+            return None
+        codes, scale, zero_point = quantizer.quantize_to_codes(weight)
+        num_bits = 4 if levels <= MAX_NIBBLE_PACKED_LEVELS else 8
+        if num_bits == 4:
+            codes = pack_int4(codes)
+        components = {
+            'codes': codes.flatten().cpu(),
+            'scale': scale.detach().float().cpu(),
+            'zero_point': zero_point.detach().float().cpu()
+        }
+        return cls(components, tuple(weight.shape), num_bits)
+
+    @property
+    def dtype(self) -> torch.dtype:
+        return torch.float32
+
+    @property
+    def components(self) -> Dict[str, torch.Tensor]:
+        return self._components
+
+    def materialize(self) -> torch.Tensor:
+        codes = self._components['codes']
+        if self.num_bits == 4:
+            codes = unpack_int4(codes, self._size.numel())
+        codes = codes.reshape(self._size).float()
+        return (codes - self._components['zero_point']) * self._components['scale']
+
+
+def _get_weight_quantizer(model: NNCFNetwork, operand) -> Optional[BaseQuantizer]:
+    if isinstance(operand, BaseQuantizer):
+        return operand
+    quantizer_storage_key = getattr(operand, 'quantizer_storage_key', None)
+    if quantizer_storage_key is not None:
+        return getattr(model, EXTERNAL_QUANTIZERS_STORAGE_NAME)[quantizer_storage_key]
+    return None
+
+
+def _get_compressed_module_params(model: NNCFNetwork,
+                                  module: torch.nn.Module) -> Tuple[Dict[str, torch.Tensor], Dict[str, PackedWeight]]:
+    """
+    Applies the weight pre-ops of the NNCF module to its parameters and packs the quantized weights.
+    """
+    params = {name: param for name, param in module.named_parameters(recurse=False)}
+    packed_params = {}  # type: Dict[str, PackedWeight]
+    with torch.no_grad():
+        for op in module.pre_ops.values():
+            if isinstance(op, UpdateParameter):
+                # pylint:disable=protected-access
+                param_name = op._param_name
+                if param_name not in params:
+                    continue
+                if param_name in packed_params:
+                    raise RuntimeError('Can not pack the {} parameter of the {} module, since it is modified after '
+                                       'the quantization'.format(param_name, type(module).__name__))
+                quantizer = _get_weight_quantizer(model, op.operand)
+                if quantizer is not None and quantizer.is_enabled_quantization():
+                    packed_weight = PackedWeight.from_quantizer(quantizer, params[param_name])
+                    if packed_weight is not None:
+                        packed_params[param_name] = packed_weight
+                        continue
+                    nncf_logger.warning('Can not pack the {}-bit quantized weight, it will be saved in '
+                                        'floating point'.format(quantizer.num_bits))
+                params[param_name] = (quantizer or op.operand)(params[param_name])
+            elif isinstance(op, UpdateParameterList):
+                # pylint:disable=protected-access
+                param_names = op._param_names
+                if any(name in packed_params for name in param_names):
+                    raise RuntimeError('Can not pack the parameters of the {} module, since they are modified '
+                                       'after the quantization'.format(type(module).__name__))
+                updated_values = op.operand(**{name: params[name] for name in param_names})
+                params.update(zip(param_names, updated_values))
+    for name in packed_params:
+        del params[name]
+    return params, packed_params
+
+
+def collect_packed_state_dict(model: NNCFNetwork) -> LazyStateDict:
+    """
+    Collects the state dict of the original model, where the weights of the quantized NNCF modules
+    are replaced by the packed integer weights and the other compression operations
+    (e.g. sparsity masks) are applied to the parameters.
+
+    Activation quantizers are not the part of the state dict, only the weight compression is preserved.
+
+    :param model: The compressed model.
+    :return: The state dict with the PackedWeight values for the quantized weights.
+    """
+    wrapped_model = model.get_nncf_wrapped_model()
+    compressed_params = {}
+    for module_name, module in wrapped_model.named_modules():
+        if isinstance(module, _NNCFModuleMixin):
+            prefix = module_name + '.' if module_name else ''
+            params, packed_params = _get_compressed_module_params(model, module)
+            compressed_params.update({prefix + name: value for name, value in params.items()})
+            compressed_params.update({prefix + name: value for name, value in packed_params.items()})
+
+    state_dict = LazyStateDict()
+    for key, value in wrapped_model.state_dict().items():
+        if 'pre_ops.' in key or 'post_ops.' in key or key.endswith('.' + NNCF_PADDING_VALUE_ATTR_NAME):
+            continue
+        state_dict.set_lazy(key, compressed_params.get(key, value))
+    return state_dict
+
+
+def save_packed_checkpoint(model: NNCFNetwork, path: str) -> None:
+    """
+    Saves the compressed model into a compact checkpoint with the quantized weights stored as 8-bit codes,
+    or as 4-bit codes packed by two into a byte for the quantizers with no more than 16 levels.
+    Use `load_packed_checkpoint` to load the checkpoint.
+
+    :param model: The compressed model.
+    :param path: The path to the checkpoint.
+    """
+    state_dict = collect_packed_state_dict(model)
+    tensors = OrderedDict()
+    packed_weights = OrderedDict()
+    packed_weights_info = OrderedDict()
+    for key in state_dict:
+        value = state_dict.get_lazy(key)
+        if isinstance(value, PackedWeight):
+            packed_weights[key] = value.components
+            packed_weights_info[key] = {'shape': list(value.size()), 'num_bits': value.num_bits}
+        else:
+            tensors[key] = value.detach().cpu()
+    torch.save({
+        'nncf_packed_checkpoint_version': PACKED_CHECKPOINT_VERSION,
+        'keys': list(state_dict),
+        'state_dict': tensors,
+        'packed_weights': packed_weights,
+        'packed_weights_info': packed_weights_info
+    }, path)
+
+
+def load_packed_checkpoint(path: str) -> LazyStateDict:
+    """
+    Loads the checkpoint saved by `save_packed_checkpoint` on CPU. The packed weights are dequantized
+    only when they are accessed, e.g. one at a time by `load_state_dict` of the original model.
+
+    :param path: The path to the checkpoint.
+    :return: The state dict of the original model.
+    """
+    checkpoint = load_checkpoint(path, map_location='cpu')
+    version = checkpoint.get('nncf_packed_checkpoint_version') if isinstance(checkpoint, dict) else None
+    if version != PACKED_CHECKPOINT_VERSION:
+        raise RuntimeError('{} is not the NNCF packed checkpoint of version {}'.format(path,
+                                                                                     PACKED_CHECKPOINT_VERSION))
+    tensors = checkpoint['state_dict']
+    packed_weights = checkpoint['packed_weights']
+    packed_weights_info = checkpoint['packed_weights_info']
+    state_dict = LazyStateDict()
+    for key in checkpoint['keys']:
+        if key in packed_weights_info:
+            info = packed_weights_info[key]
+            state_dict.set_lazy(key, PackedWeight(packed_weights[key], info['shape'], info['num_bits']))
+        elif isinstance(tensors, LazyStateDict):
+            state_dict.set_lazy(key, tensors.get_lazy(key))
+        else:
+            state_dict.set_lazy(key, tensors[key])
+    return state_dict
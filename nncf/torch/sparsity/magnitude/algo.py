@@ -11,7 +11,7 @@
  limitations under the License.
 """
 from copy import deepcopy
-from typing import List
+from typing import Any, Dict, List, Tuple
 
 import torch
 
@@ -71,6 +71,11 @@ class MagnitudeSparsityController(BaseSparsityAlgoController):
             self._scheduler = StubCompressionScheduler()
 
         self._bn_adaptation = None
+        # Thresholds are selected by the whole set of weights, which is expensive for large models, so the
+        # selected thresholds are cached until the weights of the corresponding modules change. The writes
+        # through `weight.data` are not tracked by the weight version counter, so the cache is also dropped
+        # whenever the masks are set and the controller state is loaded.
+        self._threshold_cache = {}  # type: Dict[Tuple[str, ...], Tuple[Tuple, Dict[float, float]]]
 
         self.set_sparsity_level(sparsity_init)
 
@@ -103,13 +108,19 @@ class MagnitudeSparsityController(BaseSparsityAlgoController):
         nncf_stats.register('magnitude_sparsity', stats)
         return nncf_stats
 
+    def load_state(self, state: Dict[str, Dict[str, Any]]) -> None:
+        super().load_state(state)
+        self._threshold_cache.clear()
+
     def freeze(self, freeze: bool = True):
         for layer in self.sparsified_module_info:
             layer.operand.frozen = freeze
 
     @property
     def compression_rate(self):
-        return self.statistics().magnitude_sparsity.model_statistics.sparsity_level
+        # Only the model sparsity level is needed, there is no need to select the thresholds
+        collector = PTSparseModelStatisticsCollector(self.model, self.sparsified_module_info)
+        return collector.collect().sparsity_level
 
     @compression_rate.setter
     def compression_rate(self, sparsity_level: float):
@@ -127,6 +138,7 @@ class MagnitudeSparsityController(BaseSparsityAlgoController):
             target_sparsified_module_info_list = self.sparsified_module_info # List[SparseModuleInfo]
         else:
             target_sparsified_module_info_list = [target_sparsified_module_info]
+        self._threshold_cache.clear()
         threshold = self._select_threshold(sparsity_level, target_sparsified_module_info_list)
         self._set_masks_for_threshold(threshold, target_sparsified_module_info_list)
 
@@ -134,11 +146,29 @@ class MagnitudeSparsityController(BaseSparsityAlgoController):
             self._run_batchnorm_adaptation()
 
     def _select_threshold(self, sparsity_level, target_sparsified_module_info_list):
-        all_weights = self._collect_all_weights(target_sparsified_module_info_list)
-        if not all_weights:
-            return 0.0
-        all_weights_tensor, _ = torch.cat(all_weights).sort()
-        threshold = all_weights_tensor[int((all_weights_tensor.size(0) - 1) * sparsity_level)].item()
+        modules_key = tuple(minfo.module_node_name for minfo in target_sparsified_module_info_list)
+        # The in-place weight updates (e.g. by an optimizer) increase the version counter of the weight tensor
+        #pylint:disable=protected-access
+        weights_state = tuple((minfo.module.weight.data_ptr(), minfo.module.weight._version)
+                              for minfo in target_sparsified_module_info_list)
+        cached_weights_state, level_vs_threshold = self._threshold_cache.get(modules_key, (None, {}))
+        if cached_weights_state != weights_state:
+            level_vs_threshold = {}
+            self._threshold_cache[modules_key] = weights_state, level_vs_threshold
+        if sparsity_level not in level_vs_threshold:
+            level_vs_threshold[sparsity_level] = self._calculate_threshold(sparsity_level,
+                                                                           target_sparsified_module_info_list)
+        return level_vs_threshold[sparsity_level]
+
+    def _calculate_threshold(self, sparsity_level, target_sparsified_module_info_list):
+        with torch.no_grad():
+            all_weights = self._collect_all_weights(target_sparsified_module_info_list)
+            if not all_weights:
+                return 0.0
+            all_weights_tensor = torch.cat(all_weights)
+            # k-th smallest value is found without sorting a copy of all weights
+            k = int((all_weights_tensor.size(0) - 1) * sparsity_level) + 1
+            threshold = torch.kthvalue(all_weights_tensor, k).values.item()
         return threshold
 
     def _set_masks_for_threshold(self, threshold_val, target_sparsified_module_info_list):
@@ -26,6 +26,7 @@ from nncf.torch.nncf_network import NNCFNetwork
 from nncf.torch.graph.transformations.commands import TransformationPriority
 from nncf.common.tensor_statistics.collectors import ReductionShape
 from nncf.common.tensor_statistics.collectors import TensorStatisticCollectorBase
+from nncf.torch.tensor_statistics.collectors import PTCollectorsGroup
 
 
 class TensorStatisticObservationPoint:
@@ -44,7 +45,7 @@ class TensorStatisticObservationPoint:
 class TensorStatisticsCollectionBuilder(PTCompressionAlgorithmBuilder):
     def __init__(self, config: NNCFConfig,
                  observation_points_vs_collectors: Dict[TensorStatisticObservationPoint,
-                                                        TensorStatisticCollectorBase]):
+                                                        Dict[ReductionShape, TensorStatisticCollectorBase]]):
         super().__init__(config)
         self._observation_points_vs_collectors = observation_points_vs_collectors
 
@@ -54,11 +55,12 @@ class TensorStatisticsCollectionBuilder(PTCompressionAlgorithmBuilder):
         # separate thread reduction step involved. Still, is there a better option here than to rely on GIL?
         layout = PTTransformationLayout()
         for op, rs_vs_collector in self._observation_points_vs_collectors.items():
-            for collector in rs_vs_collector.values():
-                hook_obj = collector.register_input
-                command = PTInsertionCommand(op.insertion_point, hook_obj,
-                                             TransformationPriority.FP32_TENSOR_STATISTICS_OBSERVATION)
-                layout.register(command)
+            # A single hook per observation point, so that the collectors for different reduction shapes
+            # share the reductions of the observed tensor
+            hook_obj = PTCollectorsGroup(list(rs_vs_collector.values())).register_input
+            command = PTInsertionCommand(op.insertion_point, hook_obj,
+                                         TransformationPriority.FP32_TENSOR_STATISTICS_OBSERVATION)
+            layout.register(command)
         return layout
 
     def _build_controller(self, model: NNCFNetwork) -> 'TensorStatisticsCollectionController':
@@ -78,7 +80,7 @@ class TensorStatisticsCollectionBuilder(PTCompressionAlgorithmBuilder):
 
 class TensorStatisticsCollectionController(PTCompressionAlgorithmController):
     def __init__(self, target_model: NNCFNetwork,
-                 ip_vs_collector_dict: Dict[PTTargetPoint, TensorStatisticCollectorBase]):
+                 ip_vs_collector_dict: Dict[PTTargetPoint, Dict[ReductionShape, TensorStatisticCollectorBase]]):
         super().__init__(target_model)
         self.ip_vs_collector_dict = ip_vs_collector_dict
         self._scheduler = StubCompressionScheduler()
@@ -93,12 +95,14 @@ class TensorStatisticsCollectionController(PTCompressionAlgorithmController):
         return self._scheduler
 
     def start_collection(self):
-        for collector in self.ip_vs_collector_dict.values():
-            collector.enable()
+        for rs_vs_collector in self.ip_vs_collector_dict.values():
+            for collector in rs_vs_collector.values():
+                collector.enable()
 
     def stop_collection(self):
-        for collector in self.ip_vs_collector_dict.values():
-            collector.disable()
+        for rs_vs_collector in self.ip_vs_collector_dict.values():
+            for collector in rs_vs_collector.values():
+                collector.disable()
 
     def compression_stage(self) -> CompressionStage:
         return CompressionStage.FULLY_COMPRESSED
@@ -11,7 +11,9 @@
  limitations under the License.
 """
 
-from typing import Union, List, Deque
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Union, List, Deque, Optional, Tuple
 
 import torch
 
@@ -24,9 +26,12 @@ from nncf.common.tensor_statistics.collectors import PercentileStatisticCollecto
 from nncf.common.tensor_statistics.collectors import MeanPercentileStatisticCollector
 from nncf.common.tensor_statistics.collectors import MixedMinMaxStatisticCollector
 from nncf.common.tensor_statistics.collectors import MeanMinMaxStatisticCollector
+from nncf.common.tensor_statistics.collectors import OnlineTensorStatisticCollector
 from nncf.common.tensor_statistics.collectors import ReductionShape
+from nncf.common.tensor_statistics.collectors import TensorStatisticCollectorBase
 from nncf.common.tensor_statistics.reduction import np_percentile_reduce_like
 from nncf.torch.tensor_statistics.reduction import  expand_like
+from nncf.torch.tensor_statistics.reduction import get_channel_count_and_dim_idx
 from nncf.torch.tensor_statistics.statistics import PTMinMaxTensorStatistic
 from nncf.torch.tensor_statistics.statistics import PTMedianMADTensorStatistic
 from nncf.torch.tensor_statistics.statistics import PTPercentileTensorStatistic
@@ -34,6 +39,77 @@ from nncf.torch.dynamic_graph.context import no_nncf_trace
 from nncf.torch.tensor import PTNNCFTensor
 
 
+class PTSharedReductionsCache:
+    """
+    Memoizes the reductions of the input tensors that are registered in several collectors at once.
+    Each reduction of a tensor is computed on the tensor's device only once, and a reduction over a superset
+    of the already reduced axes is derived from the (smaller) already reduced tensor instead of the input.
+    """
+
+    def __init__(self):
+        # Tensors are compared by identity, therefore the cache holds references to the source tensors
+        # to make sure that their ids are not reused while the cache is alive.
+        self._reductions = []  # type: List[Tuple[torch.Tensor, Callable, Tuple[int, ...], torch.Tensor]]
+        self._abs_values = []  # type: List[Tuple[torch.Tensor, torch.Tensor]]
+
+    def abs(self, x: torch.Tensor) -> torch.Tensor:
+        for source, result in self._abs_values:
+            if source is x:
+                return result
+        result = torch.abs(x)
+        self._abs_values.append((x, result))
+        return result
+
+    def reduce(self, x: torch.Tensor, reduction_fn: Callable, axis: Union[int, tuple]) -> torch.Tensor:
+        axes = (axis,) if isinstance(axis, int) else tuple(axis)
+        axes = tuple(sorted({a % x.dim() for a in axes})) if x.dim() else axes
+        if not axes:
+            return reduction_fn(x, dim=axis)
+
+        best_match = None
+        for source, fn, reduced_axes, result in self._reductions:
+            if source is x and fn is reduction_fn and set(reduced_axes) <= set(axes):
+                if best_match is None or len(reduced_axes) > len(best_match[0]):
+                    best_match = reduced_axes, result
+        if best_match is None:
+            result = reduction_fn(x, dim=axes)
+        else:
+            reduced_axes, reduced = best_match
+            if reduced_axes == axes:
+                return reduced
+            # Indices of the axes that remain to be reduced in the already reduced tensor
+            remaining_axes = tuple(a - sum(1 for r in reduced_axes if r < a) for a in axes if a not in reduced_axes)
+            result = reduction_fn(reduced, dim=remaining_axes)
+        self._reductions.append((x, reduction_fn, axes, result))
+        return result
+
+
+_SHARED_REDUCTIONS = threading.local()
+
+
+def get_shared_reductions_cache() -> Optional[PTSharedReductionsCache]:
+    return getattr(_SHARED_REDUCTIONS, 'cache', None)
+
+
+@contextmanager
+def shared_reductions(cache: PTSharedReductionsCache = None):
+    """
+    Within this context the reductions done by PTNNCFCollectorTensorProcessor are memoized, so that
+    the collectors which process the same input tensor share the results of the common reductions.
+
+    :param cache: The cache to memoize the reductions in. Allows to share the reductions between several
+        entries to the context. If None, a new cache is used.
+    """
+    if get_shared_reductions_cache() is not None:
+        yield
+        return
+    _SHARED_REDUCTIONS.cache = PTSharedReductionsCache() if cache is None else cache
+    try:
+        yield
+    finally:
+        _SHARED_REDUCTIONS.cache = None
+
+
 class PTNNCFCollectorTensorProcessor(NNCFCollectorTensorProcessor):
     """
     A realization of the processing methods for PTNNCFTensors.
@@ -41,14 +117,23 @@ class PTNNCFCollectorTensorProcessor(NNCFCollectorTensorProcessor):
 
     @staticmethod
     def reduce_min(x: NNCFTensor, axis: Union[int, tuple]) -> NNCFTensor:
+        cache = get_shared_reductions_cache()
+        if cache is not None:
+            return PTNNCFTensor(cache.reduce(x.tensor, torch.amin, axis))
         return PTNNCFTensor(torch.amin(x.tensor, dim=axis))
 
     @staticmethod
     def reduce_max(x: NNCFTensor, axis: Union[int, tuple]) -> NNCFTensor:
+        cache = get_shared_reductions_cache()
+        if cache is not None:
+            return PTNNCFTensor(cache.reduce(x.tensor, torch.amax, axis))
         return PTNNCFTensor(torch.amax(x.tensor, dim=axis))
 
     @staticmethod
     def abs(x: NNCFTensor) -> NNCFTensor:
+        cache = get_shared_reductions_cache()
+        if cache is not None:
+            return PTNNCFTensor(cache.abs(x.tensor))
         return PTNNCFTensor(torch.abs(x.tensor))
 
     @staticmethod
@@ -81,6 +166,55 @@ class PTNNCFCollectorTensorProcessor(NNCFCollectorTensorProcessor):
         return torch.sum(tensor.tensor).item()
 
 
+class PTCollectorsGroup:
+    """
+    Registers each input tensor in several collectors at once. The reductions that are common
+    for the collectors (e.g. min/max over the same axes) are computed on the input device once
+    per input tensor instead of once per collector.
+    """
+
+    def __init__(self, collectors: List[TensorStatisticCollectorBase]):
+        self._collectors = collectors
+
+    @property
+    def collectors(self) -> List[TensorStatisticCollectorBase]:
+        return self._collectors
+
+    def register_input(self, x: torch.Tensor, reductions_cache: PTSharedReductionsCache = None) -> torch.Tensor:
+        with no_nncf_trace():
+            with shared_reductions(reductions_cache):
+                for collector in self._collectors:
+                    collector.register_input(x)
+        return x
+
+
+class PTSharedInputObservers:
+    """
+    Shares the reductions of an input tensor between several observers of the tensor, e.g. the forward hooks
+    of different quantizer modules which are inserted at the same activation tensor. Each observer registers
+    the tensor in its own group of collectors. The reductions are kept until each of the observers has
+    registered the tensor, or until another tensor is registered.
+    """
+
+    def __init__(self, num_observers: int):
+        self._num_observers = num_observers
+        self._current_input = None
+        self._reductions_cache = None
+        self._num_registrations = 0
+
+    def register_input(self, x: torch.Tensor, collectors_group: PTCollectorsGroup) -> torch.Tensor:
+        if self._reductions_cache is None or x is not self._current_input:
+            self._current_input = x
+            self._reductions_cache = PTSharedReductionsCache()
+            self._num_registrations = 0
+        collectors_group.register_input(x, self._reductions_cache)
+        self._num_registrations += 1
+        if self._num_registrations >= self._num_observers:
+            self._current_input = None
+            self._reductions_cache = None
+        return x
+
+
 class PTMinMaxStatisticCollector(MinMaxStatisticCollector):
     def __init__(self, use_abs_max: bool, reduction_shape: ReductionShape, output_shape: ReductionShape,
                  num_samples: int = None):
@@ -187,8 +321,9 @@ class PTPercentileStatisticCollector(PercentileStatisticCollector):
 class PTMeanPercentileStatisticCollector(MeanPercentileStatisticCollector):
     def _register_input(self, x: torch.Tensor):
         with no_nncf_trace():
+            np_x = x.detach().cpu().numpy()
             for pct, val in self._all_pct_values.items():
-                np_vals = np_percentile_reduce_like(x.cpu().numpy(), self._reduction_shape, pct)
+                np_vals = np_percentile_reduce_like(np_x, self._reduction_shape, pct)
                 torch_vals = torch.from_numpy(np_vals).to(dtype=torch.float)
                 val.append(torch_vals)
 
@@ -198,3 +333,144 @@ class PTMeanPercentileStatisticCollector(MeanPercentileStatisticCollector):
             stacked_pct_vals = torch.stack(list(val))
             mean_percentile_values[pct] = stacked_pct_vals.mean(dim=0).view(self._reduction_shape)
         return PTPercentileTensorStatistic(mean_percentile_values)
+
+
+DEFAULT_NUM_HISTOGRAM_BINS = 2048
+
+
+class PTHistogramStatisticCollectorBase(OnlineTensorStatisticCollector):
+    """
+    Base class for collectors that accumulate per-channel histograms of the input values in a streaming manner.
+    The histograms are kept on the device of the input tensors, so that the memory consumed by the collector
+    is bounded by the number of channels times the number of histogram bins regardless of the number of
+    collected samples. The histogram range is expanded (and the accumulated counts are re-binned) whenever
+    a new input exceeds the range of the previous ones.
+    """
+
+    def __init__(self, reduction_shape: ReductionShape = None, num_samples: int = None,
+                 num_bins: int = DEFAULT_NUM_HISTOGRAM_BINS, discard_zeros: bool = False):
+        super().__init__(reduction_shape, num_samples)
+        self._num_bins = num_bins
+        self._discard_zeros = discard_zeros
+        self._histogram = None  # type: torch.Tensor
+        self._min_values = None  # type: torch.Tensor
+        self._max_values = None  # type: torch.Tensor
+
+    def _register_input(self, x: torch.Tensor):
+        with no_nncf_trace():
+            per_channel_values = self._split_into_channels(x.detach())
+            if self._discard_zeros:
+                # For post-RELU quantizers exact zeros may prevail and lead to
+                # zero median and MAD - discard them
+                weights = (per_channel_values != 0).to(dtype=torch.float)
+            else:
+                weights = torch.ones_like(per_channel_values)
+            batch_min_values = per_channel_values.min(dim=1)[0]
+            batch_max_values = per_channel_values.max(dim=1)[0]
+
+            if self._histogram is None:
+                self._histogram = torch.zeros(per_channel_values.shape[0], self._num_bins,
+                                              device=per_channel_values.device)
+                self._min_values = batch_min_values
+                self._max_values = batch_max_values
+            else:
+                new_min_values = torch.min(self._min_values, batch_min_values)
+                new_max_values = torch.max(self._max_values, batch_max_values)
+                if not torch.equal(new_min_values, self._min_values) or \
+                        not torch.equal(new_max_values, self._max_values):
+                    self._rebin(new_min_values, new_max_values)
+
+            bin_indices = self._get_bin_indices(per_channel_values, self._min_values, self._max_values)
+            self._histogram.scatter_add_(1, bin_indices, weights)
+
+    def _split_into_channels(self, x: torch.Tensor) -> torch.Tensor:
+        channel_count, channel_dim_idx = get_channel_count_and_dim_idx(list(self._reduction_shape))
+        if channel_count == 1:
+            return x.reshape(1, -1).to(dtype=torch.float)
+        return x.transpose(0, channel_dim_idx).reshape(channel_count, -1).to(dtype=torch.float)
+
+    def _get_bin_widths(self, min_values: torch.Tensor, max_values: torch.Tensor) -> torch.Tensor:
+        return torch.clamp((max_values - min_values) / self._num_bins, min=torch.finfo(torch.float).tiny)
+
+    def _get_bin_indices(self, per_channel_values: torch.Tensor,
+                         min_values: torch.Tensor, max_values: torch.Tensor) -> torch.Tensor:
+        bin_widths = self._get_bin_widths(min_values, max_values)
+        bin_indices = torch.floor((per_channel_values - min_values.unsqueeze(1)) / bin_widths.unsqueeze(1))
+        return bin_indices.long().clamp(0, self._num_bins - 1)
+
+    def _get_bin_centers(self) -> torch.Tensor:
+        bin_widths = self._get_bin_widths(self._min_values, self._max_values)
+        bin_offsets = torch.arange(self._num_bins, device=self._histogram.device, dtype=torch.float) + 0.5
+        return self._min_values.unsqueeze(1) + bin_offsets.unsqueeze(0) * bin_widths.unsqueeze(1)
+
+    def _rebin(self, new_min_values: torch.Tensor, new_max_values: torch.Tensor):
+        bin_indices = self._get_bin_indices(self._get_bin_centers(), new_min_values, new_max_values)
+        self._histogram = torch.zeros_like(self._histogram).scatter_add_(1, bin_indices, self._histogram)
+        self._min_values = new_min_values
+        self._max_values = new_max_values
+
+    def _get_percentiles(self, percentiles: List[float]) -> Dict[float, torch.Tensor]:
+        cumulative_counts = self._histogram.cumsum(dim=1)
+        total_counts = cumulative_counts[:, -1:]
+        bin_widths = self._get_bin_widths(self._min_values, self._max_values).unsqueeze(1)
+        retval = {}
+        for pc in percentiles:
+            target_counts = total_counts * pc / 100
+            bin_indices = (cumulative_counts < target_counts).sum(dim=1, keepdim=True).clamp(max=self._num_bins - 1)
+            counts_in_bin = self._histogram.gather(1, bin_indices)
+            counts_before_bin = cumulative_counts.gather(1, bin_indices) - counts_in_bin
+            # Linear interpolation inside the bin that contains the percentile
+            fraction = ((target_counts - counts_before_bin) / counts_in_bin.clamp(min=1.0)).clamp(0.0, 1.0)
+            values = self._min_values.unsqueeze(1) + (bin_indices.to(dtype=torch.float) + fraction) * bin_widths
+            retval[pc] = values.squeeze(1)
+        return retval
+
+    def _reset(self):
+        self._histogram = None
+        self._min_values = None
+        self._max_values = None
+
+
+class PTHistogramPercentileStatisticCollector(PTHistogramStatisticCollectorBase):
+    """
+    Collector estimates percentile values of all data history using streaming per-channel histograms.
+    """
+
+    def __init__(self,
+                 percentiles_to_collect: List[float],
+                 reduction_shape: ReductionShape = None,
+                 num_samples: int = None,
+                 num_bins: int = DEFAULT_NUM_HISTOGRAM_BINS):
+        super().__init__(reduction_shape, num_samples, num_bins)
+        self._percentiles_to_collect = percentiles_to_collect
+
+    def _get_statistics(self) -> PTPercentileTensorStatistic:
+        percentile_vs_values_dict = self._get_percentiles(self._percentiles_to_collect)
+        for key, val in percentile_vs_values_dict.items():
+            percentile_vs_values_dict[key] = expand_like(val, list(self._reduction_shape))
+        return PTPercentileTensorStatistic(percentile_vs_values_dict)
+
+
+class PTHistogramMedianMADStatisticCollector(PTHistogramStatisticCollectorBase):
+    """
+    Collector estimates median and median absolute deviation (MAD) using streaming per-channel histograms.
+    """
+
+    def __init__(self,
+                 reduction_shape: ReductionShape = None,
+                 num_samples: int = None,
+                 num_bins: int = DEFAULT_NUM_HISTOGRAM_BINS):
+        super().__init__(reduction_shape, num_samples, num_bins, discard_zeros=True)
+
+    def _get_statistics(self) -> PTMedianMADTensorStatistic:
+        median = self._get_percentiles([50.0])[50.0]
+        deviations = torch.abs(self._get_bin_centers() - median.unsqueeze(1))
+        sorted_deviations, sorted_indices = torch.sort(deviations, dim=1)
+        cumulative_counts = self._histogram.gather(1, sorted_indices).cumsum(dim=1)
+        median_counts = cumulative_counts[:, -1:] * 0.5
+        mad_indices = (cumulative_counts < median_counts).sum(dim=1, keepdim=True).clamp(max=self._num_bins - 1)
+        mad = sorted_deviations.gather(1, mad_indices).squeeze(1)
+
+        median_tensor = expand_like(median, list(self._reduction_shape))
+        mad_tensor = expand_like(mad, list(self._reduction_shape))
+        return PTMedianMADTensorStatistic(median_tensor, mad_tensor)
@@ -140,6 +140,36 @@ if "--all" in sys.argv:
     INSTALL_REQUIRES.extend(EXTRAS_REQUIRE["all"])
     sys.argv.remove("--all")
 
+# Builds the PyTorch C++ extensions ahead of time, so that they are not built on the first use
+# at runtime. Requires torch to be installed in the build environment.
+EXT_MODULES = []
+CMDCLASS = {}
+if "--torch-extensions" in sys.argv:
+    sys.argv.remove("--torch-extensions")
+    from torch.utils.cpp_extension import BuildExtension, CppExtension, CUDAExtension, CUDA_HOME
+
+    ext_root = os.path.join("nncf", "torch", "extensions")
+    ext_include_dirs = [os.path.join(here, ext_root, "include")]
+    cpu_ext_compile_args = ["/O2", "/openmp"] if sys.platform == "win32" else ["-O3", "-fopenmp", "-fno-trapping-math"]
+    cpu_ext_link_args = [] if sys.platform == "win32" else ["-fopenmp"]
+    for ext_name, prefix, compile_args, link_args in [
+            ("quantization", "quantized", cpu_ext_compile_args, cpu_ext_link_args),
+            ("binarization", "binarized", [], [])]:
+        EXT_MODULES.append(CppExtension(
+            name="nncf.torch.extensions.{}_functions_cpu".format(prefix),
+            sources=[os.path.join(ext_root, "src", ext_name, "cpu", "functions_cpu.cpp"),
+                     os.path.join(ext_root, "src", "common", "cpu", "tensor_funcs.cpp")],
+            include_dirs=ext_include_dirs,
+            extra_compile_args=compile_args,
+            extra_link_args=link_args))
+        if CUDA_HOME is not None:
+            EXT_MODULES.append(CUDAExtension(
+                name="nncf.torch.extensions.{}_functions_cuda".format(prefix),
+                sources=[os.path.join(ext_root, "src", ext_name, "cuda", "functions_cuda.cpp"),
+                         os.path.join(ext_root, "src", ext_name, "cuda", "functions_cuda_impl.cu")],
+                include_dirs=ext_include_dirs))
+    CMDCLASS["build_ext"] = BuildExtension
+
 setup(
     name="nncf",
     version=find_version(os.path.join(here, "nncf/version.py")),
@@ -163,7 +193,9 @@ setup(
               "quantization-aware-training", "hawq", "classification",
               "pruning", "object-detection", "semantic-segmentation", "nlp",
               "bert", "transformers", "mmdetection"],
-    include_package_data=True
+    include_package_data=True,
+    ext_modules=EXT_MODULES,
+    cmdclass=CMDCLASS
 )
 
 path_to_ninja = glob.glob(str(sysconfig.get_paths()["purelib"]+"/ninja*/ninja/data/bin/"))
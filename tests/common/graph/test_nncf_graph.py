@@ -0,0 +1,102 @@
+"""
+ Copyright (c) 2022 Intel Corporation
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+      http://www.apache.org/licenses/LICENSE-2.0
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+from nncf.common.graph import NNCFGraph
+from nncf.common.graph.layer_attributes import Dtype
+from nncf.common.graph.operator_metatypes import UnknownMetatype
+
+
+def _add_edge(graph: NNCFGraph, from_node_id: int, to_node_id: int, input_port_id: int, output_port_id: int):
+    graph.add_edge_between_nncf_nodes(from_node_id, to_node_id, tensor_shape=[1],
+                                      input_port_id=input_port_id, output_port_id=output_port_id,
+                                      dtype=Dtype.FLOAT)
+
+
+def test_graph_caches_are_updated_on_graph_modification():
+    graph = NNCFGraph()
+    a = graph.add_nncf_node('a', 'type', UnknownMetatype)
+    b = graph.add_nncf_node('b', 'type', UnknownMetatype)
+    c = graph.add_nncf_node('c', 'type', UnknownMetatype)
+    _add_edge(graph, a.node_id, c.node_id, input_port_id=1, output_port_id=0)
+
+    assert graph.get_node_by_id(a.node_id) is graph.get_node_by_name('a')
+    assert [n.node_name for n in graph.get_previous_nodes(c)] == ['a']
+    assert [e.from_node.node_name for e in graph.get_input_edges(c)] == ['a']
+
+    _add_edge(graph, b.node_id, c.node_id, input_port_id=0, output_port_id=0)
+    assert [n.node_name for n in graph.get_previous_nodes(c)] == ['a', 'b']
+    assert [e.from_node.node_name for e in graph.get_input_edges(c)] == ['b', 'a']
+    assert [n.node_name for n in graph.get_next_nodes(b)] == ['c']
+
+    graph.add_nncf_node('d', 'type', UnknownMetatype)
+    assert graph.get_node_by_name('d').node_name == 'd'
+    assert len(graph.get_all_nodes()) == 4
+
+    # Returned lists are copies and may be modified by the caller
+    graph.get_previous_nodes(c).clear()
+    assert len(graph.get_previous_nodes(c)) == 2
+
+
+def test_find_first_nodes_by_types_on_deep_diamond_graph():
+    graph = NNCFGraph()
+    prev_node = graph.add_nncf_node('input', 'input', UnknownMetatype)
+    # Chain of diamonds is deeper than the recursion limit and has an exponential number of paths
+    for i in range(2000):
+        left = graph.add_nncf_node(f'left_{i}', 'identity', UnknownMetatype)
+        right = graph.add_nncf_node(f'right_{i}', 'identity', UnknownMetatype)
+        merge = graph.add_nncf_node(f'merge_{i}', 'add', UnknownMetatype)
+        _add_edge(graph, prev_node.node_id, left.node_id, input_port_id=0, output_port_id=0)
+        _add_edge(graph, prev_node.node_id, right.node_id, input_port_id=0, output_port_id=1)
+        _add_edge(graph, left.node_id, merge.node_id, input_port_id=0, output_port_id=0)
+        _add_edge(graph, right.node_id, merge.node_id, input_port_id=1, output_port_id=0)
+        prev_node = merge
+    conv = graph.add_nncf_node('conv', 'conv', UnknownMetatype)
+    _add_edge(graph, prev_node.node_id, conv.node_id, input_port_id=0, output_port_id=0)
+
+    input_node = graph.get_node_by_name('input')
+    first_nodes = graph.find_first_nodes_by_types([input_node], ['conv'])
+    assert [n.node_name for n in first_nodes] == ['conv']
+    first_nodes = graph.find_first_nodes_by_types([conv], ['conv', 'identity', 'add'], traverse_forward=False,
+                                                  match_types=False)
+    assert [n.node_name for n in first_nodes] == ['input']
+    first_nodes = graph.find_first_nodes_by_types([input_node], ['add'])
+    assert [n.node_name for n in first_nodes] == ['merge_0']
+
+    new_conv = graph.add_nncf_node('new_conv', 'conv', UnknownMetatype)
+    _add_edge(graph, input_node.node_id, new_conv.node_id, input_port_id=0, output_port_id=2)
+    first_nodes = graph.find_first_nodes_by_types([input_node], ['conv'])
+    assert [n.node_name for n in first_nodes] == ['conv', 'new_conv']
+
+
+def _build_chain_graph_looking_up_nodes_by_name(num_nodes: int) -> NNCFGraph:
+    graph = NNCFGraph()
+    for i in range(num_nodes):
+        graph.add_nncf_node(f'node_{i}', 'type', UnknownMetatype)
+    # Graph builders look the consumer node up by name before each edge insertion
+    for i in range(1, num_nodes):
+        from_node = graph.get_node_by_name(f'node_{i - 1}')
+        to_node = graph.get_node_by_name(f'node_{i}')
+        _add_edge(graph, from_node.node_id, to_node.node_id, input_port_id=0, output_port_id=0)
+    return graph
+
+
+def test_graph_building_with_name_lookups_scales_linearly(mocker):
+    get_node_by_key_spy = mocker.spy(NNCFGraph, 'get_node_by_key')
+    calls_per_graph_size = {}
+    for num_nodes in [500, 2000]:
+        get_node_by_key_spy.reset_mock()
+        graph = _build_chain_graph_looking_up_nodes_by_name(num_nodes)
+        calls_per_graph_size[num_nodes] = get_node_by_key_spy.call_count
+        assert graph.get_nodes_count() == num_nodes
+
+    # A quadratic graph construction would make 16 times more node lookups for the 4 times larger graph
+    assert calls_per_graph_size[2000] <= 5 * calls_per_graph_size[500]
@@ -1,4 +1,8 @@
 import os
+import timeit
+from functools import partial
+
+import onnx
 import pytest
 
 from nncf.experimental.onnx.graph.nncf_graph_builder import GraphConverter
@@ -51,3 +55,22 @@ def test_built_nncf_graphs(model_creator_func):
     path_to_dot = os.path.abspath(os.path.join(data_dir, model.path_ref_graph))
 
     check_nx_graph(nx_graph, path_to_dot)
+
+
+def get_relu_chain_model(num_nodes: int) -> onnx.ModelProto:
+    nodes = [onnx.helper.make_node('Relu', inputs=[f'Relu_{i}_X'], outputs=[f'Relu_{i + 1}_X'], name=f'Relu_{i}')
+             for i in range(num_nodes)]
+    model_input = onnx.helper.make_tensor_value_info('Relu_0_X', onnx.TensorProto.FLOAT, [1, 8])
+    model_output = onnx.helper.make_tensor_value_info(f'Relu_{num_nodes}_X', onnx.TensorProto.FLOAT, [1, 8])
+    return onnx.helper.make_model(onnx.helper.make_graph(nodes, 'relu_chain', [model_input], [model_output]))
+
+
+def test_nncf_graph_building_scales_linearly():
+    build_times = {}
+    for num_nodes in [1000, 4000]:
+        model = get_relu_chain_model(num_nodes)
+        build_times[num_nodes] = min(timeit.repeat(partial(GraphConverter.create_nncf_graph, model),
+                                                   number=1, repeat=3))
+
+    # A quadratic graph building would take 16 times longer for the 4 times larger model
+    assert build_times[4000] < 8 * build_times[1000]
@@ -0,0 +1,103 @@
+import numpy as np
+import onnx
+import pytest
+
+from nncf.experimental.onnx.graph.onnx_graph import ONNXGraph
+
+from tests.onnx.models import LinearModel
+from tests.onnx.models import MultiInputOutputModel
+from tests.onnx.models import ModelWithIntEdges
+
+TEST_MODELS = [LinearModel, MultiInputOutputModel, ModelWithIntEdges]
+
+
+def get_nodes_by_edge_linear_scan(model, edge_name, edge_field):
+    return [node for node in model.graph.node if edge_name in getattr(node, edge_field)]
+
+
+def get_initializer_linear_scan(model, initializer_name):
+    for init in model.graph.initializer:
+        if init.name == initializer_name:
+            return onnx.numpy_helper.to_array(init)
+    raise RuntimeError('There is no initializer with the name {}'.format(initializer_name))
+
+
+def get_all_edge_names(model):
+    edge_names = set()
+    for node in model.graph.node:
+        edge_names.update(node.input)
+        edge_names.update(node.output)
+    return sorted(edge_names)
+
+
+def check_indexes_match_linear_scan(onnx_graph, model):
+    for edge_name in get_all_edge_names(model) + ['non_existing_edge']:
+        for edge_field, get_nodes in [('input', onnx_graph.get_nodes_by_input),
+                                      ('output', onnx_graph.get_nodes_by_output)]:
+            ref_nodes = get_nodes_by_edge_linear_scan(model, edge_name, edge_field)
+            assert [node.name for node in get_nodes(edge_name)] == [node.name for node in ref_nodes]
+
+    for node in model.graph.node:
+        assert onnx_graph.get_node_edges(node.name) == {'input': list(node.input), 'output': list(node.output)}
+    with pytest.raises(RuntimeError):
+        onnx_graph.get_node_edges('non_existing_node')
+
+    for init in model.graph.initializer:
+        assert np.array_equal(onnx_graph.get_initializers_value(init.name),
+                              get_initializer_linear_scan(model, init.name))
+    with pytest.raises(RuntimeError):
+        onnx_graph.get_initializers_value('non_existing_initializer')
+
+
+@pytest.mark.parametrize('model_to_test', TEST_MODELS)
+def test_indexed_lookups_match_linear_scan(model_to_test):
+    model = model_to_test().onnx_model
+    onnx_graph = ONNXGraph(model)
+
+    check_indexes_match_linear_scan(onnx_graph, model)
+    for tensor in list(model.graph.value_info) + list(model.graph.input) + list(model.graph.output):
+        assert onnx_graph.get_edge_shape(tensor.name) == onnx_graph.get_tensor_shape(tensor)
+        ref_dtype = onnx.TensorProto.DataType.Name(tensor.type.tensor_type.elem_type)
+        assert onnx_graph.get_edge_dtype(tensor.name) == ref_dtype
+
+
+@pytest.mark.parametrize('model_to_test', TEST_MODELS)
+def test_indexed_lookups_follow_updated_model(model_to_test):
+    model = model_to_test().onnx_model
+    onnx_graph = ONNXGraph(model)
+    check_indexes_match_linear_scan(onnx_graph, model)
+
+    first_node = model.graph.node[0]
+    consumed_edge = first_node.output[0]
+    model.graph.node.append(onnx.helper.make_node('Identity', inputs=[consumed_edge],
+                                                  outputs=['appended_output'], name='Appended_Identity'))
+    onnx_graph.update_indexes()
+    check_indexes_match_linear_scan(onnx_graph, model)
+    assert onnx_graph.get_nodes_by_output('appended_output')[0].name == 'Appended_Identity'
+
+    model.graph.node[-1].input[0] = 'renamed_input'
+    onnx_graph.update_indexes()
+    check_indexes_match_linear_scan(onnx_graph, model)
+    assert [node.name for node in onnx_graph.get_nodes_by_input('renamed_input')] == ['Appended_Identity']
+
+    model.graph.node.remove(model.graph.node[-1])
+    onnx_graph.update_indexes()
+    check_indexes_match_linear_scan(onnx_graph, model)
+    assert not onnx_graph.get_nodes_by_input('renamed_input')
+
+    model.graph.initializer.append(onnx.numpy_helper.from_array(np.ones((2, 3), dtype=np.float32),
+                                                                'appended_initializer'))
+    onnx_graph.update_indexes()
+    check_indexes_match_linear_scan(onnx_graph, model)
+
+
+def test_initializer_value_is_not_shared_between_calls():
+    model = LinearModel().onnx_model
+    onnx_graph = ONNXGraph(model)
+    initializer_name = model.graph.initializer[0].name
+
+    value = onnx_graph.get_initializers_value(initializer_name)
+    value += 1
+
+    assert np.array_equal(onnx_graph.get_initializers_value(initializer_name),
+                          get_initializer_linear_scan(model, initializer_name))
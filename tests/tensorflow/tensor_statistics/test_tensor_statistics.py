@@ -20,6 +20,7 @@ import tensorflow as tf
 from nncf.common.tensor_statistics.statistics import TensorStatistic
 from nncf.common.tensor_statistics.collectors import TensorStatisticCollectorBase, ReductionShape, \
     StatisticsNotCollectedError, OfflineTensorStatisticCollector
+from nncf.tensorflow.tensor_statistics.collectors import TFInGraphMinMaxStatisticCollector
 from nncf.tensorflow.tensor_statistics.collectors import TFMinMaxStatisticCollector
 from nncf.tensorflow.tensor_statistics.collectors import TFMedianMADStatisticCollector
 from nncf.tensorflow.tensor_statistics.collectors import TFNNCFCollectorTensorProcessor
@@ -206,6 +207,11 @@ class TestCollectedStatistics:
         partial(TFMeanMinMaxStatisticCollector,
                 use_per_sample_stats=False,
                 use_abs_max=False),
+        partial(TFInGraphMinMaxStatisticCollector,
+                use_per_sample_stats=False,
+                use_abs_max=False,
+                use_means_of_mins=True,
+                use_means_of_maxs=False),
         TFMedianMADStatisticCollector,
         partial(TFPercentileStatisticCollector, percentiles_to_collect=[10.0]),
         partial(TFMeanPercentileStatisticCollector, percentiles_to_collect=[10.0])]
@@ -254,6 +260,11 @@ class TestCollectedStatistics:
         TFMedianMADStatisticCollector,
         partial(TFPercentileStatisticCollector, percentiles_to_collect=[10.0]),
         partial(TFMeanPercentileStatisticCollector, percentiles_to_collect=[10.0]),
+        partial(TFInGraphMinMaxStatisticCollector,
+                use_per_sample_stats=False,
+                use_abs_max=False,
+                use_means_of_mins=True,
+                use_means_of_maxs=False),
     ]
 
     REF_NUM_SAMPLES = 3
@@ -269,6 +280,52 @@ class TestCollectedStatistics:
         assert collector_for_num_samples_test.collected_samples() == TestCollectedStatistics.REF_NUM_SAMPLES
 
 
+    @pytest.mark.parametrize(('ref_collector', 'in_graph_collector', 'reduction_shape'),
+                             [
+                                 (
+                                         TFMinMaxStatisticCollector,
+                                         partial(TFInGraphMinMaxStatisticCollector,
+                                                 use_per_sample_stats=False,
+                                                 use_means_of_mins=False,
+                                                 use_means_of_maxs=False),
+                                         (0, 1)
+                                 ),
+                                 (
+                                         partial(TFMeanMinMaxStatisticCollector, use_per_sample_stats=False),
+                                         partial(TFInGraphMinMaxStatisticCollector,
+                                                 use_per_sample_stats=False,
+                                                 use_means_of_mins=True,
+                                                 use_means_of_maxs=True),
+                                         (1,)
+                                 ),
+                                 (
+                                         partial(TFMixedMinMaxStatisticCollector,
+                                                 use_per_sample_stats=True,
+                                                 use_means_of_mins=False,
+                                                 use_means_of_maxs=True),
+                                         partial(TFInGraphMinMaxStatisticCollector,
+                                                 use_per_sample_stats=True,
+                                                 use_means_of_mins=False,
+                                                 use_means_of_maxs=True),
+                                         (1,)
+                                 ),
+                             ])
+    def test_in_graph_collector_inside_tf_function(self, ref_collector, in_graph_collector, reduction_shape):
+        ref_collector_obj = ref_collector(use_abs_max=True, reduction_shape=reduction_shape, num_samples=2)
+        collector_obj = in_graph_collector(use_abs_max=True, reduction_shape=reduction_shape, num_samples=2)
+
+        @tf.function
+        def register_input(x):
+            return collector_obj.register_input(x) * 2
+
+        for input_ in TestCollectedStatistics.REF_INPUTS * 2:
+            ref_collector_obj.register_input(input_)
+            register_input(input_)
+
+        assert collector_obj.collected_samples() == ref_collector_obj.collected_samples() == 2
+        assert collector_obj.get_statistics() == ref_collector_obj.get_statistics()
+
+
 class TestCollectorTensorProcessor:
     tensor_processor = TFNNCFCollectorTensorProcessor()
 
@@ -0,0 +1,77 @@
+"""
+ Copyright (c) 2022 Intel Corporation
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+      http://www.apache.org/licenses/LICENSE-2.0
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+from collections import OrderedDict
+
+import torch
+
+from nncf.torch.accuracy_aware_training.checkpoint_writer import AsyncCheckpointWriter
+from nncf.torch.accuracy_aware_training.runner import PTAdaptiveCompressionLevelTrainingRunner
+
+
+def test_checkpoint_writer_snapshots_tensors_and_links_best_checkpoint(tmp_path):
+    writer = AsyncCheckpointWriter()
+    last_path = str(tmp_path / 'last.pth')
+    best_path = str(tmp_path / 'best.pth')
+    weight = torch.zeros(4)
+    state_dict = OrderedDict(weight=weight)
+    state_dict._metadata = {'': {'version': 1}}
+    optimizer_state = {'state': {0: {'momentum_buffer': weight}}}
+
+    writer.save({'state_dict': state_dict, 'optimizer': optimizer_state, 'epoch': 1}, last_path)
+    writer.link(last_path, best_path)
+    # The training goes on while the checkpoint is being written
+    weight.add_(1)
+    assert optimizer_state['state'][0]['momentum_buffer'] is weight
+    writer.save({'state_dict': OrderedDict(weight=weight), 'epoch': 2}, last_path)
+    writer.wait()
+
+    best_checkpoint = torch.load(best_path)
+    assert best_checkpoint['epoch'] == 1
+    assert torch.equal(best_checkpoint['state_dict']['weight'], torch.zeros(4))
+    assert torch.equal(best_checkpoint['optimizer']['state'][0]['momentum_buffer'], torch.zeros(4))
+    assert best_checkpoint['state_dict']._metadata == {'': {'version': 1}}
+    last_checkpoint = torch.load(last_path)
+    assert last_checkpoint['epoch'] == 2
+    assert torch.equal(last_checkpoint['state_dict']['weight'], torch.ones(4))
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['best.pth', 'last.pth']
+
+
+def test_adaptive_runner_keeps_only_loadable_best_checkpoints(tmp_path):
+    runner = PTAdaptiveCompressionLevelTrainingRunner({'maximal_absolute_accuracy_degradation': 0.1,
+                                                       'initial_training_phase_epochs': 1,
+                                                       'patience_epochs': 1},
+                                                      verbose=False)
+    runner._checkpoint_save_dir = str(tmp_path)
+    runner.calculate_minimal_tolerable_accuracy(1.0)
+    last_path = str(tmp_path / 'acc_aware_checkpoint_last.pth')
+
+    def train_with_compression_rate(compression_rate, metric_value):
+        runner.compression_rate_target = compression_rate
+        runner.best_val_metric_value = runner.current_val_metric_value = metric_value
+        runner._checkpoint_writer.save({'compression_rate': compression_rate}, last_path)
+        runner._save_best_checkpoint(last_path)
+        runner.update_training_history(compression_rate, metric_value)
+
+    train_with_compression_rate(0.3, 0.95)
+    train_with_compression_rate(0.4, 0.92)
+    train_with_compression_rate(0.5, 0.85)
+    runner._checkpoint_writer.wait()
+    # The accuracy budget of the current compression rate may still become positive
+    assert sorted(runner._best_checkpoints) == [0.4, 0.5]
+
+    train_with_compression_rate(0.45, 0.91)
+    runner._checkpoint_writer.wait()
+    assert sorted(runner._best_checkpoints) == [0.45]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['acc_aware_checkpoint_best_compression_rate_0.450.pth',
+                                                          'acc_aware_checkpoint_last.pth']
+    assert torch.load(runner._best_checkpoints[0.45])['compression_rate'] == 0.45
@@ -85,3 +85,41 @@ def test_runner(num_steps, learning_rate, reference_metric):
     runner.train_epoch(model, compression_ctrl)
     metric_value = runner.validate(model)
     assert metric_value == pytest.approx(reference_metric, 1e-3)
+
+
+@pytest.mark.parametrize(
+    ('subset_metric_values', 'best_val_metric_value', 'is_full_validation_run', 'reference_metric'),
+    (
+        # The budget is clearly negative and the model is not the best one
+        ([0.50, 0.52, 0.48, 0.50], 0.6, False, 0.5),
+        # The budget is clearly positive and the model is the best one
+        ([0.90, 0.92, 0.88, 0.90], 0.8, False, 0.9),
+        # The interval contains the minimal tolerable accuracy
+        ([0.60, 0.90, 0.70, 0.80], 0.0, True, 0.75),
+        # The interval contains the best metric value
+        ([0.90, 0.92, 0.88, 0.90], 0.9, True, 0.75),
+        # A single value gives no confidence interval
+        ([0.5], 0.0, True, 0.75),
+    )
+)
+def test_runner_staged_validation(subset_metric_values, best_val_metric_value, is_full_validation_run,
+                                  reference_metric):
+    runner = PTAccuracyAwareTrainingRunner(accuracy_aware_training_params={
+        'maximal_absolute_accuracy_degradation': 0.25
+    }, dump_checkpoints=False)
+    is_full_validation_called = False
+
+    def validate_fn(model, epoch):
+        nonlocal is_full_validation_called
+        is_full_validation_called = True
+        return 0.75
+
+    def proxy_validate_fn(model, epoch):
+        return subset_metric_values
+
+    runner.initialize_training_loop_fns(None, validate_fn, None, None, proxy_validate_fn=proxy_validate_fn)
+    runner.calculate_minimal_tolerable_accuracy(1.0)
+    runner.best_val_metric_value = best_val_metric_value
+    metric_value = runner.validate(nn.Identity())
+    assert is_full_validation_called == is_full_validation_run
+    assert metric_value == pytest.approx(reference_metric)
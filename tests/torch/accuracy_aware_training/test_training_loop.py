@@ -344,3 +344,145 @@ def test_mock_dump_checkpoint(aa_config):
                                              configure_optimizers_fn=configure_optimizers_fn,
                                              dump_checkpoint_fn=mock_dump_checkpoint_fn)
     assert is_called_dump_checkpoint_fn
+
+
+def test_adaptive_compression_training_loop_with_parallel_candidates(num_steps=10, learning_rate=1e-3,
+                                                                      initial_training_phase_epochs=2,
+                                                                      patience_epochs=2,
+                                                                      init_finetuning_steps=10,
+                                                                      num_candidates=3):
+    def validate_fn(model, epoch=0, train_loader=None):
+        with set_torch_seed():
+            train_loader = iter(train_loader)
+            loss = torch.FloatTensor([0])
+            with torch.no_grad():
+                for _ in range(num_steps):
+                    x, y_gt = next(train_loader)
+                    y = model(x)
+                    loss += F.mse_loss(y.sum(), y_gt)
+        return 1 - loss.item()
+
+    input_sample_size = [1, 1, LeNet.INPUT_SIZE[-1], LeNet.INPUT_SIZE[-1]]
+    config = get_basic_magnitude_sparsity_config(input_sample_size=input_sample_size)
+    config.update({
+        "accuracy_aware_training": {
+            "mode": "adaptive_compression_level",
+            "params": {
+                "maximal_relative_accuracy_degradation": 100.0,
+                "initial_training_phase_epochs": initial_training_phase_epochs,
+                "patience_epochs": patience_epochs,
+                "maximal_total_epochs": initial_training_phase_epochs + patience_epochs,
+                "parallel_compression_rate_candidates": num_candidates
+            }
+        }
+    })
+
+    model, train_loader, compression_ctrl = create_finetuned_lenet_model_and_dataloader(config,
+                                                                                        validate_fn,
+                                                                                        init_finetuning_steps)
+
+    def train_fn(compression_ctrl, model, optimizer,
+                 train_loader=train_loader, **kwargs):
+        with set_torch_seed():
+            train_loader = iter(train_loader)
+            for _ in range(num_steps):
+                compression_ctrl.scheduler.step()
+                optimizer.zero_grad()
+                x, y_gt = next(train_loader)
+                y = model(x)
+                loss = F.mse_loss(y.sum(), y_gt)
+                loss.backward()
+                optimizer.step()
+
+    def configure_optimizers_fn():
+        optimizer = SGD(model.parameters(), lr=learning_rate)
+        return optimizer, None
+
+    acc_aware_training_loop = AdaptiveCompressionTrainingLoop(config, compression_ctrl)
+    explore = acc_aware_training_loop._explore_compression_rates_in_parallel
+    compression_rate_after_exploration = None
+    explored_training_history = None
+
+    def explore_compression_rates(model, accuracy_aware_controller, runner):
+        nonlocal compression_rate_after_exploration, explored_training_history
+        weights = {name: param.clone() for name, param in model.state_dict().items()}
+        result = explore(model, accuracy_aware_controller, runner)
+        # The candidates are fine-tuned in the worker processes only
+        for name, param in model.state_dict().items():
+            assert torch.equal(param, weights[name])
+        compression_rate_after_exploration = accuracy_aware_controller.compression_rate
+        explored_training_history = result
+        return result
+
+    acc_aware_training_loop._explore_compression_rates_in_parallel = explore_compression_rates
+    acc_aware_training_loop.run(model,
+                                train_epoch_fn=train_fn,
+                                validate_fn=partial(validate_fn, train_loader=train_loader),
+                                configure_optimizers_fn=configure_optimizers_fn)
+
+    initial_rate = list(acc_aware_training_loop.runner.compressed_training_history)[0]
+    assert compression_rate_after_exploration == pytest.approx(initial_rate)
+    explored_rates = list(explored_training_history)
+    assert len(explored_rates) == num_candidates
+    for idx, rate in enumerate(explored_rates):
+        assert abs(rate - initial_rate) == pytest.approx(0.1 * (idx + 1))
+    assert all(rate not in acc_aware_training_loop.runner.compressed_training_history for rate in explored_rates)
+
+
+def test_parallel_candidates_can_use_multiprocess_data_loaders(num_steps=10, initial_training_phase_epochs=2,
+                                                               patience_epochs=2, init_finetuning_steps=10,
+                                                               num_candidates=2):
+    def validate_fn(model, epoch=0, train_loader=None):
+        with torch.no_grad():
+            loss = sum(F.mse_loss(model(x).sum(), y_gt) for x, y_gt in train_loader)
+        return 1 - loss.item()
+
+    input_sample_size = [1, 1, LeNet.INPUT_SIZE[-1], LeNet.INPUT_SIZE[-1]]
+    config = get_basic_magnitude_sparsity_config(input_sample_size=input_sample_size)
+    config.update({
+        "accuracy_aware_training": {
+            "mode": "adaptive_compression_level",
+            "params": {
+                "maximal_relative_accuracy_degradation": 100.0,
+                "initial_training_phase_epochs": initial_training_phase_epochs,
+                "patience_epochs": patience_epochs,
+                "maximal_total_epochs": initial_training_phase_epochs + patience_epochs,
+                "parallel_compression_rate_candidates": num_candidates
+            }
+        }
+    })
+    model, train_loader, compression_ctrl = create_finetuned_lenet_model_and_dataloader(config, validate_fn,
+                                                                                        init_finetuning_steps)
+    dataset = torch.utils.data.TensorDataset(torch.ones([num_steps] + input_sample_size[1:]),
+                                             torch.ones([num_steps]))
+
+    def train_fn(compression_ctrl, model, optimizer, **kwargs):
+        # The data loading workers are spawned by the exploration workers as well
+        train_loader = torch.utils.data.DataLoader(dataset, batch_size=1, num_workers=2)
+        for x, y_gt in train_loader:
+            compression_ctrl.scheduler.step()
+            optimizer.zero_grad()
+            loss = F.mse_loss(model(x).sum(), y_gt.sum())
+            loss.backward()
+            optimizer.step()
+
+    def configure_optimizers_fn():
+        optimizer = SGD(model.parameters(), lr=1e-3)
+        return optimizer, None
+
+    acc_aware_training_loop = AdaptiveCompressionTrainingLoop(config, compression_ctrl)
+    explore = acc_aware_training_loop._explore_compression_rates_in_parallel
+    explored_training_history = None
+
+    def explore_compression_rates(model, accuracy_aware_controller, runner):
+        nonlocal explored_training_history
+        explored_training_history = explore(model, accuracy_aware_controller, runner)
+        return explored_training_history
+
+    acc_aware_training_loop._explore_compression_rates_in_parallel = explore_compression_rates
+    acc_aware_training_loop.run(model,
+                                train_epoch_fn=train_fn,
+                                validate_fn=partial(validate_fn, train_loader=train_loader),
+                                configure_optimizers_fn=configure_optimizers_fn)
+
+    assert len(explored_training_history) == num_candidates
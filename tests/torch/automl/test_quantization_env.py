@@ -16,6 +16,7 @@ import pytest
 
 from nncf import NNCFConfig
 from nncf.torch.automl.environment.quantization_env import QuantizationEnv, ModelSizeCalculator, QuantizationEnvParams
+from nncf.torch.automl.environment.quantization_env import StrategyScoreSurrogate
 from nncf.torch.dynamic_graph.graph_tracer import create_input_infos
 from nncf.common.hardware.config import HWConfigType, HWConfig
 from nncf.torch.hardware.config import PTHWConfig
@@ -28,9 +29,11 @@ from tests.torch.helpers import create_ones_mock_dataloader, create_conv, BasicC
 import torch
 from torch import nn
 import numpy as np
+from sklearn.linear_model import Ridge
 
 
-def create_test_quantization_env(model_creator=BasicConvTestModel, input_info_cfg=None) -> QuantizationEnv:
+def create_test_quantization_env(model_creator=BasicConvTestModel, input_info_cfg=None,
+                                 surrogate_warmup_eval_number=0) -> QuantizationEnv:
     if input_info_cfg is None:
         input_info_cfg = {"input_info":{"sample_size": [1, 1, 4, 4]}}
 
@@ -77,7 +80,8 @@ def create_test_quantization_env(model_creator=BasicConvTestModel, input_info_cf
                                                         performant_bw=False,
                                                         finetune=False,
                                                         bits=[2, 4, 8],
-                                                        dump_init_precision_data=False))
+                                                        dump_init_precision_data=False,
+                                                        surrogate_warmup_eval_number=surrogate_warmup_eval_number))
 
 def test_can_create_quant_env():
     create_test_quantization_env()
@@ -320,3 +324,78 @@ def test_select_config_for_actions(strategy):
 
     with pytest.raises(AssertionError):
         qenv.select_config_for_actions(strategy)
+
+
+def test_evaluate_strategy_reuses_scores_of_evaluated_strategies(mocker):
+    qenv = create_test_quantization_env()
+    qenv.pretrained_score = 1.0
+    pipeline_spy = mocker.patch.object(qenv, '_run_quantization_pipeline', side_effect=[0.5, 0.7])
+
+    _, reward_first, _, _ = qenv.evaluate_strategy([8, 4], skip_constraint=True)
+    _, reward_other, _, _ = qenv.evaluate_strategy([4, 8], skip_constraint=True)
+    _, reward_repeated, _, info_set = qenv.evaluate_strategy([8, 4], skip_constraint=True)
+
+    assert pipeline_spy.call_count == 2
+    assert reward_first == reward_repeated == 0.5
+    assert reward_other == 0.7
+    assert info_set['accuracy'] == 0.5
+    assert info_set['model_ratio'] == 4 / qenv.model_size_calculator.FLOAT_BITWIDTH
+
+
+def test_strategy_score_surrogate():
+    surrogate = StrategyScoreSurrogate(warmup_eval_number=2, alpha=1e-6)
+    strategies = [(8, 8), (8, 4), (4, 8)]
+    for strategy in strategies[:-1]:
+        surrogate.add(strategy, sum(np.log2(strategy)))
+        assert not surrogate.is_ready()
+    # Not ready until there are more evaluated strategies than quantizers, even though the warmup is over
+    surrogate.add(strategies[-1], sum(np.log2(strategies[-1])))
+    assert surrogate.is_ready()
+
+    predicted_score = surrogate.predict((2, 2))
+    assert predicted_score == pytest.approx(2.0, abs=1e-3)
+    assert not surrogate.is_promising(predicted_score, best_score=6.0)
+    assert surrogate.is_promising(surrogate.predict((8, 8)), best_score=6.0)
+
+
+def test_strategy_score_surrogate_tolerance_is_based_on_leave_one_out_residuals():
+    alpha = 1.0
+    strategies = [(8, 8), (8, 2), (2, 2), (2, 8), (4, 4), (8, 4)]
+    scores = [0.9, 0.72, 0.5, 0.68, 0.71, 0.79]
+    surrogate = StrategyScoreSurrogate(warmup_eval_number=len(strategies), alpha=alpha)
+    for strategy, score in zip(strategies, scores):
+        surrogate.add(strategy, score)
+
+    features, scores = np.log2(np.asarray(strategies, dtype=np.float64)), np.asarray(scores)
+    loo_residuals = []
+    for idx in range(len(strategies)):
+        mask = np.arange(len(strategies)) != idx
+        regressor = Ridge(alpha=alpha).fit(features[mask], scores[mask])
+        loo_residuals.append(scores[idx] - regressor.predict(features[idx:idx + 1])[0])
+    loo_residual_std = np.sqrt(np.mean(np.square(loo_residuals)))
+
+    predicted_score = surrogate.predict((4, 2))
+    assert surrogate.is_promising(predicted_score, best_score=predicted_score + 1.99 * loo_residual_std)
+    assert not surrogate.is_promising(predicted_score, best_score=predicted_score + 2.01 * loo_residual_std)
+
+
+def test_evaluate_strategy_skips_unpromising_strategies(mocker):
+    qenv = create_test_quantization_env(surrogate_warmup_eval_number=2)
+    qenv.pretrained_score = 1.0
+    pipeline_spy = mocker.patch.object(qenv, '_run_quantization_pipeline', side_effect=[0.9, 0.7, 0.6, 0.8, 0.8])
+
+    qenv.evaluate_strategy([8, 8], skip_constraint=True)
+    qenv.evaluate_strategy([8, 2], skip_constraint=True)
+    # The warmup is over, but there are not more evaluated strategies than quantizers yet
+    qenv.evaluate_strategy([4, 2], skip_constraint=True)
+    assert pipeline_spy.call_count == 3
+
+    # Predicted to be close to the best evaluated strategy
+    qenv.evaluate_strategy([4, 8], skip_constraint=True)
+    qenv.evaluate_strategy([8, 4], skip_constraint=True)
+    assert pipeline_spy.call_count == 5
+
+    # Predicted to be much worse than the best evaluated strategy
+    _, reward, _, info_set = qenv.evaluate_strategy([4, 4], skip_constraint=True)
+    assert pipeline_spy.call_count == 5
+    assert reward == info_set['accuracy'] < 0.8
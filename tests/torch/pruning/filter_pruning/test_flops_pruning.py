@@ -113,3 +113,35 @@ def test_flops_calulation_for_spec_layers(model, all_weights, pruning_flops_targ
         op = list(node.pre_ops.values())[0]
         mask = op.operand.binary_filter_pruning_mask
         assert int(sum(mask)) == ref_size
+
+
+@pytest.mark.parametrize('pruning_flops_target', [0.1, 0.25, 0.4, 0.6])
+@pytest.mark.parametrize('model', [PruningTestWideModelConcat,
+                                   PruningTestWideModelEltwise,
+                                   PruningTestModelSharedConvs])
+def test_global_flops_pruning_reaches_target_with_minimal_number_of_filters(model, pruning_flops_target):
+    config = get_basic_pruning_config([1, 1, 8, 8])
+    config['compression']['algorithm'] = 'filter_pruning'
+    config['compression']['pruning_init'] = pruning_flops_target
+    config['compression']['params']['pruning_flops_target'] = pruning_flops_target
+    config['compression']['params']['prune_first_conv'] = True
+    config['compression']['params']['all_weights'] = True
+    _, compression_ctrl = create_compressed_model_and_algo_for_test(model(), config)
+
+    target_flops = compression_ctrl.full_flops * (1 - pruning_flops_target)
+    pruned_filters_num = {}
+    for cluster in compression_ctrl.pruned_module_groups_info.get_all_clusters():
+        mask = cluster.elements[0].operand.binary_filter_pruning_mask
+        pruned_filters_num[cluster.id] = int((mask == 0).sum())
+    flops, _ = compression_ctrl._calculate_flops_and_weights_by_pruned_filters_num(pruned_filters_num)
+    assert flops == compression_ctrl.current_flops
+    assert flops < target_flops
+
+    # Pruning one filter less must not reach the target, otherwise more filters are pruned than needed
+    flops_with_one_filter_less = []
+    for cluster_id, num_pruned in pruned_filters_num.items():
+        if num_pruned > 0:
+            flops, _ = compression_ctrl._calculate_flops_and_weights_by_pruned_filters_num(
+                {**pruned_filters_num, cluster_id: num_pruned - 1})
+            flops_with_one_filter_less.append(flops)
+    assert max(flops_with_one_filter_less) >= target_flops
@@ -11,14 +11,13 @@
  limitations under the License.
 """
 import pytest
+import torch
 
 from tests.torch.pruning.helpers import BigPruningTestModel, get_basic_pruning_config, \
     PruningTestModelConcat, PruningTestModelEltwise, DiffConvsModel, GroupNormModel
+from tests.torch.helpers import create_compressed_model_and_algo_for_test
 from tests.torch.helpers import load_exported_onnx_version
 
-pytestmark = pytest.mark.skip(reason="Export as actually deleting filters from the model is currently disabled.")
-
-
 def find_value_by_name_in_list(obj_list, name):
     for obj in obj_list:
         if obj.name == name:
@@ -38,19 +37,23 @@ def test_pruning_export_simple_model(tmp_path):
     nncf_config = get_basic_pruning_config(input_sample_size=[1, 1, 8, 8])
     nncf_config['compression']['pruning_init'] = 0.5
     nncf_config['compression']['algorithm'] = 'filter_pruning'
+    nncf_config['compression']['params']['shrink_model_on_export'] = True
     onnx_model_proto = load_exported_onnx_version(nncf_config, model,
                                                   path_to_storage_dir=tmp_path)
     # Check that conv2 + BN were pruned by output filters
     # WARNING: starting from at least torch 1.7.0, torch.onnx.export will fuses BN into previous
     # convs if torch.onnx.export is done with `training=False`, so this test might fail.
     check_bias_and_weight_shape('nncf_module.conv2', onnx_model_proto, [16, 16, 3, 3], [16])
-    check_bias_and_weight_shape('nncf_module.bn', onnx_model_proto, [16], [16])
+    check_bias_and_weight_shape('nncf_module.bn2', onnx_model_proto, [16], [16])
 
-    # Check that up was pruned by input filters
+    # Check that up was pruned by input and output filters
     check_bias_and_weight_shape('nncf_module.up', onnx_model_proto, [16, 32, 3, 3], [32])
 
+    # Check that linear was pruned by flattened input and output features
+    check_bias_and_weight_shape('nncf_module.linear', onnx_model_proto, [64, 1568], [64])
+
     # Check that conv3 was pruned by input filters
-    check_bias_and_weight_shape('nncf_module.conv3', onnx_model_proto, [1, 32, 5, 5], [1])
+    check_bias_and_weight_shape('nncf_module.conv3', onnx_model_proto, [1, 64, 1, 1], [1])
 
 
 @pytest.mark.parametrize(('prune_first', 'ref_shapes'),
@@ -63,6 +66,7 @@ def test_pruning_export_concat_model(tmp_path, prune_first, ref_shapes):
     model = PruningTestModelConcat()
     nncf_config = get_basic_pruning_config(input_sample_size=[1, 1, 8, 8])
     nncf_config['compression']['algorithm'] = 'filter_pruning'
+    nncf_config['compression']['params']['shrink_model_on_export'] = True
 
     nncf_config['compression']['params']['prune_first_conv'] = prune_first
     nncf_config['compression']['pruning_init'] = 0.5
@@ -83,6 +87,7 @@ def test_pruning_export_eltwise_model(tmp_path, prune_first, ref_shapes):
     model = PruningTestModelEltwise()
     nncf_config = get_basic_pruning_config(input_sample_size=[1, 1, 8, 8])
     nncf_config['compression']['algorithm'] = 'filter_pruning'
+    nncf_config['compression']['params']['shrink_model_on_export'] = True
 
     nncf_config['compression']['params']['prune_first_conv'] = prune_first
     nncf_config['compression']['pruning_init'] = 0.5
@@ -102,6 +107,7 @@ def test_pruning_export_diffconvs_model(tmp_path, prune_first, ref_shapes):
     model = DiffConvsModel()
     nncf_config = get_basic_pruning_config(input_sample_size=[1, 1, 8, 8])
     nncf_config['compression']['algorithm'] = 'filter_pruning'
+    nncf_config['compression']['params']['shrink_model_on_export'] = True
 
     nncf_config['compression']['params']['prune_first_conv'] = prune_first
     nncf_config['compression']['pruning_init'] = 0.5
@@ -116,6 +122,7 @@ def test_pruning_export_groupnorm_model(tmp_path):
     model = GroupNormModel()
     nncf_config = get_basic_pruning_config(input_sample_size=[1, 1, 8, 8])
     nncf_config['compression']['algorithm'] = 'filter_pruning'
+    nncf_config['compression']['params']['shrink_model_on_export'] = True
 
     nncf_config['compression']['params']['prune_first_conv'] = True
     nncf_config['compression']['pruning_init'] = 0.5
@@ -124,3 +131,25 @@ def test_pruning_export_groupnorm_model(tmp_path):
 
     check_bias_and_weight_shape("nncf_module.conv1", onnx_model_proto, [8, 1, 1, 1], [8])
     check_bias_and_weight_shape("nncf_module.conv2", onnx_model_proto, [16, 8, 1, 1], [16])
+
+
+def test_shrunk_model_gives_same_outputs_as_masked_one():
+    nncf_config = get_basic_pruning_config(input_sample_size=[1, 1, 8, 8])
+    nncf_config['compression']['algorithm'] = 'filter_pruning'
+    nncf_config['compression']['params']['shrink_model_on_export'] = True
+    nncf_config['compression']['pruning_init'] = 0.5
+    compressed_model, compression_ctrl = create_compressed_model_and_algo_for_test(BigPruningTestModel(),
+                                                                                 nncf_config)
+    compressed_model.eval()
+    input_ = torch.randn(1, 1, 8, 8)
+    ref_output = compressed_model(input_)
+
+    compression_ctrl.prepare_for_export()
+
+    assert compressed_model.get_nncf_wrapped_model().linear.weight.shape == (64, 1568)
+    assert torch.allclose(compressed_model(input_), ref_output, atol=1e-5)
+    stats = compression_ctrl.export_statistics
+    assert stats.shrunk_flops < stats.full_flops
+    assert stats.shrunk_params < stats.full_params
+    with pytest.raises(RuntimeError):
+        compression_ctrl.set_pruning_level(0.3)
@@ -259,6 +259,42 @@ def test_load_state_sets_initialized_flag():
         assert not aq_info.quantizer_module_ref.initialized
 
 
+@pytest.mark.parametrize('mode', [QuantizationMode.SYMMETRIC, QuantizationMode.ASYMMETRIC])
+def test_quantized_weights_are_cached_in_eval_mode(mode):
+    # pylint: disable=protected-access
+    qspec = PTQuantizerSpec(num_bits=8, mode=mode, signedness_to_force=True, narrow_range=False, half_range=False,
+                            scale_shape=(1,), logarithm_scale=False)
+    quantizer = QUANTIZATION_MODULES.get(mode)(qspec)
+    weight = nn.Parameter(torch.linspace(-1, 1, 32))
+
+    quantizer.eval()
+    with torch.no_grad():
+        ref_output = quantizer(weight)
+        assert quantizer._quantized_weight_cache is not None
+        assert quantizer(weight) is ref_output
+
+        # In-place weight update invalidates the cached quantized weight
+        weight.mul_(0.5)
+        output = quantizer(weight)
+        assert not torch.equal(output, ref_output)
+
+        quantizer.num_bits = 4
+        output_4bit = quantizer(weight)
+        assert not torch.equal(output_4bit, output)
+        quantizer._reset_quantized_weight_cache()
+        assert torch.equal(quantizer(weight), output_4bit)
+
+        # Activations are not cached
+        quantizer._reset_quantized_weight_cache()
+        quantizer(weight.detach())
+        assert quantizer._quantized_weight_cache is None
+
+    quantizer.train()
+    assert quantizer._quantized_weight_cache is None
+    quantizer(weight)
+    assert quantizer._quantized_weight_cache is None
+
+
 def test_quantizers_have_proper_narrow_range_set():
     class Model(nn.Module):
         def __init__(self, size=1):
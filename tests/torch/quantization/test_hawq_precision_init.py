@@ -10,11 +10,13 @@
  See the License for the specific language governing permissions and
  limitations under the License.
 """
+import hashlib
 import itertools
 import json
 import os
 from collections import OrderedDict
 from collections import namedtuple
+from copy import deepcopy
 from functools import partial
 from pathlib import Path
 from typing import Callable, Dict, List, NamedTuple
@@ -51,6 +53,7 @@ from nncf.torch.quantization.layers import QuantizerConfig
 from nncf.torch.quantization.layers import QuantizersSwitcher
 from nncf.torch.quantization.precision_init.bitwidth_graph import BitwidthGraph
 from nncf.torch.quantization.precision_init.compression_ratio import CompressionRatioCalculator
+from nncf.torch.quantization.precision_init import hawq_cache
 from nncf.torch.quantization.precision_init.hawq_debug import HAWQDebugger
 from nncf.torch.quantization.precision_init.hawq_init import BitwidthAssignmentMode
 from nncf.torch.quantization.precision_init.hawq_init import HAWQPrecisionInitializer
@@ -485,6 +488,98 @@ def test_hawq_on_single_conv_without_quantizers(_seed, dataset_dir, tmp_path, pa
     assert math.isclose(actual_state.item(), ref_trace, rel_tol=rtol)
 
 
+def test_hutchinson_probes_are_evaluated_on_single_gradients_graph(mocker):
+    model = nn.Sequential(nn.Conv2d(1, 2, 3), nn.ReLU(), nn.Flatten(), nn.Linear(2 * 4 * 4, 3))
+    dataset = torch.utils.data.TensorDataset(torch.rand(8, 1, 6, 6), torch.randint(0, 3, (8,)))
+    data_loader = torch.utils.data.DataLoader(dataset, batch_size=4)
+    criterion = nn.CrossEntropyLoss()
+    ph_import = 'nncf.torch.quantization.hessian_trace.ParameterHandler'
+    sample_rademacher_patch = mocker.patch(f'{ph_import}.sample_rademacher_like_params', autospec=True)
+    sample_normal_patch = mocker.patch(f'{ph_import}.sample_normal_like_params', autospec=True)
+
+    def get_average_traces(num_probes, max_iter):
+        generator = torch.Generator().manual_seed(0)
+
+        def mock_sampling_fn(self):
+            return [torch.rand(p.shape, generator=generator) - 0.5 for p in self.parameters]
+
+        sample_rademacher_patch.side_effect = mock_sampling_fn
+        sample_normal_patch.side_effect = mock_sampling_fn
+        forward_spy = mocker.spy(model, 'forward')
+        trace_estimator = HessianTraceEstimator(model, default_criterion_fn, criterion, 'cpu', data_loader,
+                                                num_data_points=8, num_probes=num_probes)
+        avg_traces = trace_estimator.get_average_traces(max_iter=max_iter, tolerance=0)
+        num_forward_calls = forward_spy.call_count
+        mocker.stop(forward_spy)
+        return avg_traces, num_forward_calls
+
+    ref_traces, ref_num_forward_calls = get_average_traces(num_probes=1, max_iter=2)
+    traces, num_forward_calls = get_average_traces(num_probes=2, max_iter=1)
+
+    assert torch.allclose(traces, ref_traces, rtol=1e-5)
+    assert num_forward_calls == ref_num_forward_calls // 2
+
+
+def test_hawq_reuses_cached_traces_and_quantization_noise(mocker, tmp_path):
+    torch.manual_seed(0)
+    ref_model = nn.Sequential(create_conv(3, 4, 3), nn.ReLU(), create_conv(4, 4, 3), nn.ReLU(),
+                              create_conv(4, 2, 3), nn.AdaptiveAvgPool2d(1), nn.Flatten())
+    dataset = torch.utils.data.TensorDataset(torch.rand(20, 3, 10, 10), torch.randint(0, 2, (20,)))
+    data_loader = torch.utils.data.DataLoader(dataset, batch_size=10)
+    traces_spy = mocker.spy(HessianTraceEstimator, 'get_average_traces')
+    noise_spy = mocker.spy(HAWQPrecisionInitializer, 'calc_quantization_noise')
+
+    def run_hawq(bits, compression_ratio, range_init_type=None):
+        traces_spy.reset_mock()
+        noise_spy.reset_mock()
+        config = HAWQConfigBuilder(num_data_points=20).for_trial().build()
+        precision_config = config['compression']['initializer']['precision']
+        precision_config.update({'bits': bits, 'compression_ratio': compression_ratio, 'cache_dir': str(tmp_path)})
+        if range_init_type is not None:
+            config['compression']['initializer']['range']['type'] = range_init_type
+        config = register_default_init_args(config, data_loader, criterion=nn.CrossEntropyLoss(), device='cpu')
+        _, ctrl = create_compressed_model_and_algo_for_test(deepcopy(ref_model), config)
+        num_sequences = sum(len(call[0][1]) for call in noise_spy.call_args_list)
+        return [q.quantizer_module_ref.num_bits for q in ctrl.weight_quantizers.values()], traces_spy.call_count, \
+            num_sequences
+
+    ref_bits, num_traces_calls, ref_num_sequences = run_hawq([4, 8], 1.5)
+    assert num_traces_calls == 1
+    assert ref_num_sequences > 0
+
+    bits, num_traces_calls, num_sequences = run_hawq([4, 8], 1.5)
+    assert bits == ref_bits
+    assert num_traces_calls == 0
+    assert num_sequences == 0
+
+    _, num_traces_calls, num_sequences = run_hawq([2, 4, 8], 1.5)
+    assert num_traces_calls == 0
+    assert 0 < num_sequences
+
+    _, num_traces_calls, num_sequences = run_hawq([2, 4, 8], 2)
+    assert num_traces_calls == 0
+    assert num_sequences == 0
+
+    # The quantization noise depends on the weight quantizer ranges, but the traces don't
+    _, num_traces_calls, num_sequences = run_hawq([2, 4, 8], 2, range_init_type='threesigma')
+    assert num_traces_calls == 0
+    assert 0 < num_sequences
+
+
+
+@pytest.mark.parametrize('dtype', [torch.float32, torch.bfloat16, torch.float16, torch.bool])
+def test_hawq_cache_hashes_tensors_of_any_dtype(dtype):
+    # pylint:disable=protected-access
+    def get_digest(tensor):
+        hasher = hashlib.sha256()
+        hawq_cache._update_with_tensor(hasher, tensor)
+        return hasher.hexdigest()
+
+    tensor = torch.arange(6).reshape(2, 3).to(dtype)
+    assert get_digest(tensor) == get_digest(tensor.t().contiguous().t())
+    assert get_digest(tensor) != get_digest(tensor.reshape(3, 2))
+    assert get_digest(torch.tensor(1).to(dtype)) != get_digest(torch.tensor(0).to(dtype))
+
 def get_size_of_search_space(m, L):
     def nCr(n, r):
         f = math.factorial
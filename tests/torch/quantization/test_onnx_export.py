@@ -100,6 +100,20 @@ def test_onnx_export_to_quantize_dequantize(tmp_path):
     assert num_other_nodes == 0
 
 
+def test_onnx_export_packed_weights(tmp_path):
+    model = TwoConvTestModel()
+    nncf_config = get_config_for_export_mode(should_be_onnx_standard=False)
+    nncf_config['compression']['export_packed_weights'] = True
+    onnx_model_proto = load_exported_onnx_version(nncf_config, model,
+                                                  path_to_storage_dir=tmp_path)
+    # pylint:disable=no-member
+    op_types = [node.op_type for node in onnx_model_proto.graph.node]
+    assert op_types.count('FakeQuantize') == 2
+    assert op_types.count('Cast') == 2
+    float_weights = [init for init in onnx_model_proto.graph.initializer if init.name.endswith('.weight')]
+    assert not float_weights
+
+
 INPUT_TENSOR_SHAPE = (2, 64, 15, 10)
 PER_CHANNEL_AQ_SCALE_SHAPE = (1, INPUT_TENSOR_SHAPE[1], 1, 1)
 
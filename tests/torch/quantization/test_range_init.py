@@ -42,6 +42,7 @@ from nncf.torch.checkpoint_loading import load_state
 from nncf.torch.initialization import DefaultInitializingDataLoader
 from nncf.torch.initialization import wrap_dataloader_for_init
 from nncf.torch.nncf_network import EXTERNAL_QUANTIZERS_STORAGE_NAME
+from nncf.torch.quantization.init_range import DataLoaderRangeInitializeRunner
 from nncf.torch.quantization.init_range import PTRangeInitParams
 from nncf.torch.quantization.init_range import PTRangeInitCollectorParams
 from nncf.torch.quantization.init_range import StatCollectorGenerator
@@ -49,6 +50,7 @@ from nncf.torch.quantization.layers import AsymmetricQuantizer
 from nncf.torch.quantization.layers import BaseQuantizer
 from nncf.torch.quantization.layers import PTQuantizerSpec
 from nncf.torch.quantization.layers import QUANTIZATION_MODULES
+from nncf.torch.quantization.layers import QuantizersSwitcher
 from nncf.torch.quantization.layers import SymmetricQuantizer
 from nncf.torch.tensor_statistics.collectors import PTMeanMinMaxStatisticCollector
 from nncf.torch.tensor_statistics.collectors import PTMedianMADStatisticCollector
@@ -696,7 +698,8 @@ def test_per_layer_range_init_collectors_are_called_the_required_number_of_times
            range_init_call_count_test_struct.expected_call_count_register_input['three_sigma']
 
 
-QUANTIZER_RANGE_INITIALIZERS = ["min_max", "threesigma", "mean_min_max", "percentile", "mixed_min_max"]
+QUANTIZER_RANGE_INITIALIZERS = ["min_max", "threesigma", "mean_min_max", "percentile", "mixed_min_max",
+                                "histogram_threesigma", "histogram_percentile"]
 
 
 class QuantizeRangeInitScaleShapeTestStruct:
@@ -810,3 +813,46 @@ class AbsTwosDataset:
 
     def __len__(self):
         return self._length
+
+
+class TwoQuantizersOfSameTensorModel(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.quantizers = nn.ModuleList(
+            [SymmetricQuantizer(PTQuantizerSpec(num_bits=num_bits,
+                                                mode=QuantizationMode.SYMMETRIC,
+                                                signedness_to_force=None,
+                                                narrow_range=False,
+                                                half_range=False,
+                                                scale_shape=(1,),
+                                                logarithm_scale=False)) for num_bits in [8, 4]])
+
+    def forward(self, x):
+        return self.quantizers[0](x) + self.quantizers[1](x)
+
+
+@pytest.mark.parametrize('share_observed_tensor', [True, False])
+def test_range_init_reduces_tensor_once_for_quantizers_observing_it(mocker, share_observed_tensor):
+    model = TwoQuantizersOfSameTensorModel()
+    init_config = RangeInitConfig(init_type='min_max', num_init_samples=2)
+    modules_to_init = {str(i): (quantizer, init_config, False, (1, 3, 4, 4))
+                       for i, quantizer in enumerate(model.quantizers)}
+    observed_tensor_keys = {'0': 'x', '1': 'x'} if share_observed_tensor else None
+    data_loader = DataLoader(torch.utils.data.TensorDataset(torch.arange(-48., 48.).view(2, 3, 4, 4),
+                                                            torch.zeros(2)),
+                             batch_size=1)
+    amin_spy = mocker.spy(torch, 'amin')
+    amax_spy = mocker.spy(torch, 'amax')
+
+    quantizers_switcher = QuantizersSwitcher(list(model.quantizers))
+    quantizers_switcher.disable_quantizers()
+    runner = DataLoaderRangeInitializeRunner(model, modules_to_init, init_device=None,
+                                             observed_tensor_keys=observed_tensor_keys)
+    runner.run(data_loader, num_init_steps=2)
+    quantizers_switcher.enable_quantizers()
+
+    num_reductions_per_batch = 1 if share_observed_tensor else 2
+    assert amin_spy.call_count == 2 * num_reductions_per_batch
+    assert amax_spy.call_count == 2 * num_reductions_per_batch
+    for quantizer in model.quantizers:
+        assert quantizer.scale.item() == approx(48.)
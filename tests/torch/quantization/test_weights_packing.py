@@ -0,0 +1,65 @@
+"""
+ Copyright (c) 2022 Intel Corporation
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+      http://www.apache.org/licenses/LICENSE-2.0
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+import pytest
+import torch
+
+from nncf.torch import load_packed_checkpoint
+from nncf.torch.quantization.weights_packing import PackedWeight
+from nncf.torch.quantization.weights_packing import pack_int4
+from nncf.torch.quantization.weights_packing import unpack_int4
+from tests.torch.helpers import TwoConvTestModel
+from tests.torch.helpers import create_compressed_model_and_algo_for_test
+from tests.torch.helpers import register_bn_adaptation_init_args
+from tests.torch.quantization.test_quantization_helpers import get_quantization_config_without_range_init
+
+
+@pytest.mark.parametrize('numel', [1, 2, 9])
+def test_int4_packing(numel):
+    codes = torch.randint(0, 16, (numel,), dtype=torch.uint8)
+    packed = pack_int4(codes)
+    assert packed.dtype == torch.uint8
+    assert packed.numel() == (numel + 1) // 2
+    assert torch.equal(unpack_int4(packed, numel), codes)
+
+
+@pytest.mark.parametrize('num_bits, mode, per_channel', [(8, 'symmetric', False),
+                                                         (8, 'asymmetric', True),
+                                                         (4, 'symmetric', True),
+                                                         (4, 'asymmetric', False)])
+def test_packed_checkpoint_gives_quantized_weights(tmp_path, num_bits, mode, per_channel):
+    config = get_quantization_config_without_range_init()
+    config['target_device'] = 'TRIAL'
+    config['compression']['weights'] = {'bits': num_bits, 'mode': mode, 'per_channel': per_channel}
+    register_bn_adaptation_init_args(config)
+    compressed_model, compression_ctrl = create_compressed_model_and_algo_for_test(TwoConvTestModel(), config)
+    checkpoint_path = str(tmp_path / 'packed.pth')
+
+    compression_ctrl.export_model(checkpoint_path, save_format='packed_checkpoint')
+
+    state_dict = load_packed_checkpoint(checkpoint_path)
+    model = TwoConvTestModel()
+    assert list(state_dict.keys()) == list(model.state_dict().keys())
+    packed_weights = {key: state_dict.get_lazy(key) for key in state_dict
+                      if isinstance(state_dict.get_lazy(key), PackedWeight)}
+    assert len(packed_weights) == 2
+    assert all(packed_weight.num_bits == num_bits for packed_weight in packed_weights.values())
+
+    model.load_state_dict(state_dict)
+    for weight_quantizer_info in compression_ctrl.weight_quantizers.values():
+        module = weight_quantizer_info.quantized_module
+        quantizer = weight_quantizer_info.quantizer_module_ref
+        ref_weight = quantizer.quantize(module.weight.detach())
+        module_name = next(name for name, m in compressed_model.get_nncf_wrapped_model().named_modules()
+                           if m is module)
+        weight = model.state_dict()[module_name + '.weight']
+        assert torch.allclose(weight, ref_weight, atol=1e-6)
@@ -286,3 +286,32 @@ def test_can_set_compression_rate_for_magnitude_sparse_algo():
     _, compression_ctrl = create_compressed_model_and_algo_for_test(MagnitudeTestModel(), config)
     compression_ctrl.compression_rate = 0.65
     assert pytest.approx(compression_ctrl.compression_rate, 1e-2) == 0.65
+
+
+def test_magnitude_algo_selected_threshold_is_updated_on_weights_change():
+    config = get_basic_magnitude_sparsity_config()
+    config['compression']['params'] = {'schedule': 'multistep', 'weight_importance': 'abs'}
+    sparse_model, compression_ctrl = create_compressed_model_and_algo_for_test(MagnitudeTestModel(), config)
+    threshold = compression_ctrl.statistics().magnitude_sparsity.thresholds[0].threshold
+    assert compression_ctrl.statistics().magnitude_sparsity.thresholds[0].threshold == threshold
+
+    with torch.no_grad():
+        sparse_model.conv1.weight.mul_(2)
+        sparse_model.conv2.weight.mul_(2)
+    assert compression_ctrl.statistics().magnitude_sparsity.thresholds[0].threshold == pytest.approx(2 * threshold)
+
+
+def test_magnitude_algo_masks_follow_weights_written_through_data():
+    config = get_basic_magnitude_sparsity_config()
+    config['compression']['params'] = {'schedule': 'multistep', 'weight_importance': 'abs'}
+    sparse_model, compression_ctrl = create_compressed_model_and_algo_for_test(MagnitudeTestModel(), config)
+    compression_ctrl.set_sparsity_level(0.5)
+    ref_masks = [minfo.operand.binary_mask.clone() for minfo in compression_ctrl.sparsified_module_info]
+
+    # The writes through .data do not change the version counter of the weights
+    sparse_model.conv1.weight.data.mul_(2)
+    sparse_model.conv2.weight.data.mul_(2)
+    compression_ctrl.set_sparsity_level(0.5)
+
+    for minfo, ref_mask in zip(compression_ctrl.sparsified_module_info, ref_masks):
+        assert torch.equal(minfo.operand.binary_mask, ref_mask)
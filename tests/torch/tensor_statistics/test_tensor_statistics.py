@@ -22,8 +22,10 @@ from nncf.common.tensor_statistics.collectors import TensorStatisticCollectorBas
     StatisticsNotCollectedError, OfflineTensorStatisticCollector
 from nncf.torch.tensor_statistics.collectors import PTMinMaxStatisticCollector, PTMixedMinMaxStatisticCollector, \
     PTMeanMinMaxStatisticCollector, PTMedianMADStatisticCollector, PTPercentileStatisticCollector, \
-    PTMeanPercentileStatisticCollector
+    PTMeanPercentileStatisticCollector, PTHistogramMedianMADStatisticCollector, \
+    PTHistogramPercentileStatisticCollector
 from nncf.torch.tensor_statistics.collectors import PTNNCFCollectorTensorProcessor
+from nncf.torch.tensor_statistics.collectors import PTCollectorsGroup
 from nncf.torch.tensor_statistics.statistics import PTMinMaxTensorStatistic, \
     PTMedianMADTensorStatistic, PTPercentileTensorStatistic
 from nncf.torch.tensor import PTNNCFTensor
@@ -211,7 +213,9 @@ class TestCollectedStatistics:
                 output_shape=(1,)),
         PTMedianMADStatisticCollector,
         partial(PTPercentileStatisticCollector, percentiles_to_collect=[10.0]),
-        partial(PTMeanPercentileStatisticCollector, percentiles_to_collect=[10.0])]
+        partial(PTMeanPercentileStatisticCollector, percentiles_to_collect=[10.0]),
+        PTHistogramMedianMADStatisticCollector,
+        partial(PTHistogramPercentileStatisticCollector, percentiles_to_collect=[10.0])]
 
     @pytest.fixture(params=COLLECTORS)
     def collector_for_interface_test(self, request):
@@ -259,6 +263,8 @@ class TestCollectedStatistics:
         PTMedianMADStatisticCollector,
         partial(PTPercentileStatisticCollector, percentiles_to_collect=[10.0]),
         partial(PTMeanPercentileStatisticCollector, percentiles_to_collect=[10.0]),
+        PTHistogramMedianMADStatisticCollector,
+        partial(PTHistogramPercentileStatisticCollector, percentiles_to_collect=[10.0]),
     ]
 
     REF_NUM_SAMPLES = 3
@@ -273,6 +279,62 @@ class TestCollectedStatistics:
             collector_for_num_samples_test.register_input(input_)
         assert collector_for_num_samples_test.collected_samples() == TestCollectedStatistics.REF_NUM_SAMPLES
 
+    @pytest.mark.parametrize('reduction_shape', [(1,), (1, 4, 1, 1)])
+    def test_histogram_collectors_match_exact_collectors(self, reduction_shape: ReductionShape):
+        exact_percentile_collector = PTPercentileStatisticCollector([1.0, 99.0], reduction_shape)
+        histogram_percentile_collector = PTHistogramPercentileStatisticCollector([1.0, 99.0], reduction_shape)
+        exact_median_mad_collector = PTMedianMADStatisticCollector(reduction_shape)
+        histogram_median_mad_collector = PTHistogramMedianMADStatisticCollector(reduction_shape)
+        collectors = [exact_percentile_collector, histogram_percentile_collector,
+                      exact_median_mad_collector, histogram_median_mad_collector]
+
+        torch.manual_seed(0)
+        for i in range(5):
+            # Each input extends the value range, so that the histograms have to be re-binned
+            input_ = torch.randn([8, 4, 16, 16]) * (i + 1) + i
+            for collector in collectors:
+                collector.register_input(input_)
+
+        exact_stat = exact_percentile_collector.get_statistics()
+        histogram_stat = histogram_percentile_collector.get_statistics()
+        for pct, ref_values in exact_stat.percentile_vs_values_dict.items():
+            assert torch.allclose(histogram_stat.percentile_vs_values_dict[pct], ref_values, atol=0.1)
+
+        exact_stat = exact_median_mad_collector.get_statistics()
+        histogram_stat = histogram_median_mad_collector.get_statistics()
+        assert torch.allclose(histogram_stat.median_values, exact_stat.median_values, atol=0.1)
+        assert torch.allclose(histogram_stat.mad_values, exact_stat.mad_values, atol=0.1)
+
+
+    def test_collectors_group_matches_separate_collectors(self):
+        def create_collectors():
+            return [PTMinMaxStatisticCollector(use_abs_max=False, reduction_shape=(0, 2, 3),
+                                               output_shape=(1, 4, 1, 1)),
+                    PTMinMaxStatisticCollector(use_abs_max=True, reduction_shape=(0, 2, 3),
+                                               output_shape=(1, 4, 1, 1)),
+                    PTMinMaxStatisticCollector(use_abs_max=True, reduction_shape=(0, 1, 2, 3), output_shape=(1,)),
+                    PTMeanMinMaxStatisticCollector(use_per_sample_stats=False, use_abs_max=False,
+                                                   reduction_shape=(0, 1, 2, 3), output_shape=(1,)),
+                    PTMixedMinMaxStatisticCollector(use_per_sample_stats=True, use_abs_max=True,
+                                                    use_means_of_mins=True, use_means_of_maxs=False,
+                                                    reduction_shape=(1, 2, 3), output_shape=(1,))]
+        separate_collectors = create_collectors()
+        grouped_collectors = create_collectors()
+        collectors_group = PTCollectorsGroup(grouped_collectors)
+
+        torch.manual_seed(0)
+        for _ in range(3):
+            input_ = torch.randn([2, 4, 8, 8])
+            for collector in separate_collectors:
+                collector.register_input(input_)
+            assert collectors_group.register_input(input_) is input_
+
+        for separate_collector, grouped_collector in zip(separate_collectors, grouped_collectors):
+            ref_stat = separate_collector.get_statistics()
+            stat = grouped_collector.get_statistics()
+            assert torch.equal(stat.min_values, ref_stat.min_values)
+            assert torch.equal(stat.max_values, ref_stat.max_values)
+
 
 class TestCollectorTensorProcessor:
     tensor_processor = PTNNCFCollectorTensorProcessor()
@@ -0,0 +1,72 @@
+"""
+ Copyright (c) 2022 Intel Corporation
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+      http://www.apache.org/licenses/LICENSE-2.0
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+import subprocess
+import sys
+import types
+
+import pytest
+
+from nncf.torch.algo_selector import LazyAlgorithmsRegistry
+from nncf.torch.algo_selector import PT_COMPRESSION_ALGORITHM_MODULES
+
+FAKE_ALGO_MODULE_SOURCE = """
+from fake_algos_registry import REGISTRY
+
+
+@REGISTRY.register('{name}')
+class FakeAlgoBuilder:
+    pass
+"""
+
+
+@pytest.fixture(name='lazy_registry')
+def lazy_registry_(tmp_path, monkeypatch):
+    registry = LazyAlgorithmsRegistry('fake algorithm', {'fake_algo_a': 'fake_algo_a',
+                                                         'fake_algo_b': 'fake_algo_b'})
+    monkeypatch.setitem(sys.modules, 'fake_algos_registry', types.SimpleNamespace(REGISTRY=registry))
+    for name in ['fake_algo_a', 'fake_algo_b']:
+        (tmp_path / '{}.py'.format(name)).write_text(FAKE_ALGO_MODULE_SOURCE.format(name=name))
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield registry
+    for name in ['fake_algo_a', 'fake_algo_b']:
+        sys.modules.pop(name, None)
+
+
+def test_lazy_registry_imports_algorithm_module_on_get(lazy_registry):
+    assert 'fake_algo_a' not in sys.modules
+
+    builder_cls = lazy_registry.get('fake_algo_a')
+
+    assert builder_cls.__module__ == 'fake_algo_a'
+    assert 'fake_algo_a' in sys.modules
+    assert 'fake_algo_b' not in sys.modules
+    assert lazy_registry.get('fake_algo_a') is builder_cls
+
+
+def test_lazy_registry_imports_all_algorithm_modules_on_listing(lazy_registry):
+    assert set(lazy_registry.registry_dict) == {'fake_algo_a', 'fake_algo_b'}
+    assert sys.modules['fake_algo_b'].FakeAlgoBuilder in lazy_registry
+
+
+def test_lazy_registry_raises_for_unknown_algorithm(lazy_registry):
+    with pytest.raises(KeyError):
+        lazy_registry.get('unknown_algo')
+
+
+def test_importing_nncf_does_not_import_algorithms():
+    check_code = ('import sys; import nncf.torch; '
+                  'print(*[module for module in {} if module in sys.modules])'.format(
+                      sorted(PT_COMPRESSION_ALGORITHM_MODULES.values())))
+    output = subprocess.check_output([sys.executable, '-c', check_code], universal_newlines=True)
+    assert output.strip() == ''
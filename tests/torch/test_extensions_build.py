@@ -6,6 +6,11 @@ import shutil
 
 import torch
 
+from nncf.torch.extensions import ExtensionLoader
+from nncf.torch.extensions import ExtensionsType
+from nncf.torch.extensions import LazyExtension
+from nncf.torch.extensions import get_build_directory
+from nncf.torch.extensions import load_extension
 from tests.common.helpers import TEST_ROOT
 from tests.torch.helpers import Command
 
@@ -87,3 +92,68 @@ def test_force_cuda_build(tmp_venv_with_nncf, install_type, tmp_path, package_ty
     assert cuda_ext_dir.exists()
     cuda_ext_so = (cuda_ext_dir / 'binarized_functions_cuda.so')
     assert cuda_ext_so.exists()
+
+
+class FailingExtensionLoader(ExtensionLoader):
+    load_calls = 0
+
+    @staticmethod
+    def extension_type():
+        return ExtensionsType.CPU
+
+    @staticmethod
+    def load():
+        FailingExtensionLoader.load_calls += 1
+        raise RuntimeError('Error building extension')
+
+    @staticmethod
+    def fallback():
+        return torch
+
+
+def test_lazy_extension_uses_fallback_on_build_failure():
+    FailingExtensionLoader.load_calls = 0
+    extension = LazyExtension(FailingExtensionLoader)
+    assert FailingExtensionLoader.load_calls == 0
+
+    assert extension.zeros_like is torch.zeros_like
+    assert extension.ones_like is torch.ones_like
+    assert FailingExtensionLoader.load_calls == 1
+
+
+def test_build_directory_is_keyed_by_versions(tmp_path, monkeypatch):
+    monkeypatch.delenv('TORCH_EXTENSIONS_DIR', raising=False)
+    monkeypatch.setenv('NNCF_EXTENSIONS_DIR', str(tmp_path))
+    build_dir = pathlib.Path(get_build_directory('quantized_functions_cpu'))
+    assert build_dir.exists()
+    assert build_dir.name == 'quantized_functions_cpu'
+    assert build_dir.parent.parent == tmp_path
+    assert torch.__version__.split('+')[0] in build_dir.parent.name
+
+    monkeypatch.setenv('TORCH_EXTENSIONS_DIR', str(tmp_path))
+    assert get_build_directory('quantized_functions_cpu') is None
+
+
+def test_lazy_extension_uses_fallback_if_compiler_is_missing(tmp_path, monkeypatch):
+    monkeypatch.delenv('TORCH_EXTENSIONS_DIR', raising=False)
+    monkeypatch.setenv('NNCF_EXTENSIONS_DIR', str(tmp_path))
+    monkeypatch.setenv('CXX', str(tmp_path / 'missing_compiler'))
+    source = tmp_path / 'test_extension.cpp'
+    source.write_text('#include <torch/extension.h>\n'
+                      'PYBIND11_MODULE(TORCH_EXTENSION_NAME, m) {}\n')
+
+    class MissingCompilerExtensionLoader(ExtensionLoader):
+        @staticmethod
+        def extension_type():
+            return ExtensionsType.CPU
+
+        @staticmethod
+        def load():
+            return load_extension('nncf_test_missing_compiler_extension', [str(source)])
+
+        @staticmethod
+        def fallback():
+            return torch
+
+    extension = LazyExtension(MissingCompilerExtensionLoader)
+    assert extension.zeros_like is torch.zeros_like
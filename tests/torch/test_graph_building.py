@@ -34,6 +34,9 @@ from nncf.torch.dynamic_graph.graph_tracer import create_dummy_forward_fn
 from nncf.torch.dynamic_graph.context import get_current_context
 from nncf.torch.dynamic_graph.context import no_nncf_trace
 from nncf.torch.dynamic_graph.context import TracingContext
+from nncf.torch.dynamic_graph.op_input_processing import OperatorInput
+from nncf.torch.dynamic_graph.operation_address import OperationAddress
+from nncf.torch.dynamic_graph.scope import Scope
 from nncf.torch.graph.graph_builder import GraphBuilder
 from nncf.torch.graph.operator_metatypes import PTCatMetatype
 from nncf.torch.graph.operator_metatypes import PTReshapeMetatype
@@ -575,3 +578,41 @@ def test_scope_and_call_counters_are_reset_on_exceptions():
     assert not ctx.relative_scopes_stack
     #pylint:disable=protected-access
     assert not ctx._threading.thread_local.operator_counters
+
+
+def test_pre_hooks_are_executed_in_input_port_order_for_matching_op_only():
+    ctx = TracingContext()
+    op_address = OperationAddress('cat', Scope.from_str('Model/Inner[inner]'), 0)
+    other_op_address = OperationAddress('cat', Scope.from_str('Model/Inner[inner]'), 1)
+
+    ctx.register_pre_hooks([lambda x: x + 10], op_address, input_port_id=1)
+    ctx.register_pre_hooks([lambda x: x * 2, lambda x: x + 1], op_address, input_port_id=0)
+    ctx.register_pre_hooks([lambda x: x * 100], other_op_address, input_port_id=0)
+    with pytest.raises(KeyError):
+        ctx.register_pre_hooks([lambda x: x], op_address, input_port_id=0)
+
+    with ctx:
+        op_inputs = ctx.execute_pre_hooks(op_address, OperatorInput([1, 1], {}))
+    assert list(op_inputs.op_args) == [3, 11]
+
+
+def test_operator_call_counters_are_reset_in_nested_scopes():
+    ctx = TracingContext()
+    model = nn.Sequential(nn.Sequential(nn.ReLU()), nn.ReLU())
+    with ctx:
+        ctx.push_scope(model)
+        ctx.push_scope(model[0])
+        ctx.push_scope(model[0][0])
+        for call_order in range(2):
+            op_address = ctx.get_caller_context('relu')
+            assert op_address.call_order == call_order
+            ctx.register_operator_call(op_address.operator_name, op_address.scope_in_model)
+        ctx.pop_scope()
+        ctx.pop_scope()
+        ctx.push_scope(model[1])
+        ctx.register_operator_call('relu', ctx.scope)
+        ctx.pop_scope()
+
+        ctx.reset_operator_call_count_in_scope(Scope.from_str('Sequential/Sequential[0]'))
+        assert ctx.get_operator_call_count_in_scope('relu', Scope.from_str('Sequential/Sequential[0]/ReLU[0]')) == 0
+        assert ctx.get_operator_call_count_in_scope('relu', Scope.from_str('Sequential/ReLU[1]')) == 1
@@ -18,9 +18,13 @@ import torch
 
 from examples.torch.common.model_loader import load_model
 from nncf.torch.checkpoint_loading import KeyMatcher
+from nncf.torch.checkpoint_loading import LazyStateDict
+from nncf.torch.checkpoint_loading import LazyTensor
 from nncf.torch.checkpoint_loading import OPTIONAL_PARAMETERS_REGISTRY
 from nncf.torch.checkpoint_loading import ProcessedKeyStatus
 from nncf.torch.checkpoint_loading import ProcessedKeys
+from nncf.torch.checkpoint_loading import _load_checkpoint_lazily
+from nncf.torch.checkpoint_loading import load_checkpoint
 from nncf.torch.checkpoint_loading import load_state
 from nncf.torch.dynamic_graph.transform_graph import replace_modules_by_nncf_modules
 from nncf.torch.layers import NNCF_PADDING_VALUE_ATTR_NAME
@@ -97,6 +101,68 @@ def test_load_state_skips_not_matched_params__from_smaller_to_larger():
     PTTensorListComparator.check_equal(act_weights, ref_weights)
 
 
+def test_can_load_checkpoint_lazily(tmp_path):
+    checkpoint_path = str(tmp_path / 'checkpoint.pth')
+    model_save = BasicConvTestModel(weight_init=2, bias_init=3)
+    model_save, _ = replace_modules_by_nncf_modules(model_save)
+    torch.save({'state_dict': model_save.state_dict(), 'epoch': 1}, checkpoint_path)
+
+    # pylint: disable=protected-access
+    checkpoint = _load_checkpoint_lazily(checkpoint_path)
+    state_dict = checkpoint['state_dict']
+    assert checkpoint['epoch'] == 1
+    assert isinstance(state_dict, LazyStateDict)
+    assert all(isinstance(state_dict.get_lazy(key), LazyTensor) for key in state_dict)
+    assert state_dict._metadata == model_save.state_dict()._metadata
+
+    model_load = BasicConvTestModel()
+    model_load, _ = replace_modules_by_nncf_modules(model_load)
+    num_loaded = load_state(model_load, state_dict, is_resume=True)
+
+    assert num_loaded == len(model_save.state_dict())
+    for key, value in model_save.state_dict().items():
+        PTTensorListComparator.check_equal(model_load.state_dict()[key], value)
+
+
+
+def test_can_load_views_of_shared_storage_lazily(tmp_path):
+    checkpoint_path = str(tmp_path / 'checkpoint.pth')
+    base = torch.arange(24, dtype=torch.bfloat16)
+    state_dict = {'base': base,
+                  'transposed': base[4:].view(4, 5).t(),
+                  'strided': base[1::3],
+                  'mask': torch.tensor([True, False, True]),
+                  'empty': torch.zeros([0, 3])}
+    torch.save(state_dict, checkpoint_path)
+
+    # pylint: disable=protected-access
+    loaded = _load_checkpoint_lazily(checkpoint_path)
+    assert isinstance(loaded, LazyStateDict)
+    for key, value in state_dict.items():
+        loaded_value = loaded[key]
+        assert loaded_value.dtype == value.dtype
+        assert loaded_value.stride() == value.stride()
+        assert loaded_value.storage_offset() == value.storage_offset()
+        assert torch.equal(loaded_value, value)
+
+
+@pytest.mark.parametrize('supports_mmap', [False, True], ids=['lazy', 'mmap'])
+def test_load_checkpoint_falls_back_to_torch_load_for_legacy_format(tmp_path, mocker, supports_mmap):
+    mocker.patch('nncf.torch.checkpoint_loading._TORCH_LOAD_SUPPORTS_MMAP', supports_mmap)
+    lazy_loading_spy = mocker.patch('nncf.torch.checkpoint_loading._load_checkpoint_lazily')
+    checkpoint_path = str(tmp_path / 'checkpoint.pth')
+    model_save = BasicConvTestModel(weight_init=2, bias_init=3)
+    torch.save({'state_dict': model_save.state_dict(), 'epoch': 1}, checkpoint_path,
+               _use_new_zipfile_serialization=False)
+
+    checkpoint = load_checkpoint(checkpoint_path)
+
+    assert not lazy_loading_spy.called
+    assert checkpoint['epoch'] == 1
+    for key, value in model_save.state_dict().items():
+        PTTensorListComparator.check_equal(checkpoint['state_dict'][key], value)
+
+
 class MatchKeyDesc:
     MOCKED_VALUE = torch.zeros([1])
 
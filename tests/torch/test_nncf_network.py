@@ -952,3 +952,61 @@ def test_deepcopy_nncf_network():
     register_bn_adaptation_init_args(config)
     sparse_quantized_model, _ = create_compressed_model_and_algo_for_test(model, config)
     _ = deepcopy(sparse_quantized_model)
+
+
+class ModelWithControlFlow(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv = nn.Conv2d(1, 1, 1, 1)
+        self.use_extra_branch = False
+
+    def forward(self, x):
+        x = self.conv(x)
+        if self.use_extra_branch:
+            x = torch.sigmoid(x)
+        return torch.relu(x)
+
+
+def test_frozen_graph_mode(mocker):
+    nncf_model = NNCFNetwork(ModelWithControlFlow(), input_infos=[ModelInputInfo([1, 1, 4, 4])])
+    nncf_model.rebuild_graph()
+
+    hook_calls = Counter()
+
+    def pre_hook(x):
+        hook_calls['pre'] += 1
+        return x * 2
+
+    def post_hook(x):
+        hook_calls['post'] += 1
+        return x + 1
+
+    relu_address = OperationAddress.from_str('ModelWithControlFlow/relu_0')
+    nncf_model.insert_at_point(PTInsertionPoint(TargetType.OPERATOR_PRE_HOOK, relu_address, input_port_id=0),
+                               [pre_hook])
+    nncf_model.insert_at_point(PTInsertionPoint(TargetType.OPERATOR_POST_HOOK, relu_address), [post_hook])
+
+    input_ = torch.ones([1, 1, 4, 4])
+    ref_output = nncf_model(input_)
+
+    nncf_model.enable_frozen_graph_mode()
+    assert nncf_model.is_frozen_graph_mode_enabled()
+    caller_context_spy = mocker.spy(nncf_model.get_tracing_context(), 'get_caller_context')
+    assert torch.equal(nncf_model(input_), ref_output)
+    assert hook_calls == {'pre': 2, 'post': 2}
+    # The addresses of the traced operations are taken from the frozen graph, only the operations
+    # inside the hooks are not present in it
+    traced_op_names = {call.args[0] for call in caller_context_spy.call_args_list}
+    assert traced_op_names == {'__mul__', '__add__'}
+
+    # An operation that was not traced during graph building is executed via the regular tracing path
+    nncf_model.get_nncf_wrapped_model().use_extra_branch = True
+    _ = nncf_model(input_)
+    assert hook_calls == {'pre': 3, 'post': 3}
+    assert 'sigmoid' in {call.args[0] for call in caller_context_spy.call_args_list}
+
+    nncf_model.rebuild_graph()
+    assert nncf_model.is_frozen_graph_mode_enabled()
+
+    nncf_model.disable_frozen_graph_mode()
+    assert not nncf_model.is_frozen_graph_mode_enabled()
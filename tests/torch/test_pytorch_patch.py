@@ -1,8 +1,12 @@
 from collections import defaultdict
+import threading
 import torch
 from nncf.torch.dynamic_graph.patch_pytorch import MagicFunctionsToPatch
 from nncf.torch.graph.operator_metatypes import PT_OPERATOR_METATYPES
 from nncf.torch.dynamic_graph.context import TracingContext
+from nncf.torch.dynamic_graph.context import disable_scoped_tracing
+from nncf.torch.dynamic_graph.context import enable_scoped_tracing
+from nncf.torch.dynamic_graph.context import get_current_context
 from nncf.torch.dynamic_graph.trace_tensor import TracedTensor
 from nncf.torch.dynamic_graph.trace_tensor import TensorMeta
 
@@ -47,3 +51,45 @@ def test_tensor_printing_does_not_inflate_graph():
             str(tensor)
             tensor.__repr__()
     assert _ctx.graph.get_nodes_count() == 0
+
+
+def test_scoped_tracing_traces_only_threads_within_tracing_context():
+    def run_in_thread(fn):
+        errors = []
+
+        def target():
+            try:
+                fn()
+            except Exception as e:  # pylint:disable=broad-except
+                errors.append(e)
+
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+        if errors:
+            raise errors[0]
+
+    def relu_outside_context():
+        assert get_current_context() is None
+        torch.relu(torch.ones([1]))
+
+    def relu_within_context():
+        with ctx:
+            assert get_current_context() is ctx
+            torch.relu(torch.ones([1]))
+
+    patched_relu = torch.relu
+    ctx = TracingContext()
+    ctx.enable_trace_dynamic_graph()
+    enable_scoped_tracing()
+    try:
+        with ctx:
+            run_in_thread(relu_outside_context)
+            assert ctx.graph.get_nodes_count() == 0
+            run_in_thread(relu_within_context)
+            assert ctx.graph.get_nodes_count() == 1
+        assert get_current_context() is None
+    finally:
+        disable_scoped_tracing()
+    # The operators are not re-patched on entering and leaving the contexts
+    assert torch.relu is patched_relu
@@ -0,0 +1,89 @@
+"""
+ Copyright (c) 2022 Intel Corporation
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+      http://www.apache.org/licenses/LICENSE-2.0
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+import tempfile
+import time
+from copy import deepcopy
+
+import torch
+from torch import nn
+
+from nncf import NNCFConfig
+from nncf.torch import create_compressed_model
+
+TIME_SCALES = {'ms': 1000}
+WARMUP_RUNS = 10
+CPU_RUNS = 100
+INPUT_SIZE = [1, 3, 32, 32]
+
+
+class SmallConvNet(nn.Module):
+    def __init__(self, num_blocks=8, channels=16):
+        super().__init__()
+        self.stem = nn.Conv2d(3, channels, 3, padding=1)
+        self.blocks = nn.ModuleList([nn.Sequential(nn.Conv2d(channels, channels, 3, padding=1),
+                                                   nn.BatchNorm2d(channels),
+                                                   nn.ReLU()) for _ in range(num_blocks)])
+        self.fc = nn.Linear(channels, 10)
+
+    def forward(self, x):
+        x = self.stem(x)
+        for block in self.blocks:
+            x = x + block(x)
+        x = torch.flatten(torch.mean(x, dim=(2, 3)), 1)
+        return self.fc(x)
+
+
+def run_train_steps(model, input_, runs):
+    for _ in range(runs):
+        model.zero_grad()
+        model(input_).sum().backward()
+
+
+def measure_step_time(model, input_):
+    run_train_steps(model, input_, WARMUP_RUNS)
+    start = time.time()
+    run_train_steps(model, input_, CPU_RUNS)
+    elapsed = time.time() - start
+    return elapsed / CPU_RUNS
+
+
+def get_quantization_config(log_dir: str):
+    config = NNCFConfig()
+    config.update({
+        "log_dir": log_dir,
+        "input_info": {"sample_size": INPUT_SIZE},
+        "compression": {"algorithm": "quantization", "initializer": {"range": {"num_init_samples": 0},
+                                                                     "batchnorm_adaptation": {
+                                                                         "num_bn_adaptation_samples": 0}}}
+    })
+    return config
+
+
+if __name__ == '__main__':
+    input_ = torch.randn(INPUT_SIZE)
+    fp32_model = SmallConvNet()
+    with tempfile.TemporaryDirectory() as tmp_log_dir:
+        _, compressed_model = create_compressed_model(deepcopy(fp32_model), get_quantization_config(tmp_log_dir))
+
+    ctime, scale = list(TIME_SCALES.items())[0]
+    fp32_time = measure_step_time(fp32_model, input_)
+    print('Uncompressed model: {0:.3f} {1} per step'.format(fp32_time * scale, ctime))
+
+    for frozen in [False, True]:
+        if frozen:
+            compressed_model.enable_frozen_graph_mode()
+        else:
+            compressed_model.disable_frozen_graph_mode()
+        step_time = measure_step_time(compressed_model, input_)
+        print('Compressed model (frozen graph mode {0}): {1:.3f} {2} per step, overhead {3:.3f} {2}'.format(
+            'on' if frozen else 'off', step_time * scale, ctime, (step_time - fp32_time) * scale))
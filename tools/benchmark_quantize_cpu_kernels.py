@@ -0,0 +1,102 @@
+"""
+ Copyright (c) 2022 Intel Corporation
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+      http://www.apache.org/licenses/LICENSE-2.0
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+import math
+import time
+
+import torch
+
+from nncf.torch.quantization.extensions import QuantizedFunctionsCPU
+from nncf.torch.quantization.layers import get_per_channel_scale_shape
+from nncf.torch.utils import sum_like
+
+TIME_SCALES = {'ms': 1000}
+NBITS = 8
+WARMUP_RUNS = 10
+CPU_RUNS = 100
+INPUT_SIZES = [[2, 96, 112, 112], [256, 256, 3, 3]]
+
+
+# Composition of ATen operations which is equivalent to the unfused CPU kernels
+def reference_quantize_forward(input_, input_low, input_range, levels):
+    s = (levels - 1) / input_range
+    output = torch.max(torch.min(input_, input_low + input_range), input_low)
+    zero_point = (-input_low * s).round_()
+    output -= input_low
+    output *= s
+    output -= zero_point
+    return output.round_().div_(s)
+
+
+def reference_quantize_backward(grad_output, input_, input_low, input_range, levels, level_low, level_high):
+    output = reference_quantize_forward(input_, input_low, input_range, levels)
+    mask_hi = input_ > (input_low + input_range)
+    mask_lo = input_ < input_low
+    err = (output - input_) * (1 / input_range)
+    err = err.masked_fill_(mask_hi, 1).masked_fill_(mask_lo, level_low / level_high).mul_(grad_output)
+    grad_input_range = sum_like(err, input_range)
+    outside_mask = mask_hi | mask_lo
+    grad_input = grad_output.masked_fill(outside_mask, 0)
+    grad_input_low = sum_like(grad_output.masked_fill(~outside_mask, 0), input_low)
+    return grad_input, grad_input_low, grad_input_range
+
+
+def measure(fn, runs):
+    for _ in range(WARMUP_RUNS):
+        fn()
+    min_time = math.inf
+    total_time = 0
+    for _ in range(runs):
+        start = time.time()
+        fn()
+        elapsed = time.time() - start
+        min_time = min(min_time, elapsed)
+        total_time += elapsed
+    return min_time, total_time / runs
+
+
+def print_results(name, forward_times, backward_times):
+    ctime, scale = list(TIME_SCALES.items())[0]
+    print('{0}: Forward: min {1:.3f}{5} / avg {2:.3f}{5} | Backward: min {3:.3f}{5} / avg {4:.3f}{5}'.format(
+        name, forward_times[0] * scale, forward_times[1] * scale, backward_times[0] * scale,
+        backward_times[1] * scale, ctime))
+
+
+if __name__ == '__main__':
+    level_high = 2 ** (NBITS - 1) - 1
+    level_low = -(level_high + 1)
+    levels = 2 ** NBITS
+    for input_size in INPUT_SIZES:
+        input_ = torch.randn(input_size)
+        grad_output = torch.randn(input_size)
+        scale_shapes = [('per tensor', [1]),
+                        ('per weight channel', get_per_channel_scale_shape(input_size, is_weights=True)),
+                        ('per activation channel', get_per_channel_scale_shape(input_size, is_weights=False))]
+        print()
+        print('input size: {0}, threads: {1}'.format(input_size, torch.get_num_threads()))
+        print('------------------------------------------------')
+        for scale_name, scale_shape in scale_shapes:
+            input_low = -torch.rand(scale_shape) - 0.5
+            input_range = torch.rand(scale_shape) + 1.5
+            with torch.no_grad():
+                print_results(
+                    'ATen reference ({0})'.format(scale_name),
+                    measure(lambda: reference_quantize_forward(input_, input_low, input_range, levels), CPU_RUNS),
+                    measure(lambda: reference_quantize_backward(grad_output, input_, input_low, input_range, levels,
+                                                                level_low, level_high), CPU_RUNS))
+                print_results(
+                    'Fused kernels ({0})'.format(scale_name),
+                    measure(lambda: QuantizedFunctionsCPU.Quantize_forward(input_, input_low, input_range, levels),
+                            CPU_RUNS),
+                    measure(lambda: QuantizedFunctionsCPU.Quantize_backward(grad_output, input_, input_low,
+                                                                            input_range, levels, level_low,
+                                                                            level_high, True), CPU_RUNS))